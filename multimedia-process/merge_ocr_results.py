@@ -11,13 +11,21 @@ OCR 결과를 원본 네이버 블로그 CSV에 병합
 - pmi_ocr_results/naver_youtube_transcript_results.csv
 
 출력:
-- naver_blog_pm_v8_3_with_ocr.csv (병합 결과)
+- naver_blog_pm_v8_3_with_ocr.csv (병합 결과, Excel용)
+- naver_blog_pm_v8_3_with_ocr.parquet (병합 결과, 분석용 - pyarrow 설치 시)
 """
 
 import pandas as pd
 import json
+import sys
 from pathlib import Path
 
+# 공용 Parquet 저장소 (저장소 루트의 pmik_storage.py)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+import pmik_storage
+from pmik_ocr import OCR_OK_STATUSES, OCR_SKIPPED_STATUSES
+from pmik_warehouse import Warehouse
+
 # 파일 경로
 BASE_DIR = Path("/Users/kimble/Documents/IT/PMIK-sns-analysis")
 ORIGINAL_CSV = BASE_DIR / "multimedia-process" / "naver_blog_pm_v8_3_20251109_211033.csv"
@@ -30,6 +38,26 @@ VIDEO_FRAME_OCR = OCR_DIR / "naver_video_frame_ocr_results.csv"
 WHISPER_TRANSCRIPT = OCR_DIR / "naver_whisper_transcript_results.csv"
 YOUTUBE_TRANSCRIPT = OCR_DIR / "naver_youtube_transcript_results.csv"
 
+# 정상 처리로 보는 이미지 상태 (OCR 전 선별로 생략/중복 처리된 이미지 포함)
+IMAGE_OK_STATUSES = [*OCR_OK_STATUSES, *OCR_SKIPPED_STATUSES]
+
+def to_ocr_rows(df: pd.DataFrame, source: str, text_column: str) -> pd.DataFrame:
+    """OCR/자막 결과를 웨어하우스 ocr_results 형식으로 변환"""
+    rows = pd.DataFrame({
+        'source': source,
+        'post_id': df['post_id'] if 'post_id' in df else None,
+        'url': df['url'] if 'url' in df else None,
+        'video_id': df['video_id'] if 'video_id' in df else None,
+        'text': df[text_column],
+        'confidence': df['confidence'] if 'confidence' in df else None,
+        'language': df['language'] if 'language' in df else None,
+        'status': df['status'],
+    })
+    # URL이 없는 유튜브 Whisper 결과는 영상 주소를 키로 사용
+    youtube_urls = 'https://www.youtube.com/watch?v=' + rows['video_id'].astype(str)
+    rows['url'] = rows['url'].where(rows['url'].notna(), youtube_urls.where(rows['video_id'].notna()))
+    return rows[rows['url'].notna()]
+
 def main():
     print("=" * 80)
     print("OCR 결과 병합 시작")
@@ -50,7 +78,7 @@ def main():
     image_ocr_grouped = df_image_ocr.groupby('post_id').agg({
         'ocr_text': lambda x: ' | '.join([str(text) for text in x if pd.notna(text) and str(text).strip()]),
         'confidence': 'mean',
-        'status': lambda x: 'success' if all(x == 'success') else 'partial'
+        'status': lambda x: 'success' if all(x.isin(IMAGE_OK_STATUSES)) else 'partial'
     }).reset_index()
     
     image_ocr_grouped.columns = ['post_id', 'image_ocr_text', 'image_ocr_confidence', 'image_ocr_status']
@@ -158,6 +186,19 @@ def main():
     print("\n[저장] 병합 결과 저장 중...")
     df_merged.to_csv(OUTPUT_CSV, index=False, encoding='utf-8-sig')
     print(f"   저장 완료: {OUTPUT_CSV}")
+    if pmik_storage.write_table(df_merged, OUTPUT_CSV.with_suffix('.parquet'), 'naver_blog'):
+        print(f"   저장 완료: {OUTPUT_CSV.with_suffix('.parquet')}")
+    
+    # 웨어하우스 ocr_results에 원본 단위(이미지/영상별)로 upsert
+    with Warehouse() as warehouse:
+        for df, source, text_column in [
+            (df_image_ocr, 'image', 'ocr_text'),
+            (df_video_ocr, 'video_frame', 'frame_ocr_text'),
+            (df_youtube, 'youtube_transcript', 'transcript'),
+            (df_whisper, 'whisper', 'transcript'),
+        ]:
+            warehouse.upsert('ocr_results', to_ocr_rows(df, source, text_column))
+        print(f"   웨어하우스 반영: ocr_results {warehouse.count('ocr_results'):,}행")
     
     # 9. 통계 출력
     print("\n" + "=" * 80)
@@ -3,191 +3,195 @@
 """
 STEP 1: 크롤링 데이터에서 이미지/비디오 URL 추출 및 전처리
 - 중복 제거, 유효성 검사, CSV 저장
+- 행 단위 반복 대신 pandas 문자열 연산으로 한 번에 처리 (청크 단위 읽기)
+
+사용법:
+    python step1_extract_urls.py                                  # 기본 입력 파일
+    python step1_extract_urls.py results/naver_blog_pm_*.csv      # 여러 파일 / glob
 """
 
-import pandas as pd
-import re
-from urllib.parse import urlparse
-from typing import List, Set
+import argparse
+import glob
 import json
+import sys
+from pathlib import Path
+from typing import List
+
+import pandas as pd
+
+# 공용 Parquet 저장소 (저장소 루트의 pmik_storage.py)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+import pmik_storage
+from pmik_warehouse import Warehouse
+
+DEFAULT_INPUT = 'naver_blog_pm_v8_3_20251109_211033.csv'  # 파일명 수정 필요 시 여기 변경
+CHUNK_SIZE = 50_000
+
+# 제외할 이미지 (버튼, 애니메이션 아이콘, 아이콘, 스페이서, 기본 프로필) - 대소문자 무시
+IMAGE_EXCLUDE_PATTERN = r'(?i)btn_|img_ani_|icon_|ico_|spacer\.gif|img_profile_preset'
+
+# 흐린 썸네일 접미사 (?type=w80_blur에서 type만 잘린 URL) → 원본 URL
+BLUR_SUFFIX_PATTERN = r'_blur$'
+
+YOUTUBE_PATTERN = r'youtube\.com|youtu\.be'
+NAVER_VIDEO_PATTERN = r'mblogvideo'
+YOUTUBE_ID_PATTERN = r'(?:youtube\.com/watch\?v=|youtu\.be/|youtube\.com/embed/)([a-zA-Z0-9_-]{11})'
 
-def parse_url_string(url_string: str) -> List[str]:
+def explode_urls(df: pd.DataFrame, column: str) -> pd.DataFrame:
     """
-    쉼표로 구분된 URL 문자열을 리스트로 변환
+    쉼표로 구분된 URL 컬럼을 (post_id, url) 행으로 펼침
     """
-    if pd.isna(url_string) or url_string == '':
-        return []
-    
-    # 쉼표로 분리하고 공백 제거
-    urls = [url.strip() for url in str(url_string).split(',')]
-    return [url for url in urls if url and url.startswith('http')]
-
-def is_valid_image_url(url: str) -> bool:
+    urls = df[column].fillna('').astype(str).str.split(',')
+    exploded = pd.DataFrame({'post_id': df['post_id'], 'url': urls}).explode('url', ignore_index=True)
+    exploded['url'] = exploded['url'].str.strip()
+    return exploded[exploded['url'].str.startswith('http', na=False)]
+
+def valid_image_mask(urls: pd.Series) -> pd.Series:
     """
-    유효한 이미지 URL인지 확인
+    유효한 이미지 URL 여부
     - GIF 애니메이션 제외 (아이콘, 버튼 등)
     - 로그 URL 제외
     """
-    exclude_patterns = [
-        'btn_',           # 버튼 이미지
-        'img_ani_',       # 애니메이션 아이콘
-        'icon_',          # 아이콘
-        '/imgs/btn_',     # 버튼 경로
-        'spacer.gif',     # 스페이서
-    ]
-    
-    url_lower = url.lower()
-    return not any(pattern in url_lower for pattern in exclude_patterns)
-
-def categorize_video_url(url: str) -> str:
+    return ~urls.str.contains(IMAGE_EXCLUDE_PATTERN, regex=True)
+
+def categorize_video_urls(urls: pd.Series) -> pd.Series:
     """
-    비디오 URL 유형 구분
+    비디오 URL 유형 구분 (youtube / naver_blog / other)
     """
-    if 'youtube.com' in url or 'youtu.be' in url:
-        return 'youtube'
-    elif 'mblogvideo' in url:
-        return 'naver_blog'
-    else:
-        return 'other'
-
-def extract_youtube_video_id(url: str) -> str:
+    types = pd.Series('other', index=urls.index)
+    types[urls.str.contains(NAVER_VIDEO_PATTERN, regex=True)] = 'naver_blog'
+    types[urls.str.contains(YOUTUBE_PATTERN, regex=True)] = 'youtube'
+    return types
+
+def extract_image_urls(chunk: pd.DataFrame) -> pd.DataFrame:
+    images = explode_urls(chunk, 'image_urls')
+    images['url'] = images['url'].str.replace(BLUR_SUFFIX_PATTERN, '', regex=True)
+    images = images[valid_image_mask(images['url'])].drop_duplicates('url')
+    return images.assign(type='image')
+
+def extract_video_urls(chunk: pd.DataFrame) -> pd.DataFrame:
+    videos = explode_urls(chunk, 'video_urls')
+    videos = videos.assign(type=categorize_video_urls(videos['url']))
+    # 유튜브인 경우 video_id 추출 (ID를 찾지 못하면 빈 문자열)
+    video_ids = videos['url'].str.extract(YOUTUBE_ID_PATTERN, expand=False).fillna('')
+    videos['youtube_video_id'] = video_ids.where(videos['type'] == 'youtube')
+    return videos
+
+def resolve_inputs(patterns: List[str]) -> List[str]:
     """
-    유튜브 URL에서 비디오 ID 추출
+    파일 경로 또는 glob 패턴 → 입력 파일 목록 (순서 유지, 중복 제거)
     """
-    patterns = [
-        r'(?:youtube\.com\/watch\?v=|youtu\.be\/)([a-zA-Z0-9_-]{11})',
-        r'youtube\.com\/embed\/([a-zA-Z0-9_-]{11})',
-    ]
-    
+    files = []
     for pattern in patterns:
-        match = re.search(pattern, url)
-        if match:
-            return match.group(1)
-    return ''
+        files.extend(sorted(glob.glob(pattern)) or [pattern])
+    return list(dict.fromkeys(files))
 
 def main():
+    parser = argparse.ArgumentParser(description='크롤링 데이터에서 이미지/비디오 URL 추출')
+    parser.add_argument('inputs', nargs='*', default=[DEFAULT_INPUT],
+                        help='입력 CSV/Parquet 파일 또는 glob 패턴 (여러 개 가능)')
+    parser.add_argument('--chunksize', type=int, default=CHUNK_SIZE, help='한 번에 읽을 행 수')
+    args = parser.parse_args()
+
     print("="*70)
     print("STEP 1: URL 추출 및 전처리 시작")
     print("="*70)
-    
-    # CSV 파일 읽기
-    input_file = 'naver_blog_pm_v8_3_20251109_211033.csv'  # 파일명 수정 필요 시 여기 변경
-    print(f"\n📂 입력 파일: {input_file}")
-    
-    try:
-        df = pd.read_csv(input_file)
-        print(f"✅ 전체 포스트 수: {len(df)}")
-    except FileNotFoundError:
-        print(f"❌ 오류: {input_file} 파일을 찾을 수 없습니다.")
+
+    input_files = resolve_inputs(args.inputs)
+    missing = [path for path in input_files if not Path(path).exists()]
+    if missing:
+        for path in missing:
+            print(f"❌ 오류: {path} 파일을 찾을 수 없습니다.")
         print("   현재 디렉토리에 CSV 파일이 있는지 확인하세요.")
         return
-    
-    # 1. 이미지 URL 추출
+
+    # 1-2. 이미지/비디오 URL 추출 (URL 추출에 필요한 컬럼만, 청크 단위)
     print("\n" + "="*70)
-    print("📸 이미지 URL 처리 중...")
+    print("📸🎬 이미지/비디오 URL 처리 중...")
     print("="*70)
-    
-    all_image_urls: Set[str] = set()
-    image_data = []
-    
-    for idx, row in df.iterrows():
-        post_id = row['post_id']
-        urls = parse_url_string(row['image_urls'])
-        
-        # 유효한 이미지만 필터링
-        valid_urls = [url for url in urls if is_valid_image_url(url)]
-        
-        for url in valid_urls:
-            if url not in all_image_urls:
-                all_image_urls.add(url)
-                image_data.append({
-                    'post_id': post_id,
-                    'url': url,
-                    'type': 'image'
-                })
-    
-    print(f"✅ 고유 이미지 URL: {len(all_image_urls)}개")
+
+    total_posts = 0
+    image_frames = []
+    video_frames = []
+    seen_images = set()
+
+    for input_file in input_files:
+        print(f"\n📂 입력 파일: {input_file}")
+        for chunk in pmik_storage.iter_table_chunks(input_file, ['post_id', 'image_urls', 'video_urls'],
+                                                    args.chunksize):
+            total_posts += len(chunk)
+
+            # 이미지는 전체 입력에서 처음 나온 URL만 유지
+            images = extract_image_urls(chunk)
+            images = images[~images['url'].isin(seen_images)]
+            seen_images.update(images['url'])
+            image_frames.append(images)
+
+            video_frames.append(extract_video_urls(chunk))
+        print(f"   누적 포스트 수: {total_posts:,}")
+
+    image_df = pd.concat(image_frames, ignore_index=True)
+    video_df = pd.concat(video_frames, ignore_index=True)
+    youtube_count = int((video_df['type'] == 'youtube').sum())
+    naver_count = int((video_df['type'] == 'naver_blog').sum())
+
+    print(f"\n✅ 전체 포스트 수: {total_posts:,}")
+    print(f"✅ 고유 이미지 URL: {len(image_df)}개")
     print(f"   (중복 제거 및 버튼/아이콘 필터링 완료)")
-    
-    # 2. 비디오 URL 추출
-    print("\n" + "="*70)
-    print("🎬 비디오 URL 처리 중...")
-    print("="*70)
-    
-    video_data = []
-    youtube_count = 0
-    naver_count = 0
-    
-    for idx, row in df.iterrows():
-        post_id = row['post_id']
-        urls = parse_url_string(row['video_urls'])
-        
-        for url in urls:
-            video_type = categorize_video_url(url)
-            
-            video_info = {
-                'post_id': post_id,
-                'url': url,
-                'type': video_type
-            }
-            
-            # 유튜브인 경우 video_id 추출
-            if video_type == 'youtube':
-                video_id = extract_youtube_video_id(url)
-                video_info['youtube_video_id'] = video_id
-                youtube_count += 1
-            elif video_type == 'naver_blog':
-                naver_count += 1
-            
-            video_data.append(video_info)
-    
-    print(f"✅ 전체 비디오 URL: {len(video_data)}개")
+    print(f"✅ 전체 비디오 URL: {len(video_df)}개")
     print(f"   - 유튜브: {youtube_count}개")
     print(f"   - 네이버 블로그: {naver_count}개")
-    
+
     # 3. CSV 파일로 저장
     print("\n" + "="*70)
     print("💾 결과 파일 저장 중...")
     print("="*70)
-    
+
     # 이미지 URL 저장
-    if image_data:
-        image_df = pd.DataFrame(image_data)
+    if not image_df.empty:
         image_output = 'extracted_image_urls.csv'
         image_df.to_csv(image_output, index=False, encoding='utf-8-sig')
+        pmik_storage.write_table(image_df, 'extracted_image_urls.parquet', 'media_urls')
         print(f"✅ {image_output} 저장 완료 ({len(image_df)}개)")
-    
+
     # 비디오 URL 저장
-    if video_data:
-        video_df = pd.DataFrame(video_data)
+    if not video_df.empty:
         video_output = 'extracted_video_urls.csv'
         video_df.to_csv(video_output, index=False, encoding='utf-8-sig')
+        pmik_storage.write_table(video_df, 'extracted_video_urls.parquet', 'media_urls')
         print(f"✅ {video_output} 저장 완료 ({len(video_df)}개)")
-    
+
+    # 웨어하우스 media_assets에 upsert
+    with Warehouse() as warehouse:
+        warehouse.upsert('media_assets', image_df)
+        warehouse.upsert('media_assets', video_df)
+        print(f"✅ 웨어하우스 반영: media_assets {warehouse.count('media_assets'):,}행")
+
     # 4. 통계 요약 저장
     summary = {
-        'total_posts': len(df),
-        'total_images': len(all_image_urls),
-        'total_videos': len(video_data),
+        'input_files': input_files,
+        'total_posts': total_posts,
+        'total_images': len(image_df),
+        'total_videos': len(video_df),
         'youtube_videos': youtube_count,
         'naver_blog_videos': naver_count,
         'extraction_date': pd.Timestamp.now().strftime('%Y-%m-%d %H:%M:%S')
     }
-    
+
     with open('extraction_summary.json', 'w', encoding='utf-8') as f:
         json.dump(summary, f, indent=2, ensure_ascii=False)
-    
+
     print(f"✅ extraction_summary.json 저장 완료")
-    
+
     # 5. 최종 요약
     print("\n" + "="*70)
     print("🎉 URL 추출 완료!")
     print("="*70)
     print(f"""
 📊 최종 통계:
-   - 전체 포스트: {len(df)}개
-   - 이미지 URL: {len(all_image_urls)}개
-   - 비디오 URL: {len(video_data)}개
+   - 전체 포스트: {total_posts}개
+   - 이미지 URL: {len(image_df)}개
+   - 비디오 URL: {len(video_df)}개
      ├─ 유튜브: {youtube_count}개
      └─ 네이버: {naver_count}개
 
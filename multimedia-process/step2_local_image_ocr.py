@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+STEP 2 (로컬): 이미지 OCR을 GPU 없는 VM에서 CPU 병렬 처리
+- Colab 노트북 [셀 5]와 같은 image_ocr_results.csv 생성 (merge_ocr_results.py 입력)
+- 다운로드/디코딩 스레드 + 코어별 EasyOCR 프로세스 (pmik_ocr.py)
+- OCR 전 선별: 작은 이미지/중복 배너(pHash)/글자 없는 이미지는 OCR 생략
+- OCR 결과 캐시 (data/ocr_cache.sqlite3): 이전 실행에서 OCR한 이미지는 결과 재사용
+
+사용법:
+    python step2_local_image_ocr.py                                # extracted_image_urls.csv
+    python step2_local_image_ocr.py extracted_image_urls.csv --workers 4 --output results/image_ocr_results.csv
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+# 공용 모듈 (저장소 루트)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from pmik_ocr import OCR_BATCH_SIZE, OCRPipeline, summarize_detections
+
+def main():
+    parser = argparse.ArgumentParser(description='이미지 OCR (로컬 CPU 병렬)')
+    parser.add_argument('input', nargs='?', default='extracted_image_urls.csv', help='STEP 1 이미지 URL CSV')
+    parser.add_argument('--output', default='image_ocr_results.csv', help='결과 CSV')
+    parser.add_argument('--workers', type=int, default=None, help='OCR 프로세스 수 (기본: CPU 코어 수)')
+    parser.add_argument('--batch-size', type=int, default=OCR_BATCH_SIZE, help='프로세스에 한 번에 넘기는 이미지 수')
+    parser.add_argument('--no-triage', action='store_true', help='OCR 전 선별 없이 모든 이미지 OCR')
+    parser.add_argument('--no-cache', action='store_true', help='OCR 결과 캐시를 쓰지 않고 모두 다시 OCR')
+    args = parser.parse_args()
+
+    print("="*70)
+    print("📸 STEP 2: 이미지 OCR (로컬 CPU)")
+    print("="*70)
+
+    image_df = pd.read_csv(args.input, encoding='utf-8-sig')
+    print(f"\n📂 입력 파일: {args.input} ({len(image_df)}개 이미지)")
+
+    with OCRPipeline(ocr_workers=args.workers, batch_size=args.batch_size,
+                     triage=False if args.no_triage else None,
+                     result_cache=False if args.no_cache else None) as pipeline:
+        print(f"🔧 OCR 프로세스 {pipeline.ocr_workers}개 (CPU 코어 {pipeline.cores}개)\n")
+        results = pipeline.run(image_df[['post_id', 'url']].to_dict('records'))
+        stats = pipeline.get_stats()
+
+    rows = []
+    for result in results:
+        ocr_text, confidence = summarize_detections(result['detections'])
+        rows.append({
+            'post_id': result['post_id'],
+            'url': result['url'],
+            'ocr_text': ocr_text,
+            'confidence': confidence,
+            'status': result['status'],
+        })
+    image_ocr_df = pd.DataFrame(rows)
+    image_ocr_df.to_csv(args.output, index=False, encoding='utf-8-sig')
+
+    with_text = (image_ocr_df['ocr_text'].str.len() > 0).sum()
+    print(f"\n✅ 이미지 OCR 완료!")
+    print(f"   - 성공: {stats['success']}/{len(image_df)} (캐시 재사용 {stats['cached']}개)")
+    print(f"   - OCR 생략: 중복 {stats['duplicate']}개, 작은 이미지 {stats['skipped_small']}개, "
+          f"글자 없음 {stats['skipped_no_text']}개")
+    print(f"   - 텍스트 추출: {with_text}개")
+    print(f"   - 처리 시간: {stats['ocr_seconds']}초")
+    print(f"   - 처리량: {stats['images_per_sec']}장/초 (코어당 {stats['images_per_sec_per_core']}장/초)")
+    print(f"💾 저장: {args.output}")
+
+    with open(Path(args.output).with_suffix('.stats.json'), 'w', encoding='utf-8') as f:
+        json.dump(stats, f, indent=2, ensure_ascii=False)
+
+if __name__ == "__main__":
+    main()
@@ -30,13 +30,12 @@
 """
 
 import os
+import sys
 import time
 import json
 import re
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional, Tuple
-from io import BytesIO
-import tempfile
 
 # 웹 크롤링
 import requests
@@ -49,7 +48,6 @@ from selenium.common.exceptions import TimeoutException, NoSuchElementException
 
 # 데이터 처리
 import pandas as pd
-from PIL import Image
 
 # OCR
 import easyocr
@@ -60,6 +58,11 @@ from youtube_transcript_api import YouTubeTranscriptApi
 # 유틸리티
 from tqdm import tqdm
 
+# 미디어 캐시 (저장소 루트의 pmik_media_cache.py)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from pmik_media_cache import MediaCache
+from pmik_ocr import OCR_OK_STATUSES, OCR_SKIPPED_STATUSES, OCRPipeline, OCRResultCache, file_sha256, load_image, summarize_detections
+
 
 # ============================================================
 # 설정
@@ -94,13 +97,14 @@ TARGET_POST_COUNT = 500
 
 # OCR 설정
 USE_OCR = True  # EasyOCR 활성화
+OCR_WORKERS = os.cpu_count() or 1  # CPU OCR 프로세스 수 (프로세스마다 EasyOCR 모델 1개)
 MAX_IMAGES_PER_POST = 5
 OCR_CONFIDENCE_THRESHOLD = 0.5
 
 # Whisper 설정 (자막 없는 영상 처리)
-USE_WHISPER = False  # 메인 크롤링에서는 비활성화 (별도 스크립트로 처리)
+USE_WHISPER = False  # 메인 크롤링에서는 비활성화 (별도 스크립트 pmik_transcribe.py로 처리)
 WHISPER_MODEL = "base"  # tiny, base, small, medium, large
-MAX_VIDEO_DURATION = 300  # 최대 처리 시간 (초) - 5분
+MAX_VIDEO_DURATION = 300  # 영상 앞부분 최대 인식 길이 (초) - 5분
 
 # 출력 설정
 OUTPUT_DIR = "output"
@@ -386,24 +390,40 @@ def filter_by_hashtags(posts: List[Dict], target_hashtags: List[str]) -> Tuple[L
 # ============================================================
 
 class OCRProcessor:
-    def __init__(self, languages: List[str] = ['ko', 'en'], gpu: bool = False):
+    def __init__(self, languages: List[str] = ['ko', 'en'], gpu: bool = False,
+                 media_cache: Optional[MediaCache] = None, result_cache: Optional[OCRResultCache] = None):
         """
         EasyOCR 초기화
         
         비용: 완전 무료 (오픈소스, 로컬 실행)
         성능: CPU 1-3초/이미지
         정확도: 한글 70-85%, 영어 85-95%
+        이미지: 미디어 캐시에서 읽음 (재처리 시 다시 다운로드하지 않음)
+        여러 장: extract_texts_from_urls (CPU 코어별 프로세스 병렬, 모델은 필요할 때 로딩)
+        OCR 결과: 결과 캐시에 있으면 OCR 생략 (이전 실행에서 처리한 같은 이미지)
         """
-        print("EasyOCR 모델 로딩 중...")
-        self.reader = easyocr.Reader(languages, gpu=gpu)
+        self.languages = languages
+        self.gpu = gpu
+        self._reader = None
+        self.media_cache = media_cache or MediaCache()
+        self.result_cache = result_cache or OCRResultCache(languages=languages)
         self.stats = {
             'total_images': 0,
             'successful_ocr': 0,
             'failed_ocr': 0,
+            'skipped_ocr': 0,  # OCR 전 선별로 생략 (실패로 세지 않음)
             'total_time': 0,
             'avg_confidence': []
         }
-        print("EasyOCR 준비 완료!")
+    
+    @property
+    def reader(self):
+        """한 장씩 처리할 때 쓰는 현재 프로세스의 EasyOCR 리더 (최초 사용 시 로딩)"""
+        if self._reader is None:
+            print("EasyOCR 모델 로딩 중...")
+            self._reader = easyocr.Reader(self.languages, gpu=self.gpu)
+            print("EasyOCR 준비 완료!")
+        return self._reader
     
     def extract_text_from_url(self, image_url: str, confidence_threshold: float = 0.5) -> Tuple[str, float]:
         """
@@ -416,48 +436,85 @@ class OCRProcessor:
         self.stats['total_images'] += 1
         
         try:
-            response = requests.get(image_url, timeout=10)
-            response.raise_for_status()
-            
-            img = Image.open(BytesIO(response.content))
-            results = self.reader.readtext(img)
+            image_path = self.media_cache.get_path(image_url)
+            sha256 = file_sha256(image_path)
+            detections = self.result_cache.get(sha256)
+            if detections is None:
+                results = self.reader.readtext(load_image(image_path))
+                detections = [(text, float(confidence)) for _, text, confidence in results]
+                self.result_cache.put(sha256, detections)
             
             # 신뢰도가 높은 텍스트만 추출
-            texts = []
-            confidences = []
-            for detection in results:
-                text, confidence = detection[1], detection[2]
-                if confidence >= confidence_threshold:
-                    texts.append(text)
-                    confidences.append(confidence)
+            text, avg_conf = summarize_detections(detections, confidence_threshold, separator='\n')
             
             processing_time = time.time() - start_time
             self.stats['total_time'] += processing_time
             self.stats['successful_ocr'] += 1
             
-            if confidences:
-                avg_conf = sum(confidences) / len(confidences)
+            if text:
                 self.stats['avg_confidence'].append(avg_conf)
             
-            return '\n'.join(texts), processing_time
+            return text, processing_time
             
         except Exception as e:
             processing_time = time.time() - start_time
             self.stats['failed_ocr'] += 1
             return "", processing_time
     
+    def extract_texts_from_urls(self, image_urls: List[str], confidence_threshold: float = 0.5,
+                                workers: Optional[int] = None) -> Dict[str, str]:
+        """
+        여러 이미지 URL을 CPU 병렬 파이프라인으로 OCR (다운로드/디코딩 스레드 + OCR 프로세스 풀)
+        
+        Returns:
+            {url: text} - 실패한 이미지는 빈 문자열
+        """
+        items = [{'url': url} for url in dict.fromkeys(image_urls)]
+        with OCRPipeline(self.languages, ocr_workers=workers, media_cache=self.media_cache,
+                         result_cache=self.result_cache) as pipeline:
+            results = pipeline.run(items)
+            pipeline_stats = pipeline.get_stats()
+        
+        texts = {}
+        for result in results:
+            self.stats['total_images'] += 1
+            if result['status'] in OCR_SKIPPED_STATUSES:
+                self.stats['skipped_ocr'] += 1
+                texts[result['url']] = ''
+                continue
+            if result['status'] not in OCR_OK_STATUSES:
+                self.stats['failed_ocr'] += 1
+                texts[result['url']] = ''
+                continue
+            text, avg_conf = summarize_detections(result['detections'], confidence_threshold, separator='\n')
+            self.stats['successful_ocr'] += 1
+            if text:
+                self.stats['avg_confidence'].append(avg_conf)
+            texts[result['url']] = text
+        
+        # 처리 시간은 병렬 구간 전체를 이미지 수로 나눈 값으로 기록
+        self.stats['total_time'] += pipeline_stats['ocr_seconds']
+        self.stats['images_per_sec'] = pipeline_stats['images_per_sec']
+        self.stats['images_per_sec_per_core'] = pipeline_stats['images_per_sec_per_core']
+        return texts
+    
     def get_stats(self) -> Dict:
         """OCR 성능 통계 반환"""
         avg_time = self.stats['total_time'] / max(self.stats['total_images'], 1)
+        attempted = self.stats['total_images'] - self.stats['skipped_ocr']
         avg_conf = sum(self.stats['avg_confidence']) / max(len(self.stats['avg_confidence']), 1) if self.stats['avg_confidence'] else 0
         
         return {
             'total_images': self.stats['total_images'],
             'successful': self.stats['successful_ocr'],
             'failed': self.stats['failed_ocr'],
-            'success_rate': f"{self.stats['successful_ocr'] / max(self.stats['total_images'], 1) * 100:.1f}%",
+            'skipped': self.stats['skipped_ocr'],
+            'success_rate': f"{self.stats['successful_ocr'] / max(attempted, 1) * 100:.1f}%",
             'avg_processing_time': f"{avg_time:.2f}초",
-            'avg_confidence': f"{avg_conf * 100:.1f}%"
+            'avg_confidence': f"{avg_conf * 100:.1f}%",
+            'images_per_sec': self.stats.get('images_per_sec', '-'),
+            'images_per_sec_per_core': self.stats.get('images_per_sec_per_core', '-'),
+            'result_cache': self.result_cache.stats
         }
 
 
@@ -466,22 +523,27 @@ class OCRProcessor:
 # ============================================================
 
 class VideoTranscriptExtractor:
-    def __init__(self, use_whisper: bool = False, whisper_model: str = "base"):
+    def __init__(self, use_whisper: bool = False, whisper_model: str = "base",
+                 media_cache: Optional[MediaCache] = None):
         """
         동영상 스크립트 추출기
         
         비용: 완전 무료
         - YouTube 자막: youtube-transcript-api (무료)
         - Whisper 음성인식: OpenAI Whisper (무료, 오픈소스)
+          pmik_transcribe.TranscriptionService - 모델 1개를 크롤링 동안 유지, 오디오 스트리밍 + VAD
+        - 미디어 캐시에 이미 받은 동영상은 로컬 파일에서 읽음
         """
         self.use_whisper = use_whisper
-        self.whisper_model = None
+        self.transcriber = None
+        self.media_cache = media_cache or MediaCache()
         
         if use_whisper:
             try:
-                import whisper
+                from pmik_transcribe import TranscriptionService
                 print(f"Whisper 모델 로딩 중 ({whisper_model})...")
-                self.whisper_model = whisper.load_model(whisper_model)
+                self.transcriber = TranscriptionService(whisper_model, media_cache=self.media_cache,
+                                                        max_audio_seconds=MAX_VIDEO_DURATION)
                 print("Whisper 준비 완료!")
             except ImportError:
                 print("[WARN] Whisper가 설치되지 않았습니다. YouTube 자막만 사용합니다.")
@@ -519,7 +581,7 @@ class VideoTranscriptExtractor:
                 print(f"  ⚠ YouTube 자막 없음, Whisper 시도...")
         
         # 2. Whisper 음성인식 시도 (활성화된 경우)
-        if self.use_whisper and self.whisper_model:
+        if self.use_whisper and self.transcriber:
             transcript = self._extract_with_whisper(video_url)
             if transcript:
                 self.stats['whisper_success'] += 1
@@ -557,58 +619,22 @@ class VideoTranscriptExtractor:
     
     def _extract_with_whisper(self, video_url: str) -> str:
         """
-        Whisper로 음성 인식 (무료, 느림, 자막 없을 때 사용)
+        Whisper로 음성 인식 (무료, 자막 없을 때 사용)
         
-        주의: 동영상 다운로드가 필요하므로 시간이 오래 걸립니다.
+        오디오는 ffmpeg가 16kHz로 바로 스트리밍 (파일 다운로드 없음),
+        무음 구간은 건너뛰고 음성만 30초 청크로 묶어 배치 인식
         """
-        try:
-            import yt_dlp
-            
-            print(f"    [INFO] Whisper 처리 시작: {video_url[:50]}...")
-            
-            # 임시 파일 경로
-            temp_audio = tempfile.NamedTemporaryFile(delete=False, suffix='.mp3')
-            temp_audio_path = temp_audio.name
-            temp_audio.close()
-            
-            # FFmpeg 경로 설정 (Windows)
-            ffmpeg_location = 'C:/ffmpeg/bin'  # FFmpeg 설치 경로
-            
-            # 동영상에서 오디오 추출
-            ydl_opts = {
-                'format': 'bestaudio/best',
-                'outtmpl': temp_audio_path,
-                'postprocessors': [{
-                    'key': 'FFmpegExtractAudio',
-                    'preferredcodec': 'mp3',
-                }],
-                'ffmpeg_location': ffmpeg_location,
-                'quiet': False,  # 에러 출력
-                'no_warnings': False
-            }
-            
-            print(f"    [INFO] 동영상 다운로드 중...")
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                ydl.download([video_url])
-            
-            # Whisper로 음성 인식
-            print(f"    [INFO] Whisper 음성 인식 중...")
-            result = self.whisper_model.transcribe(temp_audio_path, language='ko')
-            
-            # 임시 파일 삭제
-            try:
-                os.unlink(temp_audio_path)
-            except:
-                pass
-            
-            print(f"    [INFO] Whisper 성공: {len(result['text'])} 문자")
-            return result['text']
-            
-        except Exception as e:
-            print(f"    [ERROR] Whisper 실패: {type(e).__name__}: {e}")
-            import traceback
-            traceback.print_exc()
+        print(f"    [INFO] Whisper 처리 시작: {video_url[:50]}...")
+        job = self.transcriber.submit(video_url)
+        text = job.wait()
+        
+        if job.status == 'failed':
+            print(f"    [ERROR] Whisper 실패: {job.error}")
             return ""
+        progress = job.progress()
+        print(f"    [INFO] Whisper 성공: {len(text)} 문자 "
+              f"(음성 {progress['speech_seconds']}/{progress['audio_seconds']}초, {progress['elapsed']}초 소요)")
+        return text
     
     def _extract_youtube_id(self, url: str) -> Optional[str]:
         """YouTube 동영상 ID 추출"""
@@ -632,8 +658,14 @@ class VideoTranscriptExtractor:
             'youtube_subtitle': self.stats['youtube_subtitle_success'],
             'whisper': self.stats['whisper_success'],
             'failed': self.stats['failed'],
-            'success_rate': f"{(self.stats['youtube_subtitle_success'] + self.stats['whisper_success']) / max(self.stats['total_videos'], 1) * 100:.1f}%"
+            'success_rate': f"{(self.stats['youtube_subtitle_success'] + self.stats['whisper_success']) / max(self.stats['total_videos'], 1) * 100:.1f}%",
+            'whisper_service': self.transcriber.get_stats() if self.transcriber else '-'
         }
+    
+    def close(self):
+        """Whisper 서비스 종료 (모델/스레드 정리)"""
+        if self.transcriber:
+            self.transcriber.close()
 
 
 # ============================================================
@@ -951,21 +983,24 @@ def main():
     
     print()
     
+    # 이미지/동영상 캐시 (OCR·Whisper 공용, 재실행 시 다운로드 생략)
+    media_cache = MediaCache()
+    
     # Phase 4: OCR
     if USE_OCR:
         print("[Phase 4] 이미지 OCR 처리 중...")
         print("비용: 무료 (EasyOCR, 로컬 실행)")
         print("성능: CPU 1-3초/이미지, GPU 0.1-0.5초/이미지\n")
         
-        ocr = OCRProcessor(languages=['ko', 'en'], gpu=False)
+        ocr = OCRProcessor(languages=['ko', 'en'], gpu=False, media_cache=media_cache)
         
-        for post in tqdm(filtered_posts, desc="OCR 처리"):
-            ocr_texts = []
-            for img_url in post['images'][:MAX_IMAGES_PER_POST]:
-                text, proc_time = ocr.extract_text_from_url(img_url, OCR_CONFIDENCE_THRESHOLD)
-                if text:
-                    ocr_texts.append(text)
-            post['ocr_text'] = '\n---\n'.join(ocr_texts)
+        # 전체 게시물의 이미지를 한 번에 병렬 처리 후 게시물별로 다시 모음
+        image_urls = [url for post in filtered_posts for url in post['images'][:MAX_IMAGES_PER_POST]]
+        ocr_texts_by_url = ocr.extract_texts_from_urls(image_urls, OCR_CONFIDENCE_THRESHOLD, workers=OCR_WORKERS)
+        
+        for post in filtered_posts:
+            ocr_texts = [ocr_texts_by_url.get(url, '') for url in post['images'][:MAX_IMAGES_PER_POST]]
+            post['ocr_text'] = '\n---\n'.join(text for text in ocr_texts if text)
         
         ocr_stats = ocr.get_stats()
         overall_stats['phase4_ocr'] = ocr_stats
@@ -983,7 +1018,8 @@ def main():
         print(f"  - Whisper 음성인식: {WHISPER_MODEL} 모델")
     print()
     
-    video_extractor = VideoTranscriptExtractor(use_whisper=USE_WHISPER, whisper_model=WHISPER_MODEL)
+    video_extractor = VideoTranscriptExtractor(use_whisper=USE_WHISPER, whisper_model=WHISPER_MODEL,
+                                               media_cache=media_cache)
     
     for post in tqdm(filtered_posts, desc="동영상 처리"):
         transcripts = []
@@ -994,6 +1030,7 @@ def main():
         post['video_transcripts'] = '\n---\n'.join(transcripts)
     
     video_stats = video_extractor.get_stats()
+    video_extractor.close()
     overall_stats['phase5_video'] = video_stats
     
     print("\n동영상 처리 통계:")
@@ -1001,6 +1038,13 @@ def main():
         print(f"  {key}: {value}")
     print()
     
+    cache_stats = media_cache.get_stats()
+    overall_stats['media_cache'] = cache_stats
+    print("미디어 캐시 통계:")
+    for key, value in cache_stats.items():
+        print(f"  {key}: {value}")
+    print()
+    
     # Phase 6: 저장
     print("[Phase 6] 데이터 저장 중...")
     df = save_to_csv(filtered_posts, OUTPUT_CSV)
@@ -11,6 +11,23 @@ PM-International Korea 네이버 블로그 크롤러 v9.1 (Final 버전)
 5. 후원번호 7-8자리 지원 및 패턴 분석
 6. 키워드당 1000개 수집 (연도 제한 없음)
 7. 시간 제한 없음 (전체 수집)
+8. v9.2: 멀티 드라이버 워커 풀 (공유 작업 큐)
+9. v9.2: HTTP 고속 경로 (PostView 직접 요청, Selenium은 폴백)
+10. v9.2: 비동기 크롤링 엔진 (호스트별 동시성/속도 제한)
+11. v9.2: 키워드 동시 검색 + 크롤링 파이프라인 (검색과 크롤링 중첩)
+12. v9.2: 스트리밍 저장 (JSONL 세그먼트 추가 기록, 메모리 사용량 일정)
+13. v9.2: 크롤링 저널 (중단 후 재시작 시 키워드 검색 위치/처리 URL 이어서 진행)
+14. v9.2: 영구 중복 인덱스 (SQLite, 64비트 해시 키 - 이전 CSV 재파싱 없음)
+15. v9.2: 유사 중복 탐지 (본문 SimHash + LSH 밴드, 템플릿 복붙 게시물 제외)
+16. v9.2: 필터 엔진 (config에서 1회 생성, Aho-Corasick 키워드 매칭, 적용된 규칙 보고)
+17. v9.2: 추천인 정보 일괄 재추출 (저장된 CSV/Parquet, reextract_sponsor_info.py)
+18. v9.2: 단일 파싱 추출 (lxml 파서, 좋아요/댓글 수는 JavaScript 1회 호출)
+19. v9.2: 페이지 준비 대기 (고정 sleep 대신 DOM 조건 폴링, 조건별 대기 시간 기록)
+20. v9.2: 리소스 차단 (CDP로 폰트/CSS/이미지/동영상/광고 요청 차단, 전송량 집계)
+21. v9.2: 좋아요/댓글 수 API 클라이언트 (블로그별 일괄 조회, DOM 추출은 폴백)
+22. v9.2: 참여 지표 갱신 작업 (refresh_engagement.py, 나이/성장 속도 순, 시계열 스냅샷)
+23. v9.2: Parquet 저장 (공용 pmik_storage, platform/keyword/수집일 파티션, CSV는 Excel용)
+24. v9.2: 로컬 웨어하우스 (공용 pmik_warehouse, SQLite upsert - 플랫폼별 테이블 + 인덱스)
    - 패턴 분석 및 통계
 6. 🎯 함수 모듈화
    - 코드 가독성 향상
@@ -24,12 +41,13 @@ PM-International Korea 네이버 블로그 크롤러 v9.1 (Final 버전)
 - 메타: collected_date
 
 작성자: PMI Korea 데이터 분석팀
-버전: 9.1.0
-최종 수정일: 2025-11-17
+버전: 9.2.0
+최종 수정일: 2026-10-16
 """
 
 import os
 import re
+import sys
 import json
 import time
 import random
@@ -37,11 +55,18 @@ import logging
 import gc
 import yaml
 import shutil
+import queue
+import asyncio
+import threading
+import contextlib
+import hashlib
+import sqlite3
 from datetime import datetime, timedelta
 from urllib.parse import urlparse, parse_qs, unquote
 from typing import List, Dict, Optional, Set, Tuple
 from pathlib import Path
 from enum import Enum
+from concurrent.futures import ThreadPoolExecutor
 
 import requests
 from bs4 import BeautifulSoup
@@ -54,6 +79,31 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException
 from webdriver_manager.chrome import ChromeDriverManager
 import pandas as pd
+import numpy as np
+
+# v9.2: 공용 Parquet 저장소 (저장소 루트의 pmik_storage.py)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+import pmik_storage
+from pmik_warehouse import Warehouse
+
+# v9.2: Aho-Corasick 키워드 매칭 (선택 설치, 없으면 키워드별 검색)
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# v9.2: lxml 파서 (선택 설치, 없으면 html.parser)
+try:
+    import lxml
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+# v9.2: 비동기 엔진 (선택 설치)
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
 
 # ===========================
 # 로깅 설정
@@ -157,6 +207,75 @@ REQUEST_DELAY_MIN = CONFIG['crawling']['request_delay_min']
 REQUEST_DELAY_MAX = CONFIG['crawling']['request_delay_max']
 MAX_CONSECUTIVE_ERRORS = CONFIG['error_recovery']['max_consecutive_errors']
 
+# v9.2: 워커 풀 설정
+NUM_WORKERS = max(1, CONFIG['crawling']['workers'])
+TASK_QUEUE_SIZE = CONFIG['crawling']['task_queue_size']
+DRIVER_DEBUG_PORT_BASE = CONFIG['crawling']['driver']['remote_debugging_port_base']
+DRIVER_SINGLE_PROCESS = CONFIG['crawling']['driver']['single_process']
+
+# v9.2: HTTP 고속 경로 설정
+HTTP_FAST_PATH = CONFIG['crawling']['http_fast_path']['enabled']
+HTTP_SELENIUM_FALLBACK = CONFIG['crawling']['http_fast_path']['selenium_fallback']
+
+# v9.2: 스트리밍 저장 설정
+OUTPUT_COLUMNS = CONFIG['output']['columns']
+SEGMENT_DIRECTORY = CONFIG['output']['streaming']['segment_directory']
+SEGMENT_MAX_POSTS = CONFIG['output']['streaming']['segment_max_posts']
+SEGMENT_FSYNC_EVERY = CONFIG['output']['streaming']['fsync_every']
+OUTPUT_FORMATS = CONFIG['output']['formats']
+PARQUET_DATASET = CONFIG['output']['parquet']['dataset']
+
+# v9.2: 크롤링 저널 설정
+JOURNAL_ENABLED = CONFIG['checkpoint']['journal']['enabled']
+JOURNAL_FILE = CONFIG['checkpoint']['journal']['filename']
+JOURNAL_FSYNC_EVERY = CONFIG['checkpoint']['journal']['fsync_every']
+
+# v9.2: 영구 중복 인덱스 설정
+DEDUP_INDEX_FILE = CONFIG['dedup']['index_file']
+DEDUP_PREVIOUS_CSV_PATTERN = CONFIG['dedup']['previous_csv_pattern']
+NEAR_DUP_ENABLED = CONFIG['dedup']['near_duplicate']['enabled']
+NEAR_DUP_MAX_DISTANCE = CONFIG['dedup']['near_duplicate']['max_hamming_distance']
+NEAR_DUP_SHINGLE_SIZE = CONFIG['dedup']['near_duplicate']['shingle_size']
+NEAR_DUP_MIN_LENGTH = CONFIG['dedup']['near_duplicate']['min_content_length']
+
+# v9.2: 키워드 동시 검색 설정
+SEARCH_CONCURRENCY = CONFIG['search']['concurrency']
+SEARCH_API_RATE = CONFIG['search']['api_rate_per_second']
+SEARCH_API_CALL_BUDGET = CONFIG['search']['api_call_budget']
+
+# v9.2: 비동기 엔진 설정
+ASYNC_ENGINE_ENABLED = CONFIG['crawling']['async_engine']['enabled']
+ASYNC_MAX_CONCURRENCY = CONFIG['crawling']['async_engine']['max_concurrency']
+ASYNC_HOST_SETTINGS = CONFIG['crawling']['async_engine']['hosts']
+ASYNC_DEFAULT_HOST = CONFIG['crawling']['async_engine']['default_host']
+
+# v9.2: 좋아요/댓글 수 API 설정
+ENGAGEMENT_API_ENABLED = CONFIG['engagement_api']['enabled']
+ENGAGEMENT_API_URL = CONFIG['engagement_api']['url']
+ENGAGEMENT_LIKE_FIELD = CONFIG['engagement_api']['like_field']
+ENGAGEMENT_COMMENT_FIELD = CONFIG['engagement_api']['comment_field']
+ENGAGEMENT_ITEMS_PER_PAGE = CONFIG['engagement_api']['items_per_page']
+ENGAGEMENT_MAX_PAGES = CONFIG['engagement_api']['max_pages']
+ENGAGEMENT_WORKERS = CONFIG['engagement_api']['workers']
+ENGAGEMENT_RATE = CONFIG['engagement_api']['rate_per_second']
+ENGAGEMENT_TIMEOUT = CONFIG['engagement_api']['timeout']
+ENGAGEMENT_PAGE_CACHE_SECONDS = CONFIG['engagement_api']['page_cache_seconds']
+REFRESH_STORE_FILE = CONFIG['engagement_api']['refresh']['store_file']
+REFRESH_MAX_POSTS = CONFIG['engagement_api']['refresh']['max_posts_per_run']
+REFRESH_WORKERS = CONFIG['engagement_api']['refresh']['workers']
+REFRESH_MAX_PAGES = CONFIG['engagement_api']['refresh']['max_pages']
+REFRESH_INTERVALS = CONFIG['engagement_api']['refresh']['intervals']
+
+# v9.2: 리소스 차단 설정
+RESOURCE_BLOCKING = CONFIG['crawling']['resource_blocking']['enabled']
+RESOURCE_TRACK_BYTES = CONFIG['crawling']['resource_blocking']['track_bytes']
+BLOCKED_URL_PATTERNS = CONFIG['crawling']['resource_blocking']['blocked_url_patterns']
+
+# v9.2: 페이지 준비 대기 설정
+READINESS_POLL_INTERVAL = CONFIG['crawling']['readiness']['poll_interval']
+READINESS_FRAME_TIMEOUT = CONFIG['crawling']['readiness']['frame_timeout']
+READINESS_CONDITIONS = CONFIG['crawling']['readiness']['conditions']
+
 # ===========================
 # v7.3: 적응형 속도 조절
 # ===========================
@@ -319,18 +438,26 @@ class FailedURLManager:
     def __init__(self, filename='failed_urls.json'):
         self.filename = filename
         self.failed_urls = {}
+        self._lock = threading.Lock()  # v9.2: 워커 스레드 공유
         self.load_from_file()
     
     def add_failed(self, url: str, reason: str):
-        if url not in self.failed_urls:
-            self.failed_urls[url] = {
-                'reason': reason,
-                'count': 1,
-                'last_attempt': datetime.now().isoformat()
-            }
-        else:
-            self.failed_urls[url]['count'] += 1
-            self.failed_urls[url]['last_attempt'] = datetime.now().isoformat()
+        with self._lock:
+            if url not in self.failed_urls:
+                self.failed_urls[url] = {
+                    'reason': reason,
+                    'count': 1,
+                    'last_attempt': datetime.now().isoformat()
+                }
+            else:
+                self.failed_urls[url]['reason'] = reason
+                self.failed_urls[url]['count'] += 1
+                self.failed_urls[url]['last_attempt'] = datetime.now().isoformat()
+    
+    def is_filtered(self, url: str) -> bool:
+        """v9.2: 마지막 실패 사유가 필터링인지 확인 (요청/파싱 실패와 구분)"""
+        with self._lock:
+            return self.failed_urls.get(url, {}).get('reason', '').startswith("필터링")
     
     def load_from_file(self):
         if os.path.exists(self.filename):
@@ -402,6 +529,151 @@ class ErrorRecoveryManager:
         """재시도 기록"""
         self.retry_count[url] = self.retry_count.get(url, 0) + 1
 
+# ===========================
+# v9.2: 스트리밍 저장 (JSONL 세그먼트)
+# ===========================
+
+class PostSegmentWriter:
+    """수집된 게시물을 JSONL 세그먼트 파일에 즉시 추가 기록
+    
+    - 게시물을 메모리에 모아두지 않고 1건씩 append (RSS 일정)
+    - fsync는 SEGMENT_FSYNC_EVERY건마다 묶어서 수행
+    - 세그먼트는 SEGMENT_MAX_POSTS건마다 교체 ({run_id}_seg0001.jsonl ...)
+    - 최종 CSV는 세그먼트를 순서대로 이어 붙여 생성
+    """
+    
+    def __init__(self, run_id: Optional[str] = None):
+        self.segment_dir = Path(SEGMENT_DIRECTORY)
+        self.segment_dir.mkdir(exist_ok=True)
+        self.run_id = run_id or datetime.now().strftime('%Y%m%d_%H%M%S')
+        
+        self._file = None
+        self._segment_count = 0  # 현재 세그먼트에 기록된 개수
+        self._unsynced = 0
+        self._lock = threading.Lock()
+        
+        # v9.2: 같은 run_id로 재시작하면 기존 세그먼트를 이어받고 새 세그먼트부터 기록
+        self.segment_paths: List[Path] = sorted(self.segment_dir.glob(f"{self.run_id}_seg*.jsonl"))
+        self.total_written = sum(1 for _ in self.iter_posts()) if self.segment_paths else 0
+    
+    def _open_next_segment(self):
+        # self._lock 보유 상태에서 호출
+        self._close_segment()
+        path = self.segment_dir / f"{self.run_id}_seg{len(self.segment_paths) + 1:04d}.jsonl"
+        self._file = open(path, 'a', encoding='utf-8')
+        self.segment_paths.append(path)
+        self._segment_count = 0
+    
+    def _sync(self):
+        if self._file and self._unsynced:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._unsynced = 0
+    
+    def _close_segment(self):
+        if self._file:
+            self._sync()
+            self._file.close()
+            self._file = None
+    
+    def append(self, post_data: Dict):
+        """게시물 1건 기록"""
+        with self._lock:
+            if self._file is None or self._segment_count >= SEGMENT_MAX_POSTS:
+                self._open_next_segment()
+            
+            self._file.write(json.dumps(post_data, ensure_ascii=False) + '\n')
+            self._file.flush()  # 프로세스가 죽어도 OS 버퍼에는 남도록 (fsync는 묶어서)
+            self._segment_count += 1
+            self._unsynced += 1
+            self.total_written += 1
+            
+            if self._unsynced >= SEGMENT_FSYNC_EVERY:
+                self._sync()
+    
+    def sync(self):
+        """버퍼에 남은 기록을 디스크에 반영 (체크포인트 시점)"""
+        with self._lock:
+            self._sync()
+    
+    def close(self):
+        with self._lock:
+            self._close_segment()
+    
+    def iter_posts(self):
+        """기록된 게시물을 세그먼트 순서대로 1건씩 반환
+        
+        중단 시 잘린 마지막 줄은 건너뛰고, 재시작 후 다시 크롤링된 게시물은 1번만 반환
+        """
+        self.sync()
+        seen_post_ids = set()
+        for path in self.segment_paths:
+            with open(path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        post = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    if post.get('post_id') in seen_post_ids:
+                        continue
+                    seen_post_ids.add(post.get('post_id'))
+                    yield post
+    
+    def export_csv(self, filename: str, chunk_size: int = 1000) -> int:
+        """세그먼트를 이어 붙여 최종 CSV 생성 (chunk_size건씩 변환하여 메모리 일정)
+        
+        Returns:
+            기록한 게시물 수
+        """
+        written = 0
+        chunk = []
+        
+        with open(filename, 'w', encoding='utf-8-sig', newline='') as f:
+            for post in self.iter_posts():
+                chunk.append(post)
+                if len(chunk) >= chunk_size:
+                    pd.DataFrame(chunk, columns=OUTPUT_COLUMNS).to_csv(f, index=False, header=(written == 0))
+                    written += len(chunk)
+                    chunk = []
+            
+            if chunk or written == 0:
+                pd.DataFrame(chunk, columns=OUTPUT_COLUMNS).to_csv(f, index=False, header=(written == 0))
+                written += len(chunk)
+        
+        return written
+    
+    def export_parquet(self, dataset: str = PARQUET_DATASET, chunk_size: int = 5000) -> int:
+        """세그먼트를 공용 Parquet 데이터셋에 추가 (platform/keyword/수집일 파티션, v9.2)
+        
+        파일명은 run_id와 청크 번호로 정해 다시 내보내면 같은 파일을 덮어씀 → 저장 중 오류로
+        저널이 완료되지 않아 같은 run_id로 재개해도 데이터셋에 행이 중복되지 않음
+        
+        Returns:
+            기록한 게시물 수 (pyarrow가 없으면 0)
+        """
+        written = 0
+        chunk = []
+        chunk_index = 0
+        
+        def write(chunk: List[Dict]) -> bool:
+            basename = f'naver_blog_{self.run_id}_{chunk_index:04d}'
+            return pmik_storage.write_dataset(pd.DataFrame(chunk), dataset, 'naver_blog',
+                                              basename=basename) is not None
+        
+        for post in self.iter_posts():
+            chunk.append(post)
+            if len(chunk) >= chunk_size:
+                if not write(chunk):
+                    return 0
+                written += len(chunk)
+                chunk = []
+                chunk_index += 1
+        
+        if chunk and write(chunk):
+            written += len(chunk)
+        
+        return written
+
 # ===========================
 # v9.1: 체크포인트 시스템
 # ===========================
@@ -419,20 +691,21 @@ class CheckpointManager:
         """체크포인트 저장 시점인지 확인"""
         return (time.time() - self.last_save_time) >= self.interval
     
-    def save_checkpoint(self, collected_posts: List[Dict], stats: CrawlStats):
-        """체크포인트 저장"""
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    def save_checkpoint(self, writer: PostSegmentWriter, stats: CrawlStats):
+        """체크포인트 저장
         
-        # CSV 저장
-        csv_path = self.checkpoint_dir / f"checkpoint_{timestamp}.csv"
-        df = pd.DataFrame(collected_posts)
-        df.to_csv(csv_path, index=False, encoding='utf-8-sig')
+        v9.2: 게시물은 이미 세그먼트에 기록되어 있으므로 전체 CSV를 다시 쓰지 않고
+        세그먼트를 fsync한 뒤 메타데이터(세그먼트 목록)만 저장
+        """
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        writer.sync()
         
         # 메타데이터 저장
         meta_path = self.checkpoint_dir / f"checkpoint_{timestamp}_meta.json"
         meta_data = {
             'timestamp': timestamp,
-            'total_collected': len(collected_posts),
+            'total_collected': writer.total_written,
+            'segments': [str(path) for path in writer.segment_paths],
             'stats': {
                 'success': stats.success,
                 'filtered': stats.filtered,
@@ -444,72 +717,329 @@ class CheckpointManager:
             json.dump(meta_data, f, ensure_ascii=False, indent=2)
         
         self.last_save_time = time.time()
-        logger.info(f"💾 체크포인트 저장: {len(collected_posts)}개 ({csv_path.name})")
+        logger.info(f"💾 체크포인트 저장: {writer.total_written}개 ({meta_path.name})")
     
     def load_latest_checkpoint(self) -> Optional[List[Dict]]:
-        """최신 체크포인트 로드"""
-        csv_files = list(self.checkpoint_dir.glob("checkpoint_*.csv"))
-        if not csv_files:
+        """최신 체크포인트 로드 (v9.2: 메타데이터의 세그먼트 목록에서 복원)"""
+        meta_files = list(self.checkpoint_dir.glob("checkpoint_*_meta.json"))
+        if not meta_files:
             return None
         
-        latest_file = max(csv_files, key=lambda p: p.stat().st_mtime)
-        df = pd.read_csv(latest_file)
-        logger.info(f"📂 체크포인트 로드: {len(df)}개 ({latest_file.name})")
-        return df.to_dict('records')
+        latest_file = max(meta_files, key=lambda p: p.stat().st_mtime)
+        with open(latest_file, 'r', encoding='utf-8') as f:
+            meta_data = json.load(f)
+        
+        posts = []
+        for segment in meta_data.get('segments', []):
+            if not Path(segment).exists():
+                continue
+            with open(segment, 'r', encoding='utf-8') as f:
+                posts.extend(json.loads(line) for line in f if line.strip())
+        
+        logger.info(f"📂 체크포인트 로드: {len(posts)}개 ({latest_file.name})")
+        return posts
+
+class CrawlJournal:
+    """재시작 가능한 크롤링 저널 (write-ahead log, JSONL 1줄 = 1기록)
+    
+    기록 종류:
+    - run: 실행 ID (세그먼트 파일 이름과 공유)
+    - cursor: 키워드별 다음 검색 위치 (API start 오프셋 / 스크래핑 페이지)
+    - queued: 작업 큐에 넣은 검색 결과 (재시작 시 결과 없는 항목을 다시 투입)
+    - outcome: URL별 처리 결과 (success / filtered / duplicate / failed / skipped)
+    - complete: 정상 종료 → 다음 실행은 새 저널로 시작
+    
+    재시작 시 저널을 한 번 읽어 dict로 복원하므로 URL별 완료 확인은 O(1).
+    """
+    
+    # 재시작 시 다시 크롤링하지 않는 결과 (failed/skipped는 다시 시도)
+    DONE_OUTCOMES = {'success', 'filtered', 'duplicate'}
+    
+    def __init__(self, path: str = JOURNAL_FILE):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        
+        self.run_id = None
+        self.cursors = {}  # keyword → 다음 검색 위치 (완료 시 {'done': True})
+        self.outcomes = {}  # post_id → 처리 결과
+        self.pending = {}  # post_id → (keyword, result): 큐에 넣었지만 결과 없음
+        self.successes = []  # 재시작 시 복원할 수집 게시물 (keyword, post_id, url, fingerprint, simhash)
+        
+        self._lock = threading.Lock()
+        self._unsynced = 0
+        
+        self.resumed = self._replay()
+        self._file = open(self.path, 'a', encoding='utf-8')
+        if not self.resumed:
+            self.run_id = datetime.now().strftime('%Y%m%d_%H%M%S')
+            self._write({'e': 'run', 'run_id': self.run_id})
+            self.sync()
+    
+    def _replay(self) -> bool:
+        """기존 저널 복원 (완료된 저널은 보관 후 새로 시작)
+        
+        Returns:
+            이어서 진행할 저널이 있으면 True
+        """
+        if not self.path.exists():
+            return False
+        
+        records = []
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    records.append(json.loads(line))
+                except json.JSONDecodeError:
+                    break  # 중단 시 잘린 마지막 줄
+        
+        if not records or records[-1]['e'] == 'complete':
+            archived = self.path.with_name(f"{self.path.stem}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.jsonl")
+            self.path.rename(archived)
+            return False
+        
+        for record in records:
+            event = record['e']
+            if event == 'run':
+                self.run_id = record['run_id']
+            elif event == 'cursor':
+                self.cursors[record['keyword']] = record['cursor']
+            elif event == 'queued':
+                result = record['result']
+                if result['post_id'] not in self.outcomes:
+                    self.pending[result['post_id']] = (record['keyword'], result)
+            elif event == 'outcome':
+                post_id = record['post_id']
+                self.outcomes[post_id] = record['outcome']
+                self.pending.pop(post_id, None)
+                if record['outcome'] == 'success':
+                    self.successes.append((record['keyword'], post_id, record.get('url'),
+                                           record.get('fingerprint'), record.get('simhash')))
+        
+        logger.info(f"📂 저널 복원: 실행 {self.run_id}, 처리 URL {len(self.outcomes)}개, "
+                   f"수집 {len(self.successes)}개, 미처리 {len(self.pending)}개")
+        return True
+    
+    def _write(self, record: Dict):
+        # self._lock 보유 상태 또는 초기화 중에 호출
+        self._file.write(json.dumps(record, ensure_ascii=False) + '\n')
+        self._file.flush()
+        self._unsynced += 1
+    
+    def is_done(self, post_id: str) -> bool:
+        """이전 실행에서 처리가 끝난 URL인지 확인 (O(1))"""
+        return self.outcomes.get(post_id) in self.DONE_OUTCOMES
+    
+    def get_cursor(self, keyword: str) -> Optional[Dict]:
+        return self.cursors.get(keyword)
+    
+    def keyword_exhausted(self, keyword: str) -> bool:
+        return bool(self.cursors.get(keyword, {}).get('done'))
+    
+    def pending_tasks(self) -> List[Tuple[str, Dict]]:
+        """큐에 넣었지만 결과가 기록되지 않은 작업 (재시작 시 다시 투입)"""
+        with self._lock:
+            return list(self.pending.values())
+    
+    def record_cursor(self, keyword: str, cursor: Dict):
+        with self._lock:
+            self.cursors[keyword] = cursor
+            self._write({'e': 'cursor', 'keyword': keyword, 'cursor': cursor})
+    
+    def record_queued(self, keyword: str, result: Dict):
+        with self._lock:
+            self.pending[result['post_id']] = (keyword, result)
+            self._write({'e': 'queued', 'keyword': keyword, 'result': result})
+    
+    def record_outcome(self, keyword: str, post_id: str, outcome: str, url: str = None,
+                       fingerprint: int = None, simhash: int = None) -> bool:
+        """URL 처리 결과 기록
+        
+        Returns:
+            fsync 주기(JOURNAL_FSYNC_EVERY)에 도달했으면 True (호출 측에서 sync 수행)
+        """
+        record = {'e': 'outcome', 'keyword': keyword, 'post_id': post_id, 'outcome': outcome}
+        if outcome == 'success':
+            record['url'] = url
+            record['fingerprint'] = fingerprint
+            record['simhash'] = simhash
+        
+        with self._lock:
+            self.outcomes[post_id] = outcome
+            self.pending.pop(post_id, None)
+            self._write(record)
+            return self._unsynced >= JOURNAL_FSYNC_EVERY
+    
+    def sync(self):
+        """저널을 디스크에 반영"""
+        with self._lock:
+            if self._unsynced:
+                os.fsync(self._file.fileno())
+                self._unsynced = 0
+    
+    def close(self, complete: bool = False):
+        """저널 닫기 (complete=True: 정상 종료 기록 → 다음 실행은 처음부터)"""
+        with self._lock:
+            if self._file.closed:
+                return
+            if complete:
+                self._write({'e': 'complete', 'run_id': self.run_id})
+        self.sync()
+        with self._lock:
+            self._file.close()
 
 # ===========================
 # v9.1: 중복 체크 시스템
 # ===========================
 
+def hash_key(kind: str, value: str) -> int:
+    """v9.2: 중복 체크 키를 64비트 정수로 변환 (SQLite INTEGER 범위)"""
+    digest = hashlib.blake2b(f"{kind}:{value}".encode('utf-8'), digest_size=8).digest()
+    return int.from_bytes(digest, 'big', signed=True)
+
+class DedupIndex:
+    """v9.2: 영구 중복 체크 인덱스 (SQLite)
+    
+    - post_id / URL / 지문을 64비트 해시 1개(INTEGER PRIMARY KEY)로 저장 → 조회 O(log n)
+    - 수집할 때마다 바로 추가되므로 다음 실행에서 이전 CSV를 다시 읽을 필요 없음
+    - 외부에서 생긴 CSV는 파일별로 1번만 반영 (imported_files)
+    - 본문 SimHash는 밴드로 나눠 저장 (LSH): 해밍 거리 d 이하인 두 해시는
+      d+1개 밴드 중 최소 1개가 일치하므로 밴드 조회만으로 후보를 찾음
+    """
+    
+    def __init__(self, path: str = DEDUP_INDEX_FILE):
+        self.path = path
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("CREATE TABLE IF NOT EXISTS seen_keys (key INTEGER PRIMARY KEY)")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS imported_files "
+            "(name TEXT PRIMARY KEY, mtime REAL, rows INTEGER)"
+        )
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS simhash_bands "
+            "(band INTEGER, value INTEGER, simhash INTEGER, PRIMARY KEY (band, value, simhash)) WITHOUT ROWID"
+        )
+        self.conn.commit()
+        
+        self.num_bands = NEAR_DUP_MAX_DISTANCE + 1
+        self.band_bits = 64 // self.num_bands
+    
+    def _bands(self, simhash: int) -> List[Tuple[int, int]]:
+        mask = (1 << self.band_bits) - 1
+        unsigned = simhash & 0xFFFFFFFFFFFFFFFF
+        return [(band, (unsigned >> (band * self.band_bits)) & mask) for band in range(self.num_bands)]
+    
+    def find_similar(self, simhash: int, max_distance: int = NEAR_DUP_MAX_DISTANCE) -> List[int]:
+        """해밍 거리 max_distance 이하인 저장된 SimHash 목록"""
+        with self._lock:
+            candidates = set()
+            for band, value in self._bands(simhash):
+                rows = self.conn.execute("SELECT simhash FROM simhash_bands WHERE band = ? AND value = ?",
+                                         (band, value)).fetchall()
+                candidates.update(row[0] for row in rows)
+        return [candidate for candidate in candidates
+                if bin((candidate ^ simhash) & 0xFFFFFFFFFFFFFFFF).count('1') <= max_distance]
+    
+    def add_simhash(self, simhash: int):
+        with self._lock:
+            self.conn.executemany("INSERT OR IGNORE INTO simhash_bands (band, value, simhash) VALUES (?, ?, ?)",
+                                  [(band, value, simhash) for band, value in self._bands(simhash)])
+            self.conn.commit()
+    
+    def contains(self, kind: str, value: str) -> bool:
+        with self._lock:
+            row = self.conn.execute("SELECT 1 FROM seen_keys WHERE key = ?",
+                                    (hash_key(kind, value),)).fetchone()
+        return row is not None
+    
+    def add_many(self, items: List[Tuple[str, str]]):
+        """(종류, 값) 목록 추가"""
+        with self._lock:
+            self.conn.executemany("INSERT OR IGNORE INTO seen_keys (key) VALUES (?)",
+                                  [(hash_key(kind, value),) for kind, value in items])
+            self.conn.commit()
+    
+    def count(self) -> int:
+        with self._lock:
+            return self.conn.execute("SELECT COUNT(*) FROM seen_keys").fetchone()[0]
+    
+    def is_imported(self, csv_file: Path) -> bool:
+        with self._lock:
+            row = self.conn.execute("SELECT mtime FROM imported_files WHERE name = ?",
+                                    (csv_file.name,)).fetchone()
+        return row is not None and row[0] == csv_file.stat().st_mtime
+    
+    def mark_imported(self, csv_file: Path, rows: int):
+        with self._lock:
+            self.conn.execute("INSERT OR REPLACE INTO imported_files (name, mtime, rows) VALUES (?, ?, ?)",
+                              (csv_file.name, csv_file.stat().st_mtime, rows))
+            self.conn.commit()
+    
+    def close(self):
+        with self._lock:
+            self.conn.close()
+
 class DuplicateChecker:
-    """중복 체크 관리자"""
+    """중복 체크 관리자 (v9.2: 영구 인덱스 기반)"""
     
-    def __init__(self):
-        self.collected_post_ids = set()
-        self.collected_urls = set()
-        self.collected_fingerprints = set()
+    def __init__(self, index_path: str = DEDUP_INDEX_FILE):
+        self.index = DedupIndex(index_path)
         self.partner_id_stats = {'7자리': 0, '8자리': 0, '패턴_예시': []}
     
-    def load_previous_data(self, csv_pattern: str = "naver_blog_pm_*.csv"):
-        """이전 실행 결과 로드"""
-        csv_files = list(Path('.').glob(csv_pattern))
-        if not csv_files:
-            logger.info("이전 수집 데이터 없음")
-            return
+    def load_previous_data(self, csv_pattern: str = DEDUP_PREVIOUS_CSV_PATTERN):
+        """이전 실행 결과 로드 (v9.2: 인덱스에 아직 반영되지 않은 CSV만 읽음)"""
+        csv_files = [csv_file for csv_file in Path('.').glob(csv_pattern)
+                     if not self.index.is_imported(csv_file)]
         
         for csv_file in csv_files:
             try:
-                df = pd.read_csv(csv_file)
-                for _, row in df.iterrows():
-                    if 'post_id' in row and pd.notna(row['post_id']):
-                        self.collected_post_ids.add(str(row['post_id']))
-                    if 'url' in row and pd.notna(row['url']):
-                        self.collected_urls.add(str(row['url']))
-                logger.info(f"📂 이전 데이터 로드: {len(df)}개 ({csv_file.name})")
+                df = pd.read_csv(csv_file, usecols=lambda col: col in ('post_id', 'url'), dtype=str)
+                items = []
+                if 'post_id' in df:
+                    items.extend(('post_id', post_id) for post_id in df['post_id'].dropna())
+                if 'url' in df:
+                    items.extend(('url', url) for url in df['url'].dropna())
+                self.index.add_many(items)
+                self.index.mark_imported(csv_file, len(df))
+                logger.info(f"📂 이전 데이터 반영: {len(df)}개 ({csv_file.name})")
             except Exception as e:
                 logger.warning(f"파일 로드 실패: {csv_file.name} - {e}")
         
-        logger.info(f"🔄 총 {len(self.collected_post_ids)}개 post_id 로드 완료")
+        logger.info(f"🔄 중복 인덱스: {self.index.count()}개 키 (새로 반영한 파일 {len(csv_files)}개)")
     
     def is_duplicate(self, post_id: str = None, url: str = None, 
-                    fingerprint: str = None) -> bool:
+                    fingerprint: int = None) -> bool:
         """중복 여부 확인"""
-        if post_id and post_id in self.collected_post_ids:
+        if post_id and self.index.contains('post_id', post_id):
             return True
-        if url and url in self.collected_urls:
+        if url and self.index.contains('url', url):
             return True
-        if fingerprint and fingerprint in self.collected_fingerprints:
+        if fingerprint is not None and self.index.contains('fingerprint', str(fingerprint)):
             return True
         return False
     
-    def add(self, post_id: str = None, url: str = None, fingerprint: str = None):
-        """수집 데이터 추가"""
-        if post_id:
-            self.collected_post_ids.add(post_id)
-        if url:
-            self.collected_urls.add(url)
-        if fingerprint:
-            self.collected_fingerprints.add(fingerprint)
+    def is_near_duplicate(self, simhash: Optional[int]) -> bool:
+        """v9.2: 본문이 거의 같은 게시물이 이미 있는지 확인 (템플릿 복붙 등)"""
+        if simhash is None or not NEAR_DUP_ENABLED:
+            return False
+        return bool(self.index.find_similar(simhash))
+    
+    def add(self, post_id: str = None, url: str = None, fingerprint: int = None,
+            simhash: int = None):
+        """수집 데이터 추가 (v9.2: 인덱스에 즉시 기록)"""
+        items = [(kind, value) for kind, value in
+                 (('post_id', post_id), ('url', url)) if value]
+        if fingerprint is not None:
+            items.append(('fingerprint', str(fingerprint)))
+        if items:
+            self.index.add_many(items)
+        if simhash is not None:
+            self.index.add_simhash(simhash)
+    
+    def close(self):
+        self.index.close()
     
     def analyze_partner_id(self, partner_id: str):
         """후원번호 패턴 분석"""
@@ -544,11 +1074,38 @@ def normalize_blog_url(blog_id: str, post_id: str) -> str:
     """블로그 URL 정규화"""
     return f"https://blog.naver.com/{blog_id}/{post_id}"
 
-def generate_post_fingerprint(post_data: Dict) -> str:
-    """게시물 고유 지문 생성 (중복 방지)"""
+def generate_post_fingerprint(post_data: Dict) -> int:
+    """게시물 고유 지문 생성 (중복 방지, v9.2: 64비트 해시)"""
     title = post_data.get('title', '')
     content = post_data.get('content', '')[:200]
-    return f"{title}_{content}"
+    return hash_key('fingerprint', f"{title}_{content}")
+
+def generate_content_simhash(content: str) -> Optional[int]:
+    """v9.2: 본문 SimHash (64비트, 문자 n-gram 기준)
+    
+    공백을 정리한 본문을 NEAR_DUP_SHINGLE_SIZE 글자씩 잘라 해시한 뒤 비트별 가중 합의
+    부호로 만든다. 일부 문장만 바뀐 게시물은 해밍 거리가 작게 나온다.
+    본문이 너무 짧으면 None (오탐 방지).
+    """
+    text = re.sub(r'\s+', ' ', content or '').strip()
+    if len(text) < NEAR_DUP_MIN_LENGTH:
+        return None
+    
+    shingles = {text[i:i + NEAR_DUP_SHINGLE_SIZE] for i in range(len(text) - NEAR_DUP_SHINGLE_SIZE + 1)}
+    hashes = np.fromiter(
+        (int.from_bytes(hashlib.blake2b(shingle.encode('utf-8'), digest_size=8).digest(), 'big')
+         for shingle in shingles),
+        dtype=np.uint64, count=len(shingles)
+    )
+    
+    bits = (hashes[:, None] >> np.arange(64, dtype=np.uint64)) & np.uint64(1)
+    votes = bits.sum(axis=0).astype(np.int64) * 2 - len(hashes)
+    
+    simhash = 0
+    for position in np.nonzero(votes > 0)[0]:
+        simhash |= 1 << int(position)
+    # SQLite INTEGER 범위로 변환
+    return simhash - (1 << 64) if simhash >= (1 << 63) else simhash
 
 def extract_blog_info_from_url(url: str) -> Optional[Dict[str, str]]:
     """URL에서 blog_id와 post_id 추출"""
@@ -580,20 +1137,129 @@ def clean_text(text: str) -> str:
     text = re.sub(r'[\r\n\t]', ' ', text)
     return text.strip()
 
+# ===========================
+# v9.2: 필터 엔진
+# ===========================
+
+class KeywordMatcher:
+    """여러 키워드를 한 번에 찾는 매처 (결과는 "키워드 in text"를 키워드마다 반복한 것과 동일)
+    
+    - pyahocorasick 설치 시: Aho-Corasick 오토마톤으로 텍스트 1회 스캔 (겹치는 키워드 포함)
+    - 미설치 시: 키워드별 부분 문자열 검색 (CPython의 C 구현이 정규식 alternation 1회 스캔보다 빠름)
+    """
+    
+    def __init__(self, keywords: List[str], ignore_case: bool = False):
+        self.keywords = list(dict.fromkeys(keywords))
+        self.ignore_case = ignore_case
+        self._keys = [(keyword.lower() if ignore_case else keyword, keyword) for keyword in self.keywords]
+        
+        self.automaton = None
+        if ahocorasick is not None and self._keys:
+            self.automaton = ahocorasick.Automaton()
+            for key, keyword in self._keys:
+                self.automaton.add_word(key, keyword)
+            self.automaton.make_automaton()
+    
+    def find_all(self, text: str) -> Set[str]:
+        """텍스트에 포함된 모든 키워드"""
+        if not text:
+            return set()
+        if self.ignore_case:
+            text = text.lower()
+        
+        if self.automaton is not None:
+            return {keyword for _, keyword in self.automaton.iter(text)}
+        return {keyword for key, keyword in self._keys if key in text}
+    
+    def contains_any(self, text: str) -> bool:
+        if not text:
+            return False
+        if self.ignore_case:
+            text = text.lower()
+        
+        if self.automaton is not None:
+            return next(self.automaton.iter(text), None) is not None
+        return any(key in text for key, _ in self._keys)
+
+class ContentFilter:
+    """config.yaml filters 섹션으로 한 번만 만드는 필터 엔진
+    
+    evaluate()는 적용된 규칙과 찾은 키워드를 모두 반환하여,
+    수집 후 아카이브 재필터링(evaluate_frame)에도 그대로 사용한다.
+    """
+    
+    EXCLUDE_KEYWORD_LIMIT = 2  # 제외 키워드 N개 이상이면 제외
+    
+    def __init__(self, filters_config: Dict):
+        self.excluded_blog_ids = set(filters_config['excluded_blog_ids'])
+        self.exclude_matcher = KeywordMatcher(filters_config['exclude_keywords'])
+        self.brand_matcher = KeywordMatcher(filters_config['pm_brand_keywords'], ignore_case=True)
+        self.media_title_pattern = re.compile(
+            '|'.join(f'(?:{pattern})' for pattern in filters_config['media_title_patterns'])
+        ) if filters_config['media_title_patterns'] else None
+    
+    def is_media_style_title(self, title: str) -> bool:
+        return bool(self.media_title_pattern and self.media_title_pattern.search(title))
+    
+    def evaluate(self, title: str, full_text: str, blog_id: str) -> Dict:
+        """모든 규칙 검사 결과
+        
+        Returns:
+            {'passes', 'reason', 'excluded_blog', 'exclude_hits', 'brand_hits', 'media_title'}
+            reason은 content_passes_filter()와 같은 순서(블로그 → 제외 키워드 → 브랜드 → 제목)로 결정
+        """
+        excluded_blog = blog_id in self.excluded_blog_ids
+        exclude_hits = self.exclude_matcher.find_all(full_text)
+        brand_hits = self.brand_matcher.find_all(full_text)
+        media_title = self.is_media_style_title(title)
+        
+        if excluded_blog:
+            reason = f"제외 대상 블로그: {blog_id}"
+        elif len(exclude_hits) >= self.EXCLUDE_KEYWORD_LIMIT:
+            reason = f"제외 키워드 {len(exclude_hits)}개 발견"
+        elif not brand_hits:
+            reason = "PM 브랜드 키워드 없음"
+        elif media_title:
+            reason = "언론 스타일 제목"
+        else:
+            reason = ""
+        
+        return {
+            'passes': not reason,
+            'reason': reason,
+            'excluded_blog': excluded_blog,
+            'exclude_hits': sorted(exclude_hits),
+            'brand_hits': sorted(brand_hits),
+            'media_title': media_title,
+        }
+    
+    def evaluate_frame(self, df: pd.DataFrame) -> pd.DataFrame:
+        """수집 결과 DataFrame 재필터링 (title, content, blog_id 컬럼 사용)
+        
+        Returns:
+            df와 같은 인덱스의 규칙 검사 결과 DataFrame
+        """
+        titles = df['title'].fillna('').astype(str)
+        contents = df['content'].fillna('').astype(str)
+        blog_ids = df['blog_id'].fillna('').astype(str)
+        
+        results = [self.evaluate(title, f"{title} {content}", blog_id)
+                   for title, content, blog_id in zip(titles, contents, blog_ids)]
+        return pd.DataFrame(results, index=df.index)
+
+CONTENT_FILTER = ContentFilter(CONFIG['filters'])
+
 # ===========================
 # v7.4: 필터링 함수들
 # ===========================
 
 def is_excluded_blog(blog_id: str) -> bool:
     """제외 대상 블로그인지 확인 (v7.4)"""
-    return blog_id in EXCLUDED_BLOG_IDS
+    return blog_id in CONTENT_FILTER.excluded_blog_ids
 
 def is_media_style_title(title: str) -> bool:
-    """언론 스타일 제목인지 확인 (v7.4)"""
-    for pattern in MEDIA_TITLE_PATTERNS:
-        if re.search(pattern, title):
-            return True
-    return False
+    """언론 스타일 제목인지 확인 (v7.4, v9.2: 미리 컴파일한 패턴 사용)"""
+    return CONTENT_FILTER.is_media_style_title(title)
 
 # ===========================
 # 날짜+시간 추출 함수
@@ -636,27 +1302,40 @@ def parse_published_date(date_text: str) -> str:
 # 데이터 추출 함수
 # ===========================
 
+# v9.2: 추천인 추출 패턴 (우선순위 순서, 모듈 로드 시 1회 컴파일)
+SPONSOR_PHONE_PATTERNS = [
+    ('phone', re.compile(r'010[-\s]?\d{4}[-\s]?\d{4}')),
+    ('phone_after_sponsor', re.compile(r'추천인.*?010[-\s]?\d{4}[-\s]?\d{4}')),
+    ('phone_after_inquiry', re.compile(r'문의.*?010[-\s]?\d{4}[-\s]?\d{4}')),
+    ('phone_after_contact', re.compile(r'연락처.*?010[-\s]?\d{4}[-\s]?\d{4}')),
+]
+
+SPONSOR_PARTNER_ID_PATTERNS = [
+    ('partner_id_after_sponsor', re.compile(r'추천인\s*(?:코드|번호|ID)?\s*[:：]?\s*(\d{7,8})\b')),
+    ('partner_id_after_partner', re.compile(r'파트너\s*(?:코드|번호|ID)?\s*[:：]?\s*(\d{7,8})\b')),
+    ('partner_id_after_register', re.compile(r'등록\s*(?:코드|번호|ID)?\s*[:：]?\s*(\d{7,8})\b')),
+    ('partner_id_bare', re.compile(r'\b(\d{7,8})\b')),
+]
+
+def normalize_sponsor_phone(phone: str) -> str:
+    """010-xxxx-xxxx 형식으로 정규화 (010으로 시작하는 11자리가 아니면 빈 문자열)"""
+    digits = re.sub(r'\D', '', phone)
+    if digits.startswith('010') and len(digits) == 11:
+        return f"{digits[:3]}-{digits[3:7]}-{digits[7:]}"
+    return ""
+
 def extract_sponsor_phone(text: str) -> str:
     """추천인 전화번호 추출"""
     if not text:
         return ""
     
     # 010-xxxx-xxxx 형식만 수집
-    phone_patterns = [
-        r'010[-\s]?\d{4}[-\s]?\d{4}',
-        r'추천인.*?010[-\s]?\d{4}[-\s]?\d{4}',
-        r'문의.*?010[-\s]?\d{4}[-\s]?\d{4}',
-        r'연락처.*?010[-\s]?\d{4}[-\s]?\d{4}',
-    ]
-    
-    for pattern in phone_patterns:
-        match = re.search(pattern, text)
+    for _, pattern in SPONSOR_PHONE_PATTERNS:
+        match = pattern.search(text)
         if match:
-            phone = match.group(0)
-            # 숫자만 추출 후 010으로 시작하는지 확인
-            digits = re.sub(r'\D', '', phone)
-            if digits.startswith('010') and len(digits) == 11:
-                return f"{digits[:3]}-{digits[3:7]}-{digits[7:]}"
+            phone = normalize_sponsor_phone(match.group(0))
+            if phone:
+                return phone
     
     return ""
 
@@ -665,23 +1344,98 @@ def extract_sponsor_partner_id(text: str) -> str:
     if not text:
         return ""
     
-    # 7-8자리 숫자 추출
-    partner_patterns = [
-        r'추천인\s*(?:코드|번호|ID)?\s*[:：]?\s*(\d{7,8})\b',
-        r'파트너\s*(?:코드|번호|ID)?\s*[:：]?\s*(\d{7,8})\b',
-        r'등록\s*(?:코드|번호|ID)?\s*[:：]?\s*(\d{7,8})\b',
-        r'\b(\d{7,8})\b',
-    ]
-    
-    for pattern in partner_patterns:
-        matches = re.findall(pattern, text)
-        for match in matches:
-            # 7-8자리인지 확인
-            if len(match) in [7, 8]:
-                return match
+    for _, pattern in SPONSOR_PARTNER_ID_PATTERNS:
+        match = pattern.search(text)
+        if match:
+            return match.group(1)
     
     return ""
 
+def _extract_first_rule(texts: pd.Series, rules: List[Tuple[str, re.Pattern]],
+                        normalize=None) -> pd.DataFrame:
+    """규칙을 우선순위 순서로 적용해 행마다 처음 성공한 규칙의 값/규칙명/매칭 문자열 반환
+    
+    각 규칙은 아직 값이 없는 행에만 .str.extract로 한 번에 적용한다.
+    """
+    result = pd.DataFrame({'value': '', 'rule': '', 'match': ''}, index=texts.index)
+    remaining = texts
+    
+    for rule_name, pattern in rules:
+        if remaining.empty:
+            break
+        
+        # 전체 매칭 문자열(provenance)과 값 그룹을 함께 추출
+        value_group = 1 if pattern.groups else 0
+        extracted = remaining.str.extract(f'(?P<match>{pattern.pattern})', flags=pattern.flags)
+        matched = extracted['match'].dropna()
+        if matched.empty:
+            continue
+        
+        values = extracted.loc[matched.index, extracted.columns[value_group]]
+        if normalize is not None:
+            values = values.map(normalize)
+        values = values[values != '']
+        
+        result.loc[values.index, 'value'] = values
+        result.loc[values.index, 'rule'] = rule_name
+        result.loc[values.index, 'match'] = matched[values.index]
+        remaining = remaining.drop(values.index)
+    
+    return result
+
+def reextract_sponsor_info(df: pd.DataFrame) -> pd.DataFrame:
+    """저장된 수집 결과에서 추천인 정보 일괄 재추출 (v9.2)
+    
+    크롤링 때와 같은 full_text(title + content)에 같은 패턴을 적용하므로,
+    패턴 수정 후 재크롤링 없이 sponsor_phone/sponsor_partner_id를 갱신할 수 있다.
+    
+    Returns:
+        sponsor_phone, sponsor_partner_id를 덮어쓰고
+        *_rule(적용된 패턴 이름), *_match(매칭된 원문) 컬럼을 추가한 DataFrame
+    """
+    df = df.copy()
+    full_text = df['title'].fillna('').astype(str) + ' ' + df['content'].fillna('').astype(str)
+    
+    phone = _extract_first_rule(full_text, SPONSOR_PHONE_PATTERNS, normalize_sponsor_phone)
+    partner_id = _extract_first_rule(full_text, SPONSOR_PARTNER_ID_PATTERNS)
+    
+    for column, extracted in (('sponsor_phone', phone), ('sponsor_partner_id', partner_id)):
+        df[column] = extracted['value']
+        df[f'{column}_rule'] = extracted['rule']
+        df[f'{column}_match'] = extracted['match']
+    
+    return df
+
+def reextract_sponsor_file(input_path: str, output_path: Optional[str] = None) -> pd.DataFrame:
+    """CSV/Parquet 수집 결과 파일의 추천인 정보 재추출 후 저장
+    
+    output_path를 생략하면 입력 파일에 덮어쓴다. 형식은 확장자(.parquet/.csv)로 결정.
+    """
+    output_path = output_path or input_path
+    
+    if Path(input_path).suffix == '.parquet':
+        df = pd.read_parquet(input_path)
+    else:
+        df = pd.read_csv(input_path, encoding='utf-8-sig', dtype={'sponsor_partner_id': str})
+    
+    before_phone = df.get('sponsor_phone', pd.Series('', index=df.index)).fillna('').astype(str)
+    before_partner = df.get('sponsor_partner_id', pd.Series('', index=df.index)).fillna('').astype(str)
+    
+    start = time.time()
+    df = reextract_sponsor_info(df)
+    elapsed = time.time() - start
+    
+    if Path(output_path).suffix == '.parquet':
+        df.to_parquet(output_path, index=False)
+    else:
+        df.to_csv(output_path, index=False, encoding='utf-8-sig')
+    
+    logger.info(f"🔁 추천인 정보 재추출: {len(df):,}개 게시물 ({elapsed:.1f}초) → {output_path}")
+    logger.info(f"   - 전화번호 변경: {(df['sponsor_phone'] != before_phone).sum():,}개")
+    logger.info(f"   - 파트너 ID 변경: {(df['sponsor_partner_id'] != before_partner).sum():,}개")
+    
+    return df
+
 def extract_hashtags(soup: BeautifulSoup, content_text: str) -> str:
     """해시태그 추출 (v7.5: 메타 태그 필터링 강화)"""
     hashtags = set()
@@ -719,10 +1473,11 @@ def extract_image_urls(soup: BeautifulSoup) -> str:
     img_elements = soup.select('img[src], img[data-src], .se-image-resource')
     
     for img in img_elements:
-        src = img.get('src') or img.get('data-src') or img.get('data-lazy-src')
+        # 지연 로딩 이미지는 src가 흐린 썸네일(?type=w80_blur)이므로 data-lazy-src 우선
+        src = img.get('data-lazy-src') or img.get('data-src') or img.get('src')
         if src and ('blogfiles.naver.net' in src or 'pstatic.net' in src):
-            # 썸네일이 아닌 원본 이미지 URL로 변환
-            src = re.sub(r'\?type=\w\d+', '', src)
+            # 썸네일이 아닌 원본 이미지 URL로 변환 (type=w80_blur 등 접미사까지 제거)
+            src = re.sub(r'\?type=\w+', '', src)
             image_urls.add(src)
     
     return ', '.join(list(image_urls)[:10]) if image_urls else ""
@@ -759,108 +1514,129 @@ def extract_video_urls(soup: BeautifulSoup) -> str:
     
     return ', '.join(list(video_urls)[:10]) if video_urls else ""
 
-def extract_like_count(driver: webdriver.Chrome, soup: BeautifulSoup) -> int:
-    """좋아요 수 추출"""
-    try:
-        # 방법 1: Selenium으로 추출
-        like_selectors = [
-            '.btn_empathy .count',
-            '.area_like .count',
-            'em.u_cnt._count',
-            '.btn_like .count'
-        ]
-        
-        for selector in like_selectors:
-            try:
-                elem = driver.find_element(By.CSS_SELECTOR, selector)
-                like_text = elem.text.strip()
-                like_count = int(re.sub(r'\D', '', like_text))
-                if like_count > 0:
-                    return like_count
-            except:
-                continue
-        
-        # 방법 2: BeautifulSoup으로 추출
-        page_text = soup.get_text()
-        like_patterns = [
-            r'공감\s*(\d+)',
-            r'좋아요\s*(\d+)',
-            r'empathy.*?(\d+)'
-        ]
-        for pattern in like_patterns:
-            match = re.search(pattern, page_text, re.IGNORECASE)
-            if match:
-                return int(match.group(1))
-        
-        return 0
-    except Exception as e:
-        logger.debug(f"좋아요 수 추출 실패: {str(e)}")
-        return 0
+# v9.2: 좋아요/댓글 수 선택자 (브라우저: 페이지 내 JavaScript 1회 호출로 조회, 정적 HTML: extract_counts_from_soup)
+LIKE_COUNT_SELECTORS = [
+    '.btn_empathy .count',
+    '.area_like .count',
+    'em.u_cnt._count',
+    '.btn_like .count'
+]
+
+COMMENT_COUNT_SELECTORS = [
+    '.btn_comment em.u_cnt',  # 댓글 버튼의 카운트만
+    'a.btn_comment .count',
+    '.comment_count',
+    '.cmt_count',
+    'span[class*="comment"] em.u_cnt'
+]
+
+COMMENT_ITEM_SELECTOR = '.se-comment-item, .comment_list .comment_item, #comment_list .comment_item'
+
+PAGE_COUNTERS_SCRIPT = """
+const textOf = (selector) => {
+    const elem = document.querySelector(selector);
+    return elem ? elem.innerText : null;
+};
+return {
+    like: arguments[0].map(textOf),
+    comment: arguments[1].map(textOf),
+    comment_items: document.querySelectorAll(arguments[2]).length
+};
+"""
 
-def extract_comment_count(driver: webdriver.Chrome, soup: BeautifulSoup) -> int:
-    """댓글 수 추출 (v7.5: 정확도 개선)"""
+def read_page_counters(driver: webdriver.Chrome) -> Dict:
+    """좋아요/댓글 선택자 텍스트와 댓글 목록 개수를 한 번의 execute_script로 조회
+    
+    Returns:
+        {'like': [선택자별 텍스트 또는 None], 'comment': [...], 'comment_items': int}
+        조회 실패 시 빈 dict (페이지 텍스트 검색으로 대체)
+    """
     try:
-        # 방법 1: 댓글 영역 특정 선택자 (가장 정확)
-        comment_specific_selectors = [
-            '.btn_comment em.u_cnt',  # 댓글 버튼의 카운트만
-            'a.btn_comment .count',
-            '.comment_count',
-            '.cmt_count',
-            'span[class*="comment"] em.u_cnt'
-        ]
-        
-        for selector in comment_specific_selectors:
-            try:
-                elem = driver.find_element(By.CSS_SELECTOR, selector)
-                comment_text = elem.text.strip()
-                # 숫자만 추출
-                numbers = re.findall(r'\d+', comment_text)
-                if numbers:
-                    count = int(numbers[0])
-                    # 비정상적으로 큰 숫자 필터링 (연도 등)
-                    if count < 10000:
-                        return count
-            except:
-                continue
-        
-        # 방법 2: 댓글 목록에서 직접 카운트
-        try:
-            comment_list = driver.find_elements(By.CSS_SELECTOR, '.se-comment-item, .comment_list .comment_item, #comment_list .comment_item')
-            if comment_list:
-                return len(comment_list)
-        except:
-            pass
-        
-        # 방법 3: BeautifulSoup으로 댓글 영역에서만 추출 (좁은 범위)
-        comment_area = soup.select_one('.se-comment-area, .comment_area, #comment, .comment-area')
-        if comment_area:
-            # "댓글 N개" 패턴
-            text = comment_area.get_text()
-            match = re.search(r'댓글\s*(\d+)', text)
-            if match:
-                count = int(match.group(1))
-                if count < 10000:
-                    return count
-        
-        # 방법 4: 전체 페이지에서 검색 (최후 수단)
+        return driver.execute_script(PAGE_COUNTERS_SCRIPT, LIKE_COUNT_SELECTORS,
+                                     COMMENT_COUNT_SELECTORS, COMMENT_ITEM_SELECTOR) or {}
+    except WebDriverException as e:
+        logger.debug(f"카운터 스크립트 실패: {str(e)}")
+        return {}
+
+def extract_like_count(counters: Dict, page_text: Optional[str]) -> Optional[int]:
+    """좋아요 수 추출 (page_text가 None이면 선택자 결과만 사용, 못 찾으면 None)"""
+    # 방법 1: 선택자 텍스트
+    for like_text in counters.get('like') or []:
+        digits = re.sub(r'\D', '', (like_text or '').strip())
+        if digits and int(digits) > 0:
+            return int(digits)
+    
+    if page_text is None:
+        return None
+    
+    # 방법 2: 페이지 텍스트에서 추출
+    like_patterns = [
+        r'공감\s*(\d+)',
+        r'좋아요\s*(\d+)',
+        r'empathy.*?(\d+)'
+    ]
+    for pattern in like_patterns:
+        match = re.search(pattern, page_text, re.IGNORECASE)
+        if match:
+            return int(match.group(1))
+    
+    return 0
+
+def extract_comment_count(counters: Dict, soup: BeautifulSoup, page_text: Optional[str]) -> Optional[int]:
+    """댓글 수 추출 (v7.5: 정확도 개선, page_text가 None이면 페이지 전체 검색 생략)"""
+    # 방법 1: 댓글 영역 특정 선택자 (가장 정확)
+    for comment_text in counters.get('comment') or []:
+        numbers = re.findall(r'\d+', (comment_text or '').strip())
+        # 비정상적으로 큰 숫자 필터링 (연도 등)
+        if numbers and int(numbers[0]) < 10000:
+            return int(numbers[0])
+    
+    # 방법 2: 댓글 목록에서 직접 카운트
+    if counters.get('comment_items'):
+        return counters['comment_items']
+    
+    # 방법 3: 댓글 영역에서만 추출 (좁은 범위)
+    comment_area = soup.select_one('.se-comment-area, .comment_area, #comment, .comment-area')
+    if comment_area:
+        # "댓글 N개" 패턴
+        match = re.search(r'댓글\s*(\d+)', comment_area.get_text())
+        if match:
+            count = int(match.group(1))
+            if count < 10000:
+                return count
+    
+    if page_text is None:
+        return None
+    
+    # 방법 4: 전체 페이지에서 검색 (최후 수단)
+    patterns = [
+        r'댓글\s*(\d{1,3})\s*개',  # "댓글 N개" (최대 3자리)
+        r'댓글\s*(\d{1,3})(?!\d)',  # "댓글 N" (뒤에 숫자 없음)
+    ]
+    for pattern in patterns:
+        match = re.search(pattern, page_text)
+        if match:
+            count = int(match.group(1))
+            # 연도나 큰 숫자 필터링
+            if count < 1000:
+                return count
+    
+    return 0
+
+def extract_engagement_counts(driver: webdriver.Chrome, soup: BeautifulSoup) -> Tuple[int, int]:
+    """좋아요/댓글 수 추출 (v9.2: 스크립트 1회 호출, 페이지 텍스트는 필요할 때 1회만 생성)"""
+    counters = read_page_counters(driver)
+    like_count = extract_like_count(counters, None)
+    comment_count = extract_comment_count(counters, soup, None)
+    
+    if like_count is None or comment_count is None:
         page_text = soup.get_text()
-        # 좁은 패턴 먼저 시도
-        patterns = [
-            r'댓글\s*(\d{1,3})\s*개',  # "댓글 N개" (최대 3자리)
-            r'댓글\s*(\d{1,3})(?!\d)',  # "댓글 N" (뒤에 숫자 없음)
-        ]
-        for pattern in patterns:
-            match = re.search(pattern, page_text)
-            if match:
-                count = int(match.group(1))
-                # 연도나 큰 숫자 필터링
-                if count < 1000:
-                    return count
-        
-        return 0
-    except Exception as e:
-        logger.debug(f"댓글 수 추출 실패: {str(e)}")
-        return 0
+        if like_count is None:
+            like_count = extract_like_count(counters, page_text)
+        if comment_count is None:
+            comment_count = extract_comment_count(counters, soup, page_text)
+    
+    return like_count, comment_count
 
 # ===========================
 # v7.4: 다층 필터링 함수
@@ -884,15 +1660,13 @@ def content_passes_filter(title: str, content: str, full_text: str,
     if is_excluded_blog(blog_id):
         return False, f"제외 대상 블로그: {blog_id}"
     
-    # 제외 키워드 체크 (2개 이상 시 제외)
-    exclude_count = sum(1 for keyword in EXCLUDE_KEYWORDS if keyword in full_text)
-    if exclude_count >= 2:
+    # 제외 키워드 체크 (2개 이상 시 제외, v9.2: 1회 스캔)
+    exclude_count = len(CONTENT_FILTER.exclude_matcher.find_all(full_text))
+    if exclude_count >= ContentFilter.EXCLUDE_KEYWORD_LIMIT:
         return False, f"제외 키워드 {exclude_count}개 발견"
     
     # [단계 2] PM 브랜드 키워드 체크
-    text_lower = full_text.lower()
-    has_pm_keyword = any(keyword.lower() in text_lower for keyword in PM_BRAND_KEYWORDS)
-    if not has_pm_keyword:
+    if not CONTENT_FILTER.brand_matcher.contains_any(full_text):
         return False, "PM 브랜드 키워드 없음"
     
     # [단계 3] 언론 스타일 제목 체크
@@ -908,8 +1682,8 @@ def content_passes_filter(title: str, content: str, full_text: str,
 # Selenium 드라이버 설정
 # ===========================
 
-def setup_driver() -> webdriver.Chrome:
-    """Selenium 드라이버 설정"""
+def setup_driver(worker_id: int = 0) -> webdriver.Chrome:
+    """Selenium 드라이버 설정 (v9.2: 워커별 디버깅 포트/프로세스 모드)"""
     chrome_options = Options()
     chrome_options.add_argument('--headless')
     chrome_options.add_argument('--no-sandbox')
@@ -921,9 +1695,11 @@ def setup_driver() -> webdriver.Chrome:
     chrome_options.add_experimental_option('useAutomationExtension', False)
     
     # VM 환경 추가 설정 (DevToolsActivePort 오류 해결)
-    chrome_options.add_argument('--remote-debugging-port=9222')
+    # v9.2: 여러 드라이버가 동시에 뜰 수 있도록 워커마다 다른 포트 사용
+    chrome_options.add_argument(f'--remote-debugging-port={DRIVER_DEBUG_PORT_BASE + worker_id}')
     chrome_options.add_argument('--disable-setuid-sandbox')
-    chrome_options.add_argument('--single-process')  # 멀티프로세스 환경에서 안정성 향상
+    if DRIVER_SINGLE_PROCESS and NUM_WORKERS == 1:
+        chrome_options.add_argument('--single-process')  # 단일 드라이버 환경에서 안정성 향상
     
     # 메모리 최적화
     chrome_options.add_argument('--disable-extensions')
@@ -935,6 +1711,10 @@ def setup_driver() -> webdriver.Chrome:
     user_agent = random.choice(USER_AGENTS)
     chrome_options.add_argument(f'user-agent={user_agent}')
     
+    # v9.2: 전송량 집계용 성능 로그 (Network 이벤트)
+    if RESOURCE_BLOCKING and RESOURCE_TRACK_BYTES:
+        chrome_options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+    
     # Selenium 4.6+ 자동 드라이버 관리 사용 (ChromeDriver 버전 자동 매칭)
     try:
         driver = webdriver.Chrome(options=chrome_options)
@@ -954,18 +1734,150 @@ def setup_driver() -> webdriver.Chrome:
         '''
     })
     
+    # v9.2: 본문 문서/mainFrame/카운터 XHR 외 리소스 차단
+    if RESOURCE_BLOCKING:
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_URL_PATTERNS})
+    
     return driver
 
+class ResourceStats:
+    """드라이버 성능 로그에서 페이지별 전송량/차단 요청 수 집계 (v9.2, 워커 공용)"""
+    
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.pages = 0
+        self.requests = 0
+        self.bytes_loaded = 0
+        self.blocked = 0
+    
+    def collect(self, driver: webdriver.Chrome):
+        """마지막 수집 이후 쌓인 Network 이벤트 반영 (로그는 읽으면 비워짐)"""
+        requests_count = bytes_loaded = blocked = 0
+        try:
+            entries = driver.get_log('performance')
+        except WebDriverException:
+            return
+        
+        for entry in entries:
+            message = json.loads(entry['message'])['message']
+            method = message.get('method')
+            if method == 'Network.loadingFinished':
+                requests_count += 1
+                bytes_loaded += int(message['params'].get('encodedDataLength', 0))
+            elif method == 'Network.loadingFailed' and message['params'].get('blockedReason'):
+                blocked += 1
+        
+        with self.lock:
+            self.pages += 1
+            self.requests += requests_count
+            self.bytes_loaded += bytes_loaded
+            self.blocked += blocked
+    
+    def print_summary(self):
+        if not self.pages:
+            return
+        logger.info("📉 리소스 차단:")
+        logger.info(f"   - 페이지: {self.pages:,}개")
+        logger.info(f"   - 페이지당 전송량: {self.bytes_loaded / self.pages / 1024:.1f}KB "
+                    f"(요청 {self.requests / self.pages:.1f}개)")
+        logger.info(f"   - 페이지당 차단 요청: {self.blocked / self.pages:.1f}개 (총 {self.blocked:,}개)")
+
+RESOURCE_STATS = ResourceStats()
+
 # ===========================
-# 검색 함수
+# v9.2: 속도 제한 (토큰 버킷)
 # ===========================
 
-def search_naver_blog_api(keyword: str, display: int = 100, start: int = 1) -> Optional[Dict]:
-    """Naver Open Search API를 사용하여 블로그 검색"""
-    if not NAVER_CLIENT_ID or not NAVER_CLIENT_SECRET:
-        logger.warning("⚠️  Naver API 키가 없습니다. 스크래핑 방식으로 폴백합니다.")
-        return None
+class TokenBucket:
+    """토큰 버킷 속도 제한기 (스레드/asyncio 공용)
+    
+    초당 rate개씩 토큰이 채워지고 최대 capacity개까지 쌓인다.
+    토큰이 부족하면 음수로 예약하여 요청 순서대로 대기 시간이 늘어난다.
+    """
     
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def _reserve(self) -> float:
+        """토큰 1개 예약 후 대기해야 할 시간(초) 반환"""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            if self.tokens >= 0:
+                return 0.0
+            return -self.tokens / self.rate
+    
+    def acquire(self):
+        """토큰 1개 획득 (스레드용, 필요 시 대기)"""
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+    
+    async def acquire_async(self):
+        """토큰 1개 획득 (asyncio용, 필요 시 대기)"""
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+class HostRateLimiter:
+    """호스트별 동시 연결 수(세마포어) + 초당 요청 수(토큰 버킷) 제한"""
+    
+    def __init__(self, host_settings: Dict[str, Dict], default_settings: Dict):
+        self.host_settings = host_settings
+        self.default_settings = default_settings
+        self.semaphores = {}
+        self.buckets = {}
+    
+    def _settings(self, host: str) -> Dict:
+        return self.host_settings.get(host, self.default_settings)
+    
+    def bucket(self, host: str) -> TokenBucket:
+        if host not in self.buckets:
+            self.buckets[host] = TokenBucket(self._settings(host)['rate_per_second'])
+        return self.buckets[host]
+    
+    @contextlib.asynccontextmanager
+    async def limit(self, url: str):
+        host = urlparse(url).hostname or ''
+        if host not in self.semaphores:
+            self.semaphores[host] = asyncio.BoundedSemaphore(self._settings(host)['concurrency'])
+        async with self.semaphores[host]:
+            await self.bucket(host).acquire_async()
+            yield
+
+class ApiCallBudget:
+    """실행당 Open API 호출 한도 (일일 쿼터 보호, 스레드 공용)"""
+    
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.used = 0
+        self._lock = threading.Lock()
+    
+    def take(self) -> bool:
+        """호출 1회 차감 (한도 초과 시 False)"""
+        with self._lock:
+            if self.used >= self.limit:
+                return False
+            self.used += 1
+            return True
+
+# v9.2: API 속도 제한(동기 검색 경로) / 호출 한도(동기·비동기 엔진 공용)
+API_RATE_LIMITER = TokenBucket(SEARCH_API_RATE)
+API_CALL_BUDGET = ApiCallBudget(SEARCH_API_CALL_BUDGET)
+
+# ===========================
+# 검색 함수
+# ===========================
+
+def build_api_request(keyword: str, display: int = 100, start: int = 1) -> Tuple[str, Dict, Dict]:
+    """Open API 요청 URL/헤더/파라미터 (v9.2: 동기/비동기 공용)"""
     # display는 최대 100개로 제한
     display = min(display, 100)
     
@@ -981,6 +1893,21 @@ def search_naver_blog_api(keyword: str, display: int = 100, start: int = 1) -> O
         "start": start,
         "sort": "date"  # v8.1: 최신순 정렬 (기간 다양성 확보)
     }
+    return url, headers, params
+
+def search_naver_blog_api(keyword: str, display: int = 100, start: int = 1) -> Optional[Dict]:
+    """Naver Open Search API를 사용하여 블로그 검색"""
+    if not NAVER_CLIENT_ID or not NAVER_CLIENT_SECRET:
+        logger.warning("⚠️  Naver API 키가 없습니다. 스크래핑 방식으로 폴백합니다.")
+        return None
+    
+    # v9.2: 호출 한도 및 속도 제한 (키워드 동시 검색 시 공유)
+    if not API_CALL_BUDGET.take():
+        logger.warning(f"⚠️  API 호출 한도 도달 ({API_CALL_BUDGET.limit}회) - '{keyword}' 스크래핑으로 폴백")
+        return None
+    API_RATE_LIMITER.acquire()
+    
+    url, headers, params = build_api_request(keyword, display, start)
     
     logger.debug(f"API 요청: {url}")
     logger.debug(f"헤더: Client-Id={NAVER_CLIENT_ID[:10]}...")
@@ -1024,94 +1951,117 @@ def parse_search_results(search_data: Dict) -> List[Dict]:
     logger.info(f"🔍 검색 결과 파싱: {len(results)}개")
     return results
 
-def search_naver_blog_scraping(keyword: str, max_results: int = MAX_SEARCH_RESULTS) -> List[Dict]:
-    """웹 스크래핑을 사용한 블로그 검색 (폴백용)"""
-    results = []
-    page = 1
+def parse_scraping_page(soup: BeautifulSoup) -> List[Dict]:
+    """검색 결과 페이지 1개 파싱 (v9.2: 동기/비동기 스크래핑 공용)"""
+    page_results = []
     
-    while len(results) < max_results:
-        try:
-            start = (page - 1) * 10 + 1
-            search_url = f"https://search.naver.com/search.naver?where=blog&query={keyword}&start={start}"
+    # 검색 결과 추출 (다양한 선택자 시도)
+    blog_items = soup.select('.view_wrap, .total_wrap, .lst_total, .api_ani_send')
+    
+    # 선택자가 작동하지 않으면 직접 링크 찾기
+    if not blog_items:
+        blog_links = soup.select('a[href*="blog.naver.com"]')
+        logger.debug(f"직접 링크 검색: {len(blog_links)}개 발견")
+        
+        for link in blog_links:
+            url = link.get('href', '')
+            title = link.get_text(strip=True) or link.get('title', '')
+            
+            if 'blog.naver.com' in url and title:
+                blog_info = extract_blog_info_from_url(url)
+                if blog_info:
+                    page_results.append({
+                        'title': title,
+                        'url': url,
+                        'blog_id': blog_info['blog_id'],
+                        'post_id': blog_info['post_id']
+                    })
+        return page_results
+    
+    for item in blog_items:
+        title_elem = item.select_one('.title_link, .api_txt_lines')
+        url_elem = item.select_one('a.title_link, a.api_txt_lines')
+        
+        if title_elem and url_elem:
+            title = title_elem.get_text(strip=True)
+            url = url_elem.get('href', '')
             
+            if 'blog.naver.com' in url:
+                blog_info = extract_blog_info_from_url(url)
+                if blog_info:
+                    page_results.append({
+                        'title': title,
+                        'url': url,
+                        'blog_id': blog_info['blog_id'],
+                        'post_id': blog_info['post_id']
+                    })
+    return page_results
+
+def build_scraping_url(keyword: str, page: int) -> str:
+    start = (page - 1) * 10 + 1
+    return f"https://search.naver.com/search.naver?where=blog&query={keyword}&start={start}"
+
+def iter_search_naver_blog_scraping(keyword: str, max_results: int = MAX_SEARCH_RESULTS,
+                                    cursor: Optional[Dict] = None):
+    """웹 스크래핑을 사용한 블로그 검색 (폴백용, v9.2: 페이지 단위로 반환)
+    
+    Yields:
+        (페이지 결과, 다음 검색 위치) - 다음 검색 위치를 cursor로 넘기면 이어서 검색
+    """
+    collected = cursor['collected'] if cursor else 0
+    page = cursor['page'] if cursor else 1
+    
+    while collected < max_results:
+        try:
             headers = {
                 'User-Agent': random.choice(USER_AGENTS)
             }
             
-            response = requests.get(search_url, headers=headers, timeout=10)
+            response = requests.get(build_scraping_url(keyword, page), headers=headers, timeout=10)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # 검색 결과 추출 (다양한 선택자 시도)
-            blog_items = soup.select('.view_wrap, .total_wrap, .lst_total, .api_ani_send')
-            
-            # 선택자가 작동하지 않으면 직접 링크 찾기
-            if not blog_items:
-                blog_links = soup.select('a[href*="blog.naver.com"]')
-                logger.debug(f"직접 링크 검색: {len(blog_links)}개 발견")
-                
-                for link in blog_links:
-                    url = link.get('href', '')
-                    title = link.get_text(strip=True) or link.get('title', '')
-                    
-                    if 'blog.naver.com' in url and title:
-                        blog_info = extract_blog_info_from_url(url)
-                        if blog_info:
-                            results.append({
-                                'title': title,
-                                'url': url,
-                                'blog_id': blog_info['blog_id'],
-                                'post_id': blog_info['post_id']
-                            })
-                        
-                        if len(results) >= max_results:
-                            break
-                
-                if results:
-                    continue
-                else:
-                    logger.debug(f"페이지 {page}: 검색 결과 없음")
-                    break
-            
-            for item in blog_items:
-                title_elem = item.select_one('.title_link, .api_txt_lines')
-                url_elem = item.select_one('a.title_link, a.api_txt_lines')
-                
-                if title_elem and url_elem:
-                    title = title_elem.get_text(strip=True)
-                    url = url_elem.get('href', '')
-                    
-                    if 'blog.naver.com' in url:
-                        blog_info = extract_blog_info_from_url(url)
-                        if blog_info:
-                            results.append({
-                                'title': title,
-                                'url': url,
-                                'blog_id': blog_info['blog_id'],
-                                'post_id': blog_info['post_id']
-                            })
-                        
-                        if len(results) >= max_results:
-                            break
-            
-            page += 1
-            time.sleep(random.uniform(0.5, 1.0))
+            soup = BeautifulSoup(response.text, HTML_PARSER)
+            page_results = parse_scraping_page(soup)[:max_results - collected]
             
         except Exception as e:
             logger.error(f"스크래핑 검색 오류 (키워드: {keyword}, 페이지: {page}): {str(e)}")
             break
+        
+        if not page_results:
+            logger.debug(f"페이지 {page}: 검색 결과 없음")
+            break
+        
+        collected += len(page_results)
+        yield page_results, {'source': 'scraping', 'page': page + 1, 'collected': collected}
+        page += 1
+        time.sleep(random.uniform(0.5, 1.0))
     
-    logger.info(f"🔍 '{keyword}' 스크래핑 검색 결과: {len(results)}개")
-    return results
+    logger.info(f"🔍 '{keyword}' 스크래핑 검색 결과: {collected}개")
 
-def search_naver_blog(keyword: str, max_results: int = MAX_SEARCH_RESULTS) -> List[Dict]:
-    """네이버 블로그 검색 (v8.3: API 페이징 구현)"""
-    all_results = []
+def search_naver_blog_scraping(keyword: str, max_results: int = MAX_SEARCH_RESULTS) -> List[Dict]:
+    """웹 스크래핑을 사용한 블로그 검색 (폴백용)"""
+    return [result for page_results, _ in iter_search_naver_blog_scraping(keyword, max_results)
+            for result in page_results]
+
+def iter_search_naver_blog(keyword: str, max_results: int = MAX_SEARCH_RESULTS,
+                           cursor: Optional[Dict] = None):
+    """네이버 블로그 검색 (v9.2: API 페이지가 도착하는 대로 반환)
+    
+    소비 측이 중간에 멈추면 (키워드 목표 달성 등) 남은 API 호출도 하지 않는다.
+    
+    Yields:
+        (페이지 결과, 다음 검색 위치) - 저널에 기록해 두었다가 cursor로 넘기면 이어서 검색
+    """
+    if cursor and cursor['source'] == 'scraping':
+        yield from iter_search_naver_blog_scraping(keyword, max_results, cursor)
+        return
+    
+    total = cursor['collected'] if cursor else 0
+    first_start = cursor['start'] if cursor else 1
     
     # v8.3: API 페이징 (v6.1 방식)
     # display=100 (최대), start를 100씩 증가시켜 1000개까지 수집
-    for start in range(1, min(max_results, 1000) + 1, 100):
+    for start in range(first_start, min(max_results, 1000) + 1, 100):
         search_data = search_naver_blog_api(keyword, display=100, start=start)
         
         if not search_data:
@@ -1124,142 +2074,224 @@ def search_naver_blog(keyword: str, max_results: int = MAX_SEARCH_RESULTS) -> Li
             logger.debug(f"'{keyword}' 검색 결과 없음 (start={start})")
             break
         
-        all_results.extend(results)
-        logger.debug(f"'{keyword}' API 호출 {start//100 + 1}/10: +{len(results)}개 (누적: {len(all_results)}개)")
-        
-        # API 호출 간격 (Rate Limit 방지)
-        time.sleep(0.1)
+        total += len(results)
+        logger.debug(f"'{keyword}' API 호출 {start//100 + 1}/10: +{len(results)}개 (누적: {total}개)")
+        yield results, {'source': 'api', 'start': start + 100, 'collected': total}
         
         # 100개 미만이면 더 이상 결과 없음
         if len(results) < 100:
             break
     
-    if all_results:
-        logger.info(f"🔍 '{keyword}' API 검색 완료: {len(all_results)}개")
-        return all_results
+    if total:
+        logger.info(f"🔍 '{keyword}' API 검색 완료: {total}개")
+        return
     
     # 스크래핑 방식 폴백
     logger.warning(f"⚠️  '{keyword}' API 실패 - 스크래핑으로 폴백")
-    return search_naver_blog_scraping(keyword, max_results)
+    yield from iter_search_naver_blog_scraping(keyword, max_results)
+
+def search_naver_blog(keyword: str, max_results: int = MAX_SEARCH_RESULTS) -> List[Dict]:
+    """네이버 블로그 검색 (v8.3: API 페이징 구현)"""
+    return [result for page_results, _ in iter_search_naver_blog(keyword, max_results)
+            for result in page_results]
 
 # ===========================
 # 크롤링 함수
 # ===========================
 
-def crawl_blog_post_selenium(driver: webdriver.Chrome, url: str, blog_id: str, 
+def parse_post_soup(soup: BeautifulSoup, url: str, blog_id: str,
+                    post_id: str) -> Tuple[Optional[Dict], str]:
+    """게시물 HTML 파싱 및 필터링 (v9.2: Selenium/HTTP 공용)
+    
+    좋아요/댓글 수는 호출 측에서 채우며, 여기서는 None으로 둔다.
+    
+    Returns:
+        (post_data, 실패사유)
+    """
+    # 제목 추출
+    title = ""
+    title_selectors = [
+        '.se-title-text', '.pcol1', '.se_title', 
+        '.post-view .tit', '.tit_h3', 'h3.se_title'
+    ]
+    for selector in title_selectors:
+        title_elem = soup.select_one(selector)
+        if title_elem:
+            title = clean_text(title_elem.get_text())
+            break
+    
+    if not title:
+        return None, "제목 없음"
+    
+    # 본문 추출
+    content = ""
+    content_selectors = [
+        '.se-main-container', '.post-view', '.se_component_wrap',
+        '#postViewArea', '.post_ct'
+    ]
+    for selector in content_selectors:
+        content_elem = soup.select_one(selector)
+        if content_elem:
+            content = clean_text(content_elem.get_text())
+            break
+    
+    if not content:
+        return None, "본문 없음"
+    
+    # 발행 날짜+시간 추출
+    published_datetime = ""
+    date_selectors = [
+        '.se_publishDate', '.post-view .date', '.se_date',
+        '.post_info .date', 'span.se_publishDate', '.blog2_series .date',
+        '.blog-category .date', '.post_date', 'p.date', 'span.date',
+        '.post-meta .date', '.entry-date'
+    ]
+    
+    for selector in date_selectors:
+        date_elem = soup.select_one(selector)
+        if date_elem:
+            date_text = date_elem.get_text(strip=True)
+            published_datetime = parse_published_date(date_text)
+            if published_datetime:
+                break
+    
+    # 전체 텍스트 (필터링용)
+    full_text = f"{title} {content}"
+    
+    # 추천인 정보 추출
+    sponsor_phone = extract_sponsor_phone(full_text)
+    sponsor_partner_id = extract_sponsor_partner_id(full_text)
+    
+    # v7.4: 다층 필터링 검사
+    passes, reason = content_passes_filter(title, content, full_text, blog_id, sponsor_partner_id)
+    if not passes:
+        logger.debug(f"필터링됨: {reason} - {title[:50]}")
+        return None, f"필터링: {reason}"
+    
+    # 해시태그 추출 (v7.4: 개선된 방식)
+    hashtags = extract_hashtags(soup, content)
+    
+    # 이미지/비디오 URL 추출
+    image_urls = extract_image_urls(soup)
+    video_urls = extract_video_urls(soup)
+    
+    # v7.4: 데이터 구성 (post_id 형식 변경)
+    post_data = {
+        'platform': 'naver_blog',
+        'post_id': post_id,  # v7.4: blog_id 중복 제거
+        'blog_id': blog_id,
+        'url': url,
+        'title': title,
+        'content': content,
+        'published_datetime': published_datetime,
+        'sponsor_phone': sponsor_phone,
+        'sponsor_partner_id': sponsor_partner_id,
+        'like_count': None,
+        'comment_count': None,
+        'hashtags': hashtags,
+        'image_urls': image_urls,
+        'video_urls': video_urls,
+        'collected_date': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    }
+    return post_data, ""
+
+class PageReadiness:
+    """고정 sleep 대신 DOM 조건을 폴링하여 페이지 준비를 판단 (v9.2)
+    
+    - 조건은 config 순서대로 대기하며, 조건별 타임아웃이 지나면 다음 조건으로 진행
+    - 조건별 대기 시간을 기록 (워커 스레드 공용이므로 lock으로 보호)
+    """
+    
+    def __init__(self, conditions: List[Dict], poll_interval: float, frame_timeout: float):
+        self.conditions = conditions
+        self.poll_interval = poll_interval
+        self.frame_timeout = frame_timeout
+        self.lock = threading.Lock()
+        self.timings = {name: {'count': 0, 'timeouts': 0, 'total': 0.0, 'max': 0.0}
+                        for name in ['frame'] + [condition['name'] for condition in conditions]}
+    
+    def _record(self, name: str, elapsed: float, timed_out: bool):
+        with self.lock:
+            timing = self.timings[name]
+            timing['count'] += 1
+            timing['total'] += elapsed
+            timing['max'] = max(timing['max'], elapsed)
+            if timed_out:
+                timing['timeouts'] += 1
+    
+    def _wait_for(self, driver: webdriver.Chrome, name: str, timeout: float, condition) -> bool:
+        start = time.time()
+        try:
+            WebDriverWait(driver, timeout, poll_frequency=self.poll_interval).until(condition)
+            ready = True
+        except TimeoutException:
+            ready = False
+        self._record(name, time.time() - start, not ready)
+        return ready
+    
+    def enter_main_frame(self, driver: webdriver.Chrome) -> bool:
+        """mainFrame iframe이 있으면 전환 (없으면 본문 직접 크롤링)"""
+        return self._wait_for(driver, 'frame', self.frame_timeout,
+                              EC.frame_to_be_available_and_switch_to_it((By.ID, 'mainFrame')))
+    
+    def wait(self, driver: webdriver.Chrome) -> bool:
+        """모든 조건 대기
+        
+        Returns:
+            본문(첫 번째 조건) 준비 여부 - 본문이 없으면 나머지 조건은 기다리지 않음
+        """
+        for i, condition in enumerate(self.conditions):
+            ready = self._wait_for(driver, condition['name'], condition['timeout'],
+                                   EC.presence_of_element_located((By.CSS_SELECTOR, condition['selector'])))
+            if not ready and i == 0:
+                return False
+        return True
+    
+    def print_summary(self):
+        """조건별 평균/최대 대기 시간 출력"""
+        logger.info("⏱️  페이지 준비 대기 시간:")
+        with self.lock:
+            for name, timing in self.timings.items():
+                if not timing['count']:
+                    continue
+                average = timing['total'] / timing['count']
+                logger.info(f"   - {name}: 평균 {average:.2f}초, 최대 {timing['max']:.2f}초, "
+                            f"타임아웃 {timing['timeouts']}/{timing['count']}회")
+
+PAGE_READINESS = PageReadiness(READINESS_CONDITIONS, READINESS_POLL_INTERVAL, READINESS_FRAME_TIMEOUT)
+
+def load_post_page(driver: webdriver.Chrome, url: str) -> BeautifulSoup:
+    """게시물 페이지 로드 후 mainFrame으로 전환하여 파싱 (v9.2)"""
+    driver.get(url)
+    
+    # iframe 대기 및 전환
+    if not PAGE_READINESS.enter_main_frame(driver):
+        logger.debug("iframe 없음 - 본문 직접 크롤링")
+    
+    # v9.2: 고정 1초 대기 대신 본문/카운터 렌더링 대기
+    if not PAGE_READINESS.wait(driver):
+        logger.debug(f"본문 대기 타임아웃: {url}")
+    
+    if RESOURCE_BLOCKING and RESOURCE_TRACK_BYTES:
+        RESOURCE_STATS.collect(driver)
+    
+    # HTML 파싱 (v9.2: lxml 우선)
+    return BeautifulSoup(driver.page_source, HTML_PARSER)
+
+def crawl_blog_post_selenium(driver: webdriver.Chrome, url: str, blog_id: str, 
                             post_id: str, failed_url_manager: FailedURLManager) -> Optional[Dict]:
     """Selenium을 사용한 블로그 게시물 크롤링 (v7.4)"""
     try:
         logger.debug(f"크롤링 시작: {url}")
-        driver.get(url)
-        
-        # iframe 대기 및 전환 (v7.6: 타임아웃 단축 10초→3초)
-        try:
-            WebDriverWait(driver, 3).until(
-                EC.presence_of_element_located((By.ID, 'mainFrame'))
-            )
-            driver.switch_to.frame('mainFrame')
-        except TimeoutException:
-            logger.debug("iframe 없음 - 본문 직접 크롤링")
-        
-        # 페이지 로딩 대기 (v7.6: 2초→1초)
-        time.sleep(1)
-        
-        # HTML 파싱
-        soup = BeautifulSoup(driver.page_source, 'html.parser')
-        
-        # 제목 추출
-        title = ""
-        title_selectors = [
-            '.se-title-text', '.pcol1', '.se_title', 
-            '.post-view .tit', '.tit_h3', 'h3.se_title'
-        ]
-        for selector in title_selectors:
-            title_elem = soup.select_one(selector)
-            if title_elem:
-                title = clean_text(title_elem.get_text())
-                break
-        
-        if not title:
-            failed_url_manager.add_failed(url, "제목 없음")
-            return None
+        soup = load_post_page(driver, url)
         
-        # 본문 추출
-        content = ""
-        content_selectors = [
-            '.se-main-container', '.post-view', '.se_component_wrap',
-            '#postViewArea', '.post_ct'
-        ]
-        for selector in content_selectors:
-            content_elem = soup.select_one(selector)
-            if content_elem:
-                content = clean_text(content_elem.get_text())
-                break
-        
-        if not content:
-            failed_url_manager.add_failed(url, "본문 없음")
+        post_data, reason = parse_post_soup(soup, url, blog_id, post_id)
+        if not post_data:
+            failed_url_manager.add_failed(url, reason)
             return None
         
-        # 발행 날짜+시간 추출
-        published_datetime = ""
-        date_selectors = [
-            '.se_publishDate', '.post-view .date', '.se_date',
-            '.post_info .date', 'span.se_publishDate', '.blog2_series .date',
-            '.blog-category .date', '.post_date', 'p.date', 'span.date',
-            '.post-meta .date', '.entry-date'
-        ]
-        
-        for selector in date_selectors:
-            date_elem = soup.select_one(selector)
-            if date_elem:
-                date_text = date_elem.get_text(strip=True)
-                published_datetime = parse_published_date(date_text)
-                if published_datetime:
-                    break
-        
-        # 전체 텍스트 (필터링용)
-        full_text = f"{title} {content}"
-        
-        # 추천인 정보 추출
-        sponsor_phone = extract_sponsor_phone(full_text)
-        sponsor_partner_id = extract_sponsor_partner_id(full_text)
-        
-        # v7.4: 다층 필터링 검사
-        passes, reason = content_passes_filter(title, content, full_text, blog_id, sponsor_partner_id)
-        if not passes:
-            logger.debug(f"필터링됨: {reason} - {title[:50]}")
-            failed_url_manager.add_failed(url, f"필터링: {reason}")
-            return None
-        
-        # 해시태그 추출 (v7.4: 개선된 방식)
-        hashtags = extract_hashtags(soup, content)
-        
-        # 이미지/비디오 URL 추출
-        image_urls = extract_image_urls(soup)
-        video_urls = extract_video_urls(soup)
-        
         # 좋아요/댓글 수 추출
-        like_count = extract_like_count(driver, soup)
-        comment_count = extract_comment_count(driver, soup)
-        
-        # v7.4: 데이터 구성 (post_id 형식 변경)
-        post_data = {
-            'platform': 'naver_blog',
-            'post_id': post_id,  # v7.4: blog_id 중복 제거
-            'blog_id': blog_id,
-            'url': url,
-            'title': title,
-            'content': content,
-            'published_datetime': published_datetime,
-            'sponsor_phone': sponsor_phone,
-            'sponsor_partner_id': sponsor_partner_id,
-            'like_count': like_count,
-            'comment_count': comment_count,
-            'hashtags': hashtags,
-            'image_urls': image_urls,
-            'video_urls': video_urls,
-            'collected_date': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        }
+        post_data['like_count'], post_data['comment_count'] = extract_engagement_counts(driver, soup)
         
         driver.switch_to.default_content()
         return post_data
@@ -1278,12 +2310,1107 @@ def crawl_blog_post_selenium(driver: webdriver.Chrome, url: str, blog_id: str,
         except:
             pass
 
+def fill_engagement_counts_selenium(driver: webdriver.Chrome, post_data: Dict):
+    """HTTP 경로에서 찾지 못한 좋아요/댓글 수만 Selenium으로 보충 (v9.2)"""
+    try:
+        soup = load_post_page(driver, post_data['url'])
+        like_count, comment_count = extract_engagement_counts(driver, soup)
+        if post_data['like_count'] is None:
+            post_data['like_count'] = like_count
+        if post_data['comment_count'] is None:
+            post_data['comment_count'] = comment_count
+    except Exception as e:
+        logger.debug(f"참여 지표 보충 실패: {str(e)}")
+    finally:
+        try:
+            driver.switch_to.default_content()
+        except:
+            pass
+    
+    fill_missing_counts(post_data)
+
+def fill_missing_counts(post_data: Dict):
+    """찾지 못한 좋아요/댓글 수는 기존과 동일하게 0으로 기록"""
+    for key in ('like_count', 'comment_count'):
+        if post_data[key] is None:
+            post_data[key] = 0
+
+# ===========================
+# v9.2: HTTP 고속 경로 (PostView 직접 요청)
+# ===========================
+
+def create_http_session() -> requests.Session:
+    """PostView 요청용 세션 (워커당 1개, 커넥션 재사용)"""
+    session = requests.Session()
+    session.headers.update({
+        'User-Agent': random.choice(USER_AGENTS),
+        'Referer': 'https://blog.naver.com/',
+        'Accept-Language': 'ko-KR,ko;q=0.9'
+    })
+    return session
+
+def build_post_view_url(blog_id: str, post_id: str) -> str:
+    """mainFrame이 로드하는 PostView 주소"""
+    return f"https://blog.naver.com/PostView.naver?blogId={blog_id}&logNo={post_id}"
+
+def extract_counts_from_soup(soup: BeautifulSoup) -> Tuple[Optional[int], Optional[int]]:
+    """정적 HTML에 렌더링된 좋아요/댓글 수 추출 (없으면 None)"""
+    def first_number(selectors: List[str]) -> Optional[int]:
+        for selector in selectors:
+            elem = soup.select_one(selector)
+            if elem:
+                digits = re.sub(r'\D', '', elem.get_text(strip=True))
+                if digits:
+                    return int(digits)
+        return None
+    
+    like_count = first_number(LIKE_COUNT_SELECTORS)
+    comment_count = first_number(COMMENT_COUNT_SELECTORS)
+    return like_count, comment_count
+
+def parse_post_view_html(html: str, url: str, blog_id: str,
+                         post_id: str) -> Tuple[Optional[Dict], str]:
+    """PostView HTML 파싱 (좋아요/댓글 수는 정적 HTML에 있을 때만 채움)"""
+    soup = BeautifulSoup(html, HTML_PARSER)
+    post_data, reason = parse_post_soup(soup, url, blog_id, post_id)
+    if post_data:
+        post_data['like_count'], post_data['comment_count'] = extract_counts_from_soup(soup)
+    return post_data, reason
+
+def crawl_blog_post_http(session: requests.Session, url: str, blog_id: str, post_id: str,
+                         failed_url_manager: FailedURLManager) -> Tuple[Optional[Dict], bool]:
+    """PostView 정적 HTML로 게시물 크롤링 (브라우저 없이)
+    
+    Returns:
+        (post_data, Selenium 필요 여부)
+        - 요청 실패/정적 HTML에 본문 없음: (None, True) → 전체 Selenium 크롤링
+        - 필터링: (None, False)
+        - 좋아요/댓글 수 누락: (post_data, True) → 카운트만 Selenium 보충
+    """
+    try:
+        response = session.get(build_post_view_url(blog_id, post_id), timeout=PAGE_LOAD_TIMEOUT)
+        response.raise_for_status()
+    except requests.exceptions.RequestException as e:
+        logger.debug(f"PostView 요청 실패: {url} - {str(e)}")
+        return None, True
+    
+    post_data, reason = parse_post_view_html(response.text, url, blog_id, post_id)
+    
+    if not post_data:
+        if reason.startswith("필터링"):
+            failed_url_manager.add_failed(url, reason)
+            return None, False
+        logger.debug(f"PostView 파싱 실패 ({reason}) - Selenium 폴백: {url}")
+        return None, True
+    
+    return post_data, post_data['like_count'] is None or post_data['comment_count'] is None
+
+# ===========================
+# v9.2: 좋아요/댓글 수 API
+# ===========================
+
+class EngagementClient:
+    """(blog_id, post_id) 여러 건의 좋아요/댓글 수를 JSON API로 일괄 조회
+    
+    - 블로그별로 묶어 글 목록 API를 페이지 단위로 조회 (한 번에 items_per_page개 글의 카운트)
+    - 블로그 단위로 병렬 조회, 세션(커넥션 풀)과 토큰 버킷은 모든 스레드가 공유
+    - 목록 max_pages 안에서 찾지 못한 글은 결과에서 빠짐 (호출 측에서 DOM 추출로 폴백)
+    - 크롤링 중에는 게시물 1건씩 조회하므로 (blog_id, page) 목록을 page_cache_seconds 동안 재사용
+      → 같은 블로그의 글 여러 개가 같은 페이지를 다시 받지 않음 (동시에 요청하면 한 번만 받음)
+    """
+    
+    def __init__(self, workers: int = ENGAGEMENT_WORKERS, max_pages: int = ENGAGEMENT_MAX_PAGES,
+                 page_cache_seconds: float = ENGAGEMENT_PAGE_CACHE_SECONDS):
+        self.workers = workers
+        self.max_pages = max_pages
+        self.page_cache_seconds = page_cache_seconds
+        self.rate_limiter = TokenBucket(ENGAGEMENT_RATE)
+        self._page_cache: Dict[Tuple[str, int], Tuple[float, List[Tuple[str, int, int]]]] = {}
+        self._page_locks: Dict[Tuple[str, int], threading.Lock] = {}
+        self._cache_lock = threading.Lock()
+        self.stats = {'page_requests': 0, 'page_cache_hits': 0}
+        
+        self.session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=workers, pool_maxsize=workers)
+        self.session.mount('https://', adapter)
+        self.session.headers.update({
+            'User-Agent': random.choice(USER_AGENTS),
+            'Referer': 'https://m.blog.naver.com/',
+            'Accept': 'application/json',
+            'Accept-Language': 'ko-KR,ko;q=0.9'
+        })
+    
+    def _request_page(self, blog_id: str, page: int) -> List[Tuple[str, int, int]]:
+        """글 목록 1페이지 → [(post_id, 좋아요 수, 댓글 수), ...]"""
+        url = ENGAGEMENT_API_URL.format(blog_id=blog_id, item_count=ENGAGEMENT_ITEMS_PER_PAGE, page=page)
+        self.rate_limiter.acquire()
+        response = self.session.get(url, timeout=ENGAGEMENT_TIMEOUT)
+        response.raise_for_status()
+        items = (response.json().get('result') or {}).get('items') or []
+        with self._cache_lock:
+            self.stats['page_requests'] += 1
+        return [(str(item.get('logNo', '')), int(item.get(ENGAGEMENT_LIKE_FIELD) or 0),
+                 int(item.get(ENGAGEMENT_COMMENT_FIELD) or 0)) for item in items]
+    
+    def _fetch_page(self, blog_id: str, page: int) -> List[Tuple[str, int, int]]:
+        if not self.page_cache_seconds:
+            return self._request_page(blog_id, page)
+        
+        key = (blog_id, page)
+        with self._cache_lock:
+            key_lock = self._page_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            now = time.time()
+            with self._cache_lock:
+                cached = self._page_cache.get(key)
+                if cached and now - cached[0] < self.page_cache_seconds:
+                    self.stats['page_cache_hits'] += 1
+                    return cached[1]
+            rows = self._request_page(blog_id, page)
+            with self._cache_lock:
+                self._page_cache[key] = (now, rows)
+                if len(self._page_cache) % 1000 == 0:  # 만료된 페이지 정리
+                    for old_key in [k for k, (t, _) in self._page_cache.items()
+                                    if now - t >= self.page_cache_seconds]:
+                        del self._page_cache[old_key]
+                        self._page_locks.pop(old_key, None)
+            return rows
+    
+    def _fetch_blog(self, blog_id: str, post_ids: Set[str]) -> Dict[Tuple[str, str], Tuple[int, int]]:
+        """블로그 글 목록을 최신순으로 넘기며 요청한 글의 카운트 수집"""
+        counts = {}
+        try:
+            for page in range(1, self.max_pages + 1):
+                rows = self._fetch_page(blog_id, page)
+                for post_id, like_count, comment_count in rows:
+                    if post_id in post_ids:
+                        counts[(blog_id, post_id)] = (like_count, comment_count)
+                if len(counts) == len(post_ids) or len(rows) < ENGAGEMENT_ITEMS_PER_PAGE:
+                    break
+        except (requests.exceptions.RequestException, ValueError) as e:
+            logger.debug(f"참여 지표 API 실패: {blog_id} - {str(e)}")
+        return counts
+    
+    def fetch_counts(self, pairs: List[Tuple[str, str]]) -> Dict[Tuple[str, str], Tuple[int, int]]:
+        """(blog_id, post_id) → (like_count, comment_count)"""
+        by_blog = {}
+        for blog_id, post_id in pairs:
+            by_blog.setdefault(blog_id, set()).add(str(post_id))
+        
+        if len(by_blog) == 1:
+            blog_id, post_ids = next(iter(by_blog.items()))
+            return self._fetch_blog(blog_id, post_ids)
+        
+        counts = {}
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="engagement") as executor:
+            for blog_counts in executor.map(lambda item: self._fetch_blog(*item), by_blog.items()):
+                counts.update(blog_counts)
+        return counts
+    
+    def close(self):
+        if self.stats['page_cache_hits']:
+            logger.info(f"📊 참여 지표 글 목록: 요청 {self.stats['page_requests']:,}회, "
+                        f"캐시 재사용 {self.stats['page_cache_hits']:,}회")
+        self.session.close()
+
+def fill_engagement_counts_api(client: EngagementClient, post_data: Dict) -> bool:
+    """API로 비어 있는 좋아요/댓글 수 채우기
+    
+    크롤링 중 게시물 1건마다 호출되므로 블로그 글 목록은 engagement_api.max_pages(최신 글)까지만 보고,
+    같은 블로그 글끼리는 클라이언트의 페이지 캐시를 공유한다.
+    
+    Returns:
+        두 값이 모두 채워졌는지 여부 (False면 DOM 추출 폴백 필요)
+    """
+    key = (post_data['blog_id'], post_data['post_id'])
+    counts = client.fetch_counts([key]).get(key)
+    if counts:
+        if post_data['like_count'] is None:
+            post_data['like_count'] = counts[0]
+        if post_data['comment_count'] is None:
+            post_data['comment_count'] = counts[1]
+    return post_data['like_count'] is not None and post_data['comment_count'] is not None
+
+class EngagementStore:
+    """참여 지표 시계열 저장소 (SQLite, v9.2)
+    
+    - posts: 수집된 게시물 목록 (세그먼트/결과 CSV에서 파일별로 1번만 반영)
+    - snapshots: (게시물, 조회 시각)별 좋아요/댓글 수 - 수집 시점 값도 첫 스냅샷으로 저장
+    - posts.last_attempt: 마지막 갱신 시도 시각 (글 목록에서 못 찾아 스냅샷이 없어도 기록)
+    """
+    
+    POST_COLUMNS = ['blog_id', 'post_id', 'published_datetime', 'collected_date', 'like_count', 'comment_count']
+    
+    def __init__(self, path: str = REFRESH_STORE_FILE):
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS posts "
+            "(blog_id TEXT, post_id TEXT, published_datetime TEXT, last_attempt TEXT, "
+            "PRIMARY KEY (blog_id, post_id)) WITHOUT ROWID"
+        )
+        post_columns = {row[1] for row in self.conn.execute("PRAGMA table_info(posts)")}
+        if 'last_attempt' not in post_columns:  # 이전 버전 저장소
+            self.conn.execute("ALTER TABLE posts ADD COLUMN last_attempt TEXT")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS snapshots "
+            "(blog_id TEXT, post_id TEXT, fetched_at TEXT, like_count INTEGER, comment_count INTEGER, source TEXT, "
+            "PRIMARY KEY (blog_id, post_id, fetched_at)) WITHOUT ROWID"
+        )
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS imported_files "
+            "(name TEXT PRIMARY KEY, mtime REAL, rows INTEGER)"
+        )
+        self.conn.commit()
+    
+    def _is_imported(self, path: Path) -> bool:
+        row = self.conn.execute("SELECT mtime FROM imported_files WHERE name = ?", (str(path),)).fetchone()
+        return row is not None and row[0] == path.stat().st_mtime
+    
+    def _read_segment(self, path: Path) -> List[Dict]:
+        """세그먼트에서 필요한 필드만 읽기 (중단 시 잘린 마지막 줄은 건너뜀)"""
+        posts = []
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    post = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                posts.append({column: post.get(column) for column in self.POST_COLUMNS})
+        return posts
+    
+    def _add_posts(self, df: pd.DataFrame):
+        df = df.reindex(columns=self.POST_COLUMNS).dropna(subset=['blog_id', 'post_id'])
+        df = df.astype({'blog_id': str, 'post_id': str})
+        posts = df[['blog_id', 'post_id', 'published_datetime']].astype(object)
+        self.conn.executemany(
+            "INSERT OR IGNORE INTO posts (blog_id, post_id, published_datetime) VALUES (?, ?, ?)",
+            posts.where(posts.notna(), None).itertuples(index=False, name=None)
+        )
+        baseline = df.dropna(subset=['collected_date', 'like_count', 'comment_count'])
+        self.conn.executemany(
+            "INSERT OR IGNORE INTO snapshots VALUES (?, ?, ?, ?, ?, 'crawl')",
+            zip(baseline['blog_id'], baseline['post_id'], baseline['collected_date'],
+                baseline['like_count'].astype(int), baseline['comment_count'].astype(int))
+        )
+    
+    def import_outputs(self, csv_pattern: str = DEDUP_PREVIOUS_CSV_PATTERN) -> int:
+        """크롤러 출력(세그먼트 JSONL + 결과 CSV) 중 새로 생기거나 바뀐 파일만 반영
+        
+        Returns:
+            반영한 파일 수
+        """
+        paths = sorted(Path(SEGMENT_DIRECTORY).glob('*.jsonl')) + sorted(Path('.').glob(csv_pattern))
+        imported = 0
+        for path in paths:
+            if self._is_imported(path):
+                continue
+            try:
+                if path.suffix == '.jsonl':
+                    df = pd.DataFrame(self._read_segment(path))
+                else:
+                    df = pd.read_csv(path, usecols=lambda col: col in self.POST_COLUMNS,
+                                     dtype={'blog_id': str, 'post_id': str})
+            except (OSError, ValueError) as e:
+                logger.warning(f"출력 파일 로드 실패: {path} - {e}")
+                continue
+            
+            self._add_posts(df)
+            self.conn.execute("INSERT OR REPLACE INTO imported_files (name, mtime, rows) VALUES (?, ?, ?)",
+                              (str(path), path.stat().st_mtime, len(df)))
+            self.conn.commit()
+            imported += 1
+        return imported
+    
+    def history(self) -> pd.DataFrame:
+        """게시물별 발행일과 최근 2개 스냅샷 (우선순위 계산용)"""
+        return pd.read_sql_query(
+            """
+            SELECT p.blog_id, p.post_id, p.published_datetime, p.last_attempt,
+                   s.fetched_at, s.like_count, s.comment_count, s.rank
+            FROM posts p
+            LEFT JOIN (
+                SELECT *, ROW_NUMBER() OVER (PARTITION BY blog_id, post_id ORDER BY fetched_at DESC) AS rank
+                FROM snapshots
+            ) s ON s.blog_id = p.blog_id AND s.post_id = p.post_id AND s.rank <= 2
+            """,
+            self.conn
+        )
+    
+    def add_snapshots(self, counts: Dict[Tuple[str, str], Tuple[int, int]], fetched_at: str):
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO snapshots VALUES (?, ?, ?, ?, ?, 'refresh')",
+            [(blog_id, post_id, fetched_at, like_count, comment_count)
+             for (blog_id, post_id), (like_count, comment_count) in counts.items()]
+        )
+        self.conn.commit()
+    
+    def mark_attempted(self, posts: List[Tuple[str, str]], attempted_at: str):
+        """갱신 시도 기록 - 글 목록 max_pages 밖이라 못 찾은 게시물도 갱신 주기만큼 다시 고르지 않음"""
+        self.conn.executemany(
+            "UPDATE posts SET last_attempt = ? WHERE blog_id = ? AND post_id = ?",
+            [(attempted_at, blog_id, post_id) for blog_id, post_id in posts]
+        )
+        self.conn.commit()
+    
+    def snapshots(self) -> pd.DataFrame:
+        """전체 시계열 (분석용)"""
+        return pd.read_sql_query("SELECT * FROM snapshots ORDER BY blog_id, post_id, fetched_at", self.conn)
+    
+    def close(self):
+        self.conn.close()
+
+def refresh_interval_hours(age_days: float) -> float:
+    """게시물 나이에 맞는 갱신 주기 (config engagement_api.refresh.intervals)"""
+    for band in REFRESH_INTERVALS:
+        if band['max_age_days'] is None or age_days <= band['max_age_days']:
+            return band['interval_hours']
+    return REFRESH_INTERVALS[-1]['interval_hours']
+
+def select_posts_to_refresh(history: pd.DataFrame, now: datetime,
+                            limit: int = REFRESH_MAX_POSTS) -> List[Tuple[str, str]]:
+    """갱신 주기가 지난 게시물을 성장 속도 순으로 선택
+    
+    - 나이 = 현재 - 발행일 (발행일이 없으면 첫 스냅샷 시각)
+    - 성장 속도 = 최근 두 스냅샷 사이 (좋아요+댓글) 증가량 / 일수
+      스냅샷이 1개면 발행일부터 그 시점까지의 평균 증가량
+    - 성장 속도가 같으면 최근 게시물 우선
+    - 갱신 주기는 마지막 스냅샷과 마지막 시도(못 찾은 경우 포함) 중 최근 시각부터 계산
+    """
+    if history.empty:
+        return []
+    
+    history = history.copy()
+    history['fetched_at'] = pd.to_datetime(history['fetched_at'], errors='coerce')
+    history['last_attempt'] = pd.to_datetime(history['last_attempt'], errors='coerce')
+    history['published'] = pd.to_datetime(history['published_datetime'], errors='coerce')
+    history['engagement'] = history['like_count'].fillna(0) + history['comment_count'].fillna(0)
+    
+    latest = history[history['rank'].fillna(1) == 1].set_index(['blog_id', 'post_id'])
+    previous = history[history['rank'] == 2].set_index(['blog_id', 'post_id'])
+    
+    published = latest['published'].fillna(latest['fetched_at']).fillna(pd.Timestamp(now))
+    age_days = ((pd.Timestamp(now) - published).dt.total_seconds() / 86400).clip(lower=0)
+    last_checked = latest[['fetched_at', 'last_attempt']].max(axis=1)
+    hours_since = (pd.Timestamp(now) - last_checked).dt.total_seconds() / 3600
+    
+    prev_fetched = previous['fetched_at'].reindex(latest.index)
+    prev_engagement = previous['engagement'].reindex(latest.index)
+    base_time = prev_fetched.fillna(latest['published'])  # 발행일을 모르면 성장 속도 0
+    base_engagement = prev_engagement.fillna(0)
+    span_days = ((latest['fetched_at'] - base_time).dt.total_seconds() / 86400).clip(lower=1 / 24)
+    growth = ((latest['engagement'] - base_engagement) / span_days).fillna(0).clip(lower=0)
+    
+    interval = age_days.map(refresh_interval_hours)
+    due = hours_since.isna() | (hours_since >= interval)
+    
+    candidates = pd.DataFrame({'growth': growth, 'age_days': age_days})[due]
+    candidates = candidates.sort_values(['growth', 'age_days'], ascending=[False, True]).head(limit)
+    return list(candidates.index)
+
+def refresh_engagement(limit: int = REFRESH_MAX_POSTS) -> int:
+    """이전 수집 게시물의 좋아요/댓글 수만 다시 조회해 스냅샷 추가 (v9.2)
+    
+    Returns:
+        갱신한 게시물 수
+    """
+    store = EngagementStore()
+    client = EngagementClient(workers=REFRESH_WORKERS, max_pages=REFRESH_MAX_PAGES, page_cache_seconds=0)
+    try:
+        imported = store.import_outputs()
+        now = datetime.now()
+        targets = select_posts_to_refresh(store.history(), now, limit)
+        logger.info(f"📈 참여 지표 갱신 대상: {len(targets):,}개 (새로 반영한 출력 파일 {imported}개)")
+        if not targets:
+            return 0
+        
+        start = time.time()
+        counts = client.fetch_counts(targets)
+        fetched_at = now.strftime('%Y-%m-%d %H:%M:%S')
+        store.add_snapshots(counts, fetched_at)
+        store.mark_attempted(targets, fetched_at)
+        
+        if 'warehouse' in OUTPUT_FORMATS:
+            with Warehouse() as warehouse:
+                warehouse.upsert('engagement_snapshots', [
+                    {'platform': 'naver_blog', 'post_id': post_id, 'fetched_at': fetched_at,
+                     'like_count': like_count, 'comment_count': comment_count, 'source': 'refresh'}
+                    for (_, post_id), (like_count, comment_count) in counts.items()
+                ])
+        
+        logger.info(f"✅ 갱신 완료: {len(counts):,}/{len(targets):,}개 ({time.time() - start:.1f}초)")
+        return len(counts)
+    finally:
+        client.close()
+        store.close()
+
+# ===========================
+# v9.2: 수집 결과 병합 (워커 풀/비동기 엔진 공용)
+# ===========================
+
+class CrawlCollector:
+    """여러 워커의 크롤링 결과를 안전하게 병합
+    
+    - 수집 결과, 통계, 중복 체크는 self.lock 안에서만 갱신
+    - 처리 중인 post_id를 추적하여 두 워커가 같은 게시물을 동시에 크롤링하지 않음
+    - 저널이 있으면 URL별 처리 결과를 기록하고, 이전 실행에서 끝난 URL은 건너뜀
+    """
+    
+    def __init__(self, stats: CrawlStats, duplicate_checker: DuplicateChecker,
+                 checkpoint_manager: CheckpointManager, writer: PostSegmentWriter,
+                 failed_url_manager: FailedURLManager, journal: Optional[CrawlJournal] = None):
+        self.stats = stats
+        self.duplicate_checker = duplicate_checker
+        self.checkpoint_manager = checkpoint_manager
+        self.writer = writer
+        self.failed_url_manager = failed_url_manager
+        self.journal = journal
+        
+        self.lock = threading.Lock()
+        self.stop_event = threading.Event()
+        
+        self.collected_total = 0  # v9.2: 게시물 본문은 writer에만 기록
+        self.keyword_collected = {}  # 키워드별 수집 개수
+        self.keyword_targets = {}
+        self.in_flight = set()  # 크롤링 중인 post_id
+        self.crawl_count = 0
+        self.test_start_time = time.time() if TEST_MODE else None
+    
+    def register_keyword(self, keyword: str, target: int):
+        """키워드 목표 등록"""
+        with self.lock:
+            self.keyword_targets[keyword] = target
+            self.keyword_collected.setdefault(keyword, 0)
+    
+    def restore_from_journal(self):
+        """v9.2: 저널에 기록된 이전 실행의 수집 결과 복원 (키워드별 개수, 중복 체크)"""
+        if not self.journal or not self.journal.resumed:
+            return
+        
+        with self.lock:
+            for keyword, post_id, url, fingerprint, simhash in self.journal.successes:
+                self.keyword_collected[keyword] = self.keyword_collected.get(keyword, 0) + 1
+                self.collected_total += 1
+                self.duplicate_checker.add(post_id=post_id, url=url,
+                                           fingerprint=fingerprint, simhash=simhash)
+                if keyword in self.stats.keyword_stats:
+                    self.stats.keyword_stats[keyword].collected += 1
+            self.journal.successes = []
+        
+        logger.info(f"🔁 이전 실행 이어서 진행: {self.collected_total}개 수집됨")
+    
+    def _journal_outcome(self, keyword: str, post_id: str, outcome: str, url: str = None,
+                         fingerprint: int = None, simhash: int = None):
+        # self.lock 보유 상태에서 호출 (세그먼트를 먼저 fsync한 뒤 저널 fsync)
+        if not self.journal:
+            return
+        if self.journal.record_outcome(keyword, post_id, outcome, url, fingerprint, simhash):
+            self.writer.sync()
+            self.journal.sync()
+    
+    def collected_count(self) -> int:
+        with self.lock:
+            return self.collected_total
+    
+    def keyword_done(self, keyword: str) -> bool:
+        """키워드 목표 또는 전체 목표 달성 여부"""
+        with self.lock:
+            return self._limits_reached(keyword)
+    
+    def _limits_reached(self, keyword: str) -> bool:
+        # self.lock 보유 상태에서 호출
+        if self.collected_total >= TOTAL_TARGET:
+            return True
+        return self.keyword_collected.get(keyword, 0) >= self.keyword_targets.get(keyword, 0)
+    
+    def claim(self, keyword: str, result: Dict) -> Optional[str]:
+        """크롤링 전 검사: 목표 달성/중복이면 None, 아니면 정규화 URL 반환 후 처리 중 표시"""
+        blog_id = result['blog_id']
+        post_id = result['post_id']
+        normalized_url = normalize_blog_url(blog_id, post_id)
+        
+        with self.lock:
+            if self._limits_reached(keyword):
+                return None
+            
+            # 검색 시도 카운트
+            self.stats.add_searched(keyword)
+            
+            # v9.2: 이전 실행에서 처리 완료 (필터링/중복 포함)
+            if self.journal and self.journal.is_done(post_id):
+                return None
+            
+            # 중복 체크 (v9.2: 다른 워커가 처리 중인 게시물 포함)
+            if post_id in self.in_flight or \
+                    self.duplicate_checker.is_duplicate(post_id=post_id, url=normalized_url):
+                self.stats.add_duplicate(keyword)
+                return None
+            
+            self.in_flight.add(post_id)
+            logger.info(f"[전체: {self.collected_total+1}/{TOTAL_TARGET}] "
+                       f"[{keyword}: {self.keyword_collected[keyword]+1}/{self.keyword_targets[keyword]}] 크롤링 중...")
+        return normalized_url
+    
+    def record(self, keyword: str, result: Dict, post_data: Optional[Dict]) -> bool:
+        """claim()한 게시물의 크롤링 결과 병합
+        
+        Returns:
+            페이지 로드 성공 여부 (필터링/실패 시 False)
+        """
+        post_id = result['post_id']
+        normalized_url = normalize_blog_url(result['blog_id'], post_id)
+        
+        with self.lock:
+            self.in_flight.discard(post_id)
+            
+            if not post_data:
+                self.stats.add_filtered(keyword)
+                outcome = 'filtered' if self.failed_url_manager.is_filtered(normalized_url) else 'failed'
+                self._journal_outcome(keyword, post_id, outcome)
+                return False
+            
+            # 중복 체크 (v9.1: 지문 기반, v9.2: 본문 SimHash 유사 중복 포함)
+            fingerprint = generate_post_fingerprint(post_data)
+            simhash = generate_content_simhash(post_data.get('content', '')) if NEAR_DUP_ENABLED else None
+            if self.duplicate_checker.is_duplicate(fingerprint=fingerprint) or \
+                    self.duplicate_checker.is_near_duplicate(simhash):
+                self.stats.add_duplicate(keyword)
+                self._journal_outcome(keyword, post_id, 'duplicate')
+                return True
+            
+            # 다른 워커가 먼저 목표를 채운 경우 초과분은 버림
+            if self._limits_reached(keyword):
+                logger.debug(f"목표 초과로 제외: {post_data['title'][:50]}")
+                self._journal_outcome(keyword, post_id, 'skipped')
+                return True
+            
+            self.writer.append({**post_data, 'keyword': keyword})  # keyword는 Parquet 파티션용
+            self.collected_total += 1
+            self._journal_outcome(keyword, post_id, 'success', normalized_url, fingerprint, simhash)
+            self.duplicate_checker.add(post_id=post_id, url=normalized_url,
+                                       fingerprint=fingerprint, simhash=simhash)
+            self.duplicate_checker.analyze_partner_id(post_data.get('sponsor_partner_id'))
+            self.keyword_collected[keyword] += 1
+            self.stats.add_success(keyword)
+            logger.info(f"✅ 수집 완료: {post_data['title'][:50]}")
+            
+            if self.keyword_collected[keyword] >= self.keyword_targets[keyword]:
+                logger.info(f"✅ '{keyword}' 목표 달성: {self.keyword_collected[keyword]}/{self.keyword_targets[keyword]}")
+            return True
+    
+    def after_crawl(self):
+        """크롤링 1건 후 공통 처리 (체크포인트, 테스트 모드, 주기적 통계)"""
+        with self.lock:
+            self.crawl_count += 1
+            
+            # v9.1: 체크포인트 저장
+            if self.checkpoint_manager.should_save():
+                self.checkpoint_manager.save_checkpoint(self.writer, self.stats)
+                if self.journal:
+                    self.journal.sync()
+            
+            # v9.1: 테스트 모드 시간 체크
+            if TEST_MODE and self.test_start_time:
+                elapsed_minutes = (time.time() - self.test_start_time) / 60
+                if elapsed_minutes >= TEST_DURATION_MINUTES and not self.stop_event.is_set():
+                    logger.info(f"⏰ 테스트 시간 종료: {elapsed_minutes:.1f}분")
+                    self.stop_event.set()
+            
+            # v7.7: 주기적 통계 출력 (50개마다)
+            if self.crawl_count % 50 == 0:
+                self.stats.print_keyword_stats()
+                gc.collect()
+
+# ===========================
+# v9.2: 멀티 드라이버 워커 풀
+# ===========================
+
+class CrawlerWorkerPool:
+    """여러 개의 장기 실행 드라이버가 공유 작업 큐에서 URL을 가져와 크롤링
+    
+    - 워커마다 setup_driver(worker_id)로 드라이버를 한 번만 생성
+      (HTTP 고속 경로 사용 시 Selenium 폴백이 처음 필요할 때 생성)
+    - 결과 병합은 CrawlCollector가 담당
+    """
+    
+    def __init__(self, num_workers: int, collector: CrawlCollector,
+                 failed_url_manager: FailedURLManager):
+        self.num_workers = num_workers
+        self.collector = collector
+        self.failed_url_manager = failed_url_manager
+        self.stop_event = collector.stop_event
+        
+        self.task_queue = queue.Queue(maxsize=TASK_QUEUE_SIZE)
+        self.threads = []
+        self.drivers = {}  # worker_id → 드라이버
+        self.engagement_client = EngagementClient() if ENGAGEMENT_API_ENABLED else None
+    
+    def start(self):
+        """워커 스레드 시작"""
+        for worker_id in range(self.num_workers):
+            thread = threading.Thread(
+                target=self._worker_loop, args=(worker_id,),
+                name=f"crawler-worker-{worker_id}", daemon=True
+            )
+            thread.start()
+            self.threads.append(thread)
+        logger.info(f"⚡ 워커 풀 시작: {self.num_workers}개 워커")
+    
+    def workers_alive(self) -> bool:
+        return any(thread.is_alive() for thread in self.threads)
+    
+    def submit(self, keyword: str, result: Dict):
+        """검색 결과 1건을 작업 큐에 추가 (큐가 가득 차면 대기)"""
+        while not self.stop_event.is_set() and self.workers_alive():
+            try:
+                self.task_queue.put((keyword, result), timeout=1)
+                return
+            except queue.Full:
+                continue
+    
+    def wait_until_done(self):
+        """큐에 들어간 모든 작업이 처리될 때까지 대기"""
+        while self.task_queue.unfinished_tasks and not self.stop_event.is_set():
+            if not self.workers_alive():
+                logger.error("❌ 실행 중인 워커가 없습니다 - 남은 작업을 건너뜁니다")
+                break
+            time.sleep(0.5)
+    
+    def shutdown(self):
+        """워커 종료 신호 전송 후 스레드 종료 대기"""
+        self.stop_event.set()  # 남은 작업은 건너뛰고 종료 신호까지 소비
+        for thread in self.threads:
+            if thread.is_alive():
+                self.task_queue.put(None)
+        for thread in self.threads:
+            thread.join()
+        self.threads = []
+        if self.engagement_client:
+            self.engagement_client.close()
+    
+    def _get_driver(self, worker_id: int) -> webdriver.Chrome:
+        """워커 드라이버 반환 (v9.2: HTTP 고속 경로에서는 필요할 때 생성)"""
+        driver = self.drivers.get(worker_id)
+        if driver is None:
+            driver = setup_driver(worker_id)
+            self.drivers[worker_id] = driver
+        return driver
+    
+    def _quit_driver(self, worker_id: int):
+        driver = self.drivers.pop(worker_id, None)
+        if driver:
+            try:
+                driver.quit()
+            except Exception:
+                pass
+    
+    def _worker_loop(self, worker_id: int):
+        """워커 스레드 본체: 드라이버 1개를 유지하며 큐를 소비"""
+        adaptive = AdaptiveDelay(initial_min=REQUEST_DELAY_MIN, initial_max=REQUEST_DELAY_MAX)
+        consecutive_errors = 0
+        session = create_http_session() if HTTP_FAST_PATH else None
+        
+        try:
+            if not HTTP_FAST_PATH:
+                self._get_driver(worker_id)
+            while True:
+                task = self.task_queue.get()
+                if task is None:
+                    self.task_queue.task_done()
+                    break
+                
+                try:
+                    if self.stop_event.is_set():
+                        continue
+                    
+                    keyword, result = task
+                    url = self.collector.claim(keyword, result)
+                    if url is None:
+                        continue  # 크롤링하지 않음 (목표 달성/중복)
+                    
+                    post_data = None
+                    crawl_started = time.time()
+                    try:
+                        # 크롤링 실행 (락 밖에서 병렬 수행)
+                        post_data = self._crawl(worker_id, session, url,
+                                                result['blog_id'], result['post_id'])
+                    finally:
+                        loaded = self.collector.record(keyword, result, post_data)
+                    
+                    if loaded:
+                        consecutive_errors = 0
+                        adaptive.on_success()
+                    else:
+                        consecutive_errors += 1
+                        adaptive.on_fail()
+                    
+                    # 연속 에러 시 드라이버 재시작
+                    if consecutive_errors >= MAX_CONSECUTIVE_ERRORS:
+                        logger.warning(f"⚠️  [워커 {worker_id}] 연속 {MAX_CONSECUTIVE_ERRORS}회 에러 - 드라이버 재시작")
+                        self._quit_driver(worker_id)
+                        time.sleep(3)
+                        if not HTTP_FAST_PATH:
+                            self._get_driver(worker_id)
+                        consecutive_errors = 0
+                        gc.collect()
+                    
+                    self.collector.after_crawl()
+                    
+                    # 적응형 대기 시간 (v9.2: 요청 시작 간격 기준, 페이지 대기에 쓴 시간은 제외)
+                    time.sleep(max(0.0, adaptive.get_delay() - (time.time() - crawl_started)))
+                finally:
+                    self.task_queue.task_done()
+        except Exception as e:
+            logger.error(f"❌ [워커 {worker_id}] 종료: {str(e)}")
+        finally:
+            self._quit_driver(worker_id)
+            if session:
+                session.close()
+    
+    def _crawl(self, worker_id: int, session: Optional[requests.Session],
+               url: str, blog_id: str, post_id: str) -> Optional[Dict]:
+        """v9.2: HTTP 고속 경로 우선, 필요할 때만 Selenium 사용"""
+        if not HTTP_FAST_PATH:
+            return crawl_blog_post_selenium(
+                self._get_driver(worker_id), url, blog_id, post_id, self.failed_url_manager
+            )
+        
+        post_data, needs_browser = crawl_blog_post_http(
+            session, url, blog_id, post_id, self.failed_url_manager
+        )
+        if not needs_browser:
+            return post_data
+        
+        # v9.2: 좋아요/댓글 수만 없으면 API로 먼저 조회
+        if post_data and self.engagement_client and fill_engagement_counts_api(self.engagement_client, post_data):
+            return post_data
+        
+        if not HTTP_SELENIUM_FALLBACK:
+            if post_data:
+                fill_missing_counts(post_data)
+            else:
+                self.failed_url_manager.add_failed(url, "PostView 요청/파싱 실패")
+            return post_data
+        
+        driver = self._get_driver(worker_id)
+        if post_data:
+            fill_engagement_counts_selenium(driver, post_data)
+            return post_data
+        return crawl_blog_post_selenium(driver, url, blog_id, post_id, self.failed_url_manager)
+
+# ===========================
+# v9.2: 비동기 크롤링 엔진 (asyncio/aiohttp)
+# ===========================
+
+class AsyncCrawlEngine:
+    """검색 API, 검색 페이지, PostView를 동시에 요청하는 비동기 엔진
+    
+    - 호스트별 세마포어 + 토큰 버킷으로 요청 속도 제한 (config.yaml crawling.async_engine)
+    - HTML 파싱은 스레드 풀에서 실행하여 이벤트 루프를 막지 않음
+    - 결과 병합은 CrawlCollector가 담당 (동기 워커 풀과 동일)
+    """
+    
+    def __init__(self, collector: CrawlCollector, failed_url_manager: FailedURLManager):
+        self.collector = collector
+        self.failed_url_manager = failed_url_manager
+        self.limiter = HostRateLimiter(ASYNC_HOST_SETTINGS, ASYNC_DEFAULT_HOST)
+        self.session = None
+        self.post_semaphore = None
+        self.engagement_client = EngagementClient() if ENGAGEMENT_API_ENABLED else None
+    
+    async def _fetch(self, url: str, params: Optional[Dict] = None,
+                     headers: Optional[Dict] = None, as_json: bool = False):
+        async with self.limiter.limit(url):
+            async with self.session.get(url, params=params, headers=headers) as response:
+                response.raise_for_status()
+                if as_json:
+                    return await response.json(content_type=None)
+                return await response.text()
+    
+    async def search_api(self, keyword: str, start: int) -> Optional[Dict]:
+        """search_naver_blog_api()의 비동기 버전 (API_CALL_BUDGET 공유, 속도는 호스트별 토큰 버킷)"""
+        if not NAVER_CLIENT_ID or not NAVER_CLIENT_SECRET:
+            return None
+        
+        if not API_CALL_BUDGET.take():
+            logger.warning(f"⚠️  API 호출 한도 도달 ({API_CALL_BUDGET.limit}회) - '{keyword}' 스크래핑으로 폴백")
+            return None
+        
+        url, headers, params = build_api_request(keyword, display=100, start=start)
+        try:
+            return await self._fetch(url, params=params, headers=headers, as_json=True)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.error(f"API 검색 실패 ({keyword}, start={start}): {str(e)}")
+            return None
+    
+    async def search_scraping(self, keyword: str, max_results: int) -> List[Dict]:
+        """search_naver_blog_scraping()의 비동기 버전 (페이지 간격은 토큰 버킷이 조절)"""
+        results = []
+        page = 1
+        loop = asyncio.get_running_loop()
+        
+        while len(results) < max_results:
+            try:
+                html = await self._fetch(build_scraping_url(keyword, page),
+                                         headers={'User-Agent': random.choice(USER_AGENTS)})
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                logger.error(f"스크래핑 검색 오류 (키워드: {keyword}, 페이지: {page}): {str(e)}")
+                break
+            
+            soup = await loop.run_in_executor(None, BeautifulSoup, html, HTML_PARSER)
+            page_results = parse_scraping_page(soup)
+            if not page_results:
+                break
+            results.extend(page_results[:max_results - len(results)])
+            page += 1
+        
+        logger.info(f"🔍 '{keyword}' 스크래핑 검색 결과: {len(results)}개")
+        return results
+    
+    async def search_keyword(self, keyword: str, max_results: int) -> List[Dict]:
+        """첫 페이지의 total로 필요한 페이지를 계산한 뒤 나머지 페이지를 동시에 요청"""
+        first = await self.search_api(keyword, 1)
+        first_results = parse_search_results(first) if first else []
+        
+        if not first_results:
+            logger.warning(f"⚠️  '{keyword}' API 실패 - 스크래핑으로 폴백")
+            return await self.search_scraping(keyword, max_results)
+        
+        limit = min(max_results, 1000, first.get('total', 0))
+        starts = list(range(101, limit + 1, 100))
+        pages = await asyncio.gather(*(self.search_api(keyword, start) for start in starts))
+        
+        all_results = list(first_results)
+        for search_data in pages:
+            results = parse_search_results(search_data) if search_data else []
+            if not results:
+                break
+            all_results.extend(results)
+        
+        logger.info(f"🔍 '{keyword}' API 검색 완료: {len(all_results)}개")
+        return all_results
+    
+    async def crawl_post(self, keyword: str, result: Dict):
+        """PostView 1건 요청 → 파싱 → 결과 병합
+        
+        - 게시물 1건의 오류는 실패 URL로 기록하고 다른 게시물은 계속 (동기 워커와 동일)
+        - CrawlCollector 호출(락, SQLite 중복 검사, 저널 fsync, 세그먼트 기록)도 스레드 풀에서 실행
+        """
+        if self.collector.stop_event.is_set():
+            return
+        
+        loop = asyncio.get_running_loop()
+        async with self.post_semaphore:
+            url = await loop.run_in_executor(None, self.collector.claim, keyword, result)
+            if url is None:
+                return
+            
+            blog_id = result['blog_id']
+            post_id = result['post_id']
+            post_data = None
+            try:
+                html = await self._fetch(build_post_view_url(blog_id, post_id))
+                post_data, reason = await loop.run_in_executor(
+                    None, parse_post_view_html, html, url, blog_id, post_id
+                )
+                if post_data:
+                    if self.engagement_client:
+                        await loop.run_in_executor(
+                            None, fill_engagement_counts_api, self.engagement_client, post_data
+                        )
+                    fill_missing_counts(post_data)
+                else:
+                    self.failed_url_manager.add_failed(url, reason)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                logger.debug(f"PostView 요청 실패: {url} - {str(e)}")
+                self.failed_url_manager.add_failed(url, f"오류: {str(e)}")
+            except Exception as e:
+                logger.error(f"❌ 게시물 처리 오류: {url} - {str(e)}")
+                self.failed_url_manager.add_failed(url, f"오류: {str(e)}")
+                post_data = None
+            finally:
+                await loop.run_in_executor(None, self._record, keyword, result, post_data)
+    
+    def _record(self, keyword: str, result: Dict, post_data: Optional[Dict]):
+        self.collector.record(keyword, result, post_data)
+        self.collector.after_crawl()
+    
+    async def crawl_keyword(self, keyword: str, target: int):
+        """키워드 검색 후 결과를 동시에 크롤링"""
+        self.collector.register_keyword(keyword, target)
+        search_results = await self.search_keyword(keyword, MAX_SEARCH_RESULTS)
+        if not search_results:
+            logger.warning(f"'{keyword}' 검색 결과 없음")
+            return
+        outcomes = await asyncio.gather(*(self.crawl_post(keyword, result) for result in search_results),
+                                        return_exceptions=True)
+        for outcome in outcomes:
+            if isinstance(outcome, Exception):
+                logger.error(f"❌ '{keyword}' 게시물 처리 오류: {str(outcome)}")
+    
+    async def run(self):
+        timeout = aiohttp.ClientTimeout(total=PAGE_LOAD_TIMEOUT)
+        connector = aiohttp.TCPConnector(limit=ASYNC_MAX_CONCURRENCY)
+        headers = {
+            'User-Agent': random.choice(USER_AGENTS),
+            'Referer': 'https://blog.naver.com/',
+            'Accept-Language': 'ko-KR,ko;q=0.9'
+        }
+        self.post_semaphore = asyncio.Semaphore(ASYNC_MAX_CONCURRENCY)
+        
+        async with aiohttp.ClientSession(timeout=timeout, connector=connector,
+                                         headers=headers) as session:
+            self.session = session
+            try:
+                outcomes = await asyncio.gather(*(
+                    self.crawl_keyword(kw_info["keyword"], kw_info["target"])
+                    for kw_info in ALL_KEYWORDS
+                ), return_exceptions=True)
+                for kw_info, outcome in zip(ALL_KEYWORDS, outcomes):
+                    if isinstance(outcome, Exception):
+                        logger.error(f"❌ '{kw_info['keyword']}' 키워드 처리 오류: {str(outcome)}")
+            finally:
+                if self.engagement_client:
+                    self.engagement_client.close()
+
+# ===========================
+# v9.2: 키워드 동시 검색 파이프라인
+# ===========================
+
+class KeywordSearchPipeline:
+    """모든 키워드를 동시에 검색하며 결과를 페이지 단위로 워커 풀 큐에 투입
+    
+    - 큐(크기: crawling.task_queue_size)가 가득 차면 검색 스레드가 대기 (prefetch 상한)
+    - 키워드 목표가 달성되면 남은 API 페이지는 호출하지 않음
+    - API 호출은 API_RATE_LIMITER / API_CALL_BUDGET을 공유
+    - 저널이 있으면 큐 투입/검색 위치를 기록하고, 재시작 시 그 위치부터 이어서 검색
+    """
+    
+    def __init__(self, pool: CrawlerWorkerPool, collector: CrawlCollector):
+        self.pool = pool
+        self.collector = collector
+        self.journal = collector.journal
+        self.resubmitted: Set[str] = set()  # 이번 실행에서 저널 미처리 작업으로 다시 투입한 post_id
+    
+    def run(self, keywords: List[Dict]):
+        """키워드 검색 스레드 실행 (모든 검색 결과가 큐에 들어가면 반환)"""
+        for kw_info in keywords:
+            self.collector.register_keyword(kw_info["keyword"], kw_info["target"])
+        
+        # v9.2: 이전 실행에서 큐에 넣었지만 처리되지 않은 작업부터 다시 투입
+        if self.journal:
+            pending = self.journal.pending_tasks()
+            if pending:
+                logger.info(f"🔁 미처리 작업 {len(pending)}개 다시 투입")
+            for keyword, result in pending:
+                if self.pool.stop_event.is_set():
+                    return
+                self.resubmitted.add(result['post_id'])
+                self.pool.submit(keyword, result)
+        
+        executor = ThreadPoolExecutor(max_workers=SEARCH_CONCURRENCY,
+                                      thread_name_prefix="keyword-search")
+        try:
+            futures = [executor.submit(self._search_keyword, kw_info["keyword"])
+                       for kw_info in keywords]
+            for future in futures:
+                future.result()
+        except BaseException:
+            # Ctrl+C 등: 검색 스레드가 다음 결과/페이지에서 바로 멈추도록 먼저 중지 신호
+            self.pool.stop_event.set()
+            executor.shutdown(cancel_futures=True)
+            raise
+        executor.shutdown()
+    
+    def _should_stop(self, keyword: str) -> bool:
+        return self.pool.stop_event.is_set() or self.collector.keyword_done(keyword)
+    
+    def _search_keyword(self, keyword: str):
+        if self._should_stop(keyword):
+            return
+        
+        cursor = None
+        if self.journal:
+            if self.journal.keyword_exhausted(keyword):
+                return
+            cursor = self.journal.get_cursor(keyword)
+        
+        if cursor:
+            logger.info(f"🔍 키워드 검색 재개: {keyword} ({cursor['collected']}개 이후)")
+        else:
+            logger.info(f"🔍 키워드 검색 시작: {keyword} (목표: {self.collector.keyword_targets[keyword]}개)")
+        submitted = 0
+        
+        try:
+            for page_results, next_cursor in iter_search_naver_blog(keyword, MAX_SEARCH_RESULTS, cursor):
+                for result in page_results:
+                    if self._should_stop(keyword):
+                        return
+                    if self.journal:
+                        # 검색 위치가 기록되지 않은 페이지는 다시 받으므로 이미 다시 투입한 작업도 건너뜀
+                        if self.journal.is_done(result['post_id']) or result['post_id'] in self.resubmitted:
+                            continue
+                        self.journal.record_queued(keyword, result)
+                    self.pool.submit(keyword, result)
+                    submitted += 1
+                
+                # 페이지의 모든 결과가 큐에 들어간 뒤에 검색 위치 기록
+                if self.journal:
+                    self.journal.record_cursor(keyword, next_cursor)
+        except Exception as e:
+            logger.error(f"❌ '{keyword}' 검색 오류: {str(e)}")
+            return
+        
+        if self.journal and not self.pool.stop_event.is_set():
+            self.journal.record_cursor(keyword, {'done': True})
+        
+        if submitted == 0 and not cursor:
+            logger.warning(f"'{keyword}' 검색 결과 없음")
+
 # ===========================
 # 메인 함수
 # ===========================
 
+def save_results(writer: PostSegmentWriter, failed_url_manager: FailedURLManager):
+    """최종 CSV 및 실패 URL 저장 (v9.2: 세그먼트를 이어 붙여 생성, 동기/비동기 엔진 공용)"""
+    writer.close()
+    
+    if writer.total_written:
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        filename = f'naver_blog_pm_v9_1_final_{timestamp}.csv'
+        
+        logger.info(f"\n{'='*70}")
+        
+        # v9.2: 공용 Parquet 데이터셋 (다음 단계는 필요한 컬럼만 읽음)
+        if 'parquet' in OUTPUT_FORMATS:
+            total = writer.export_parquet()
+            if total:
+                logger.info(f"💾 Parquet 저장 완료: {pmik_storage.dataset_path(PARQUET_DATASET)} ({total}개)")
+        
+        # v9.2: 로컬 웨어하우스 upsert (post_id 기준, 배치 트랜잭션)
+        if 'warehouse' in OUTPUT_FORMATS:
+            with Warehouse() as warehouse:
+                warehouse.upsert_iter('naver_blog_posts', writer.iter_posts())
+                logger.info(f"💾 웨어하우스 반영: naver_blog_posts {warehouse.count('naver_blog_posts'):,}행")
+        
+        # Excel용 CSV - 컬럼 순서: config.yaml output.columns
+        if 'csv' in OUTPUT_FORMATS:
+            writer.export_csv(filename)
+            logger.info(f"💾 저장 완료: {filename}")
+        
+        logger.info(f"📊 총 수집: {writer.total_written}개 (세그먼트 {len(writer.segment_paths)}개)")
+        logger.info(f"📋 컬럼: {len(OUTPUT_COLUMNS)}개")
+        logger.info(f"{'='*70}")
+    else:
+        logger.warning("⚠️  수집된 게시물이 없습니다.")
+    
+    failed_url_manager.save_to_file()
+    if failed_url_manager.get_failed_count() > 0:
+        logger.info(f"❌ 실패 URL: {failed_url_manager.get_failed_count()}개 (failed_urls.json)")
+
 def main():
-    """메인 실행 함수 (v8.3)"""
+    """메인 실행 함수 (v9.2: 키워드 동시 검색 + 멀티 드라이버 워커 풀)"""
     logger.info("="*70)
     logger.info(f"🚀 PM International 네이버 블로그 크롤러 v{VERSION} 시작")
     logger.info(f"🎯 목표: 10,000~15,000개 (품질 우선)")
@@ -1294,10 +3421,8 @@ def main():
         logger.info(f"🧪 테스트 모드: {TEST_DURATION_MINUTES}분 제한")
     logger.info("="*70)
     
-    driver = setup_driver()
     stats = CrawlStats()
     failed_url_manager = FailedURLManager()
-    adaptive = AdaptiveDelay(initial_min=REQUEST_DELAY_MIN, initial_max=REQUEST_DELAY_MAX)
     
     # v9.1: 새로운 관리자 클래스
     error_recovery = ErrorRecoveryManager()
@@ -1307,159 +3432,42 @@ def main():
     # 이전 데이터 로드
     duplicate_checker.load_previous_data()
     
-    # 테스트 모드 시작 시간
-    test_start_time = time.time() if TEST_MODE else None
-    
     # v7.7: 키워드별 통계 초기화
     for kw_info in ALL_KEYWORDS:
         stats.init_keyword(kw_info["keyword"], kw_info["target"])
     
-    collected_posts = []
-    consecutive_errors = 0
-    crawl_count = 0
-    keyword_collected = {}  # 키워드별 수집 개수
+    # v9.2: 저널이 남아 있으면 이전 실행을 이어서 진행 (같은 run_id의 세그먼트에 추가)
+    journal = CrawlJournal() if JOURNAL_ENABLED else None
+    writer = PostSegmentWriter(journal.run_id if journal else None)
+    collector = CrawlCollector(stats, duplicate_checker, checkpoint_manager, writer,
+                               failed_url_manager, journal)
+    collector.restore_from_journal()
+    
+    # v9.2: 워커 풀 시작 (워커마다 드라이버 1개)
+    pool = CrawlerWorkerPool(NUM_WORKERS, collector, failed_url_manager)
+    pool.start()
     
     try:
-        # v7.7: 키워드별 크롤링 (목표 개수 제한)
-        for kw_info in ALL_KEYWORDS:
-            keyword = kw_info["keyword"]
-            target = kw_info["target"]
-            keyword_collected[keyword] = 0
-            
-            if len(collected_posts) >= TOTAL_TARGET:
-                break
-            
-            logger.info(f"\n{'='*70}")
-            logger.info(f"🔍 키워드 검색: {keyword} (목표: {target}개)")
-            logger.info(f"{'='*70}")
-            
-            search_results = search_naver_blog(keyword, MAX_SEARCH_RESULTS)
-            
-            if not search_results:
-                logger.warning(f"'{keyword}' 검색 결과 없음")
-                continue
-            
-            for result in search_results:
-                # 전체 목표 달성 체크
-                if len(collected_posts) >= TOTAL_TARGET:
-                    break
-                
-                # 키워드별 목표 달성 체크
-                if keyword_collected[keyword] >= target:
-                    logger.info(f"✅ '{keyword}' 목표 달성: {keyword_collected[keyword]}/{target}")
-                    break
-                
-                blog_id = result['blog_id']
-                post_id = result['post_id']
-                normalized_url = normalize_blog_url(blog_id, post_id)
-                
-                # 검색 시도 카운트
-                stats.add_searched(keyword)
-                
-                # 중복 체크 (v9.1: 강화)
-                if duplicate_checker.is_duplicate(post_id=post_id, url=normalized_url):
-                    stats.add_duplicate(keyword)
-                    continue
-                
-                logger.info(f"[전체: {len(collected_posts)+1}/{TOTAL_TARGET}] "
-                           f"[{keyword}: {keyword_collected[keyword]+1}/{target}] 크롤링 중...")
-                
-                # 크롤링 실행
-                post_data = crawl_blog_post_selenium(
-                    driver, normalized_url, blog_id, post_id, failed_url_manager
-                )
-                
-                if post_data:
-                    # 중복 체크 (v9.1: 지문 기반)
-                    fingerprint = generate_post_fingerprint(post_data)
-                    if not duplicate_checker.is_duplicate(fingerprint=fingerprint):
-                        collected_posts.append(post_data)
-                        duplicate_checker.add(post_id=post_id, url=normalized_url, fingerprint=fingerprint)
-                        duplicate_checker.analyze_partner_id(post_data.get('sponsor_partner_id'))
-                        keyword_collected[keyword] += 1
-                        stats.add_success(keyword)
-                        consecutive_errors = 0
-                        adaptive.on_success()
-                        logger.info(f"✅ 수집 완료: {post_data['title'][:50]}")
-                    else:
-                        stats.add_duplicate(keyword)
-                else:
-                    stats.add_filtered(keyword)
-                    consecutive_errors += 1
-                    adaptive.on_fail()
-                
-                # 연속 에러 시 드라이버 재시작
-                if consecutive_errors >= MAX_CONSECUTIVE_ERRORS:
-                    logger.warning(f"⚠️  연속 {MAX_CONSECUTIVE_ERRORS}회 에러 - 드라이버 재시작 (v7.6: 대용량 최적화)")
-                    driver.quit()
-                    time.sleep(3)
-                    driver = setup_driver()
-                    consecutive_errors = 0
-                    gc.collect()
-                
-                crawl_count += 1
-                
-                # v9.1: 체크포인트 저장
-                if checkpoint_manager.should_save():
-                    checkpoint_manager.save_checkpoint(collected_posts, stats)
-                
-                # v9.1: 테스트 모드 시간 체크
-                if TEST_MODE and test_start_time:
-                    elapsed_minutes = (time.time() - test_start_time) / 60
-                    if elapsed_minutes >= TEST_DURATION_MINUTES:
-                        logger.info(f"⏰ 테스트 시간 종료: {elapsed_minutes:.1f}분")
-                        break
-                
-                # 적응형 대기 시간
-                delay = adaptive.get_delay()
-                time.sleep(delay)
-                
-                # v7.7: 주기적 통계 출력 (50개마다)
-                if crawl_count % 50 == 0:
-                    stats.print_keyword_stats()
-                    gc.collect()
-            
-            # 키워드 완료 후 짧은 대기
-            if len(collected_posts) < TOTAL_TARGET:
-                time.sleep(random.uniform(1, 2))
+        # v9.2: 모든 키워드를 동시에 검색하며 결과를 바로 워커 큐에 투입
+        KeywordSearchPipeline(pool, collector).run(ALL_KEYWORDS)
+        
+        # 남은 작업 처리 대기
+        pool.wait_until_done()
+        pool.shutdown()
         
         # v9.1: 최종 통계 출력
         stats.print_keyword_stats()
         duplicate_checker.print_partner_stats()
+        PAGE_READINESS.print_summary()
+        RESOURCE_STATS.print_summary()
         stats.print_stats()
         
-        # CSV 저장
-        if collected_posts:
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            filename = f'naver_blog_pm_v9_1_final_{timestamp}.csv'
-            
-            df = pd.DataFrame(collected_posts)
-            
-            # 컬럼 순서 명시
-            column_order = [
-                'platform', 'post_id', 'blog_id', 'url', 'title', 'content',
-                'published_datetime', 'sponsor_phone', 'sponsor_partner_id',
-                'like_count', 'comment_count', 'hashtags', 'image_urls',
-                'video_urls', 'collected_date'
-            ]
-            
-            df = df[column_order]
-            df.to_csv(filename, index=False, encoding='utf-8-sig')
-            
-            logger.info(f"\n{'='*70}")
-            logger.info(f"💾 저장 완료: {filename}")
-            logger.info(f"📊 총 수집: {len(collected_posts)}개")
-            logger.info(f"📋 컬럼: {len(column_order)}개")
-            logger.info(f"{'='*70}")
-        else:
-            logger.warning("⚠️  수집된 게시물이 없습니다.")
-        
-        failed_url_manager.save_to_file()
-        if failed_url_manager.get_failed_count() > 0:
-            logger.info(f"❌ 실패 URL: {failed_url_manager.get_failed_count()}개 (failed_urls.json)")
+        save_results(writer, failed_url_manager)
+        if journal:
+            journal.close(complete=True)
     
     except KeyboardInterrupt:
-        logger.info("\n⚠️  사용자 중단")
+        logger.info("\n⚠️  사용자 중단 (다음 실행 시 이어서 진행)")
         stats.print_stats()
     
     except Exception as e:
@@ -1469,11 +3477,72 @@ def main():
         stats.print_stats()
     
     finally:
-        driver.quit()
+        pool.shutdown()
+        writer.close()  # v9.2: 중단 시에도 기록된 세그먼트/저널은 보존
+        if journal:
+            journal.close()
+        duplicate_checker.close()
         logger.info("✅ 드라이버 종료")
         logger.info("="*70)
         logger.info("🏁 크롤링 완료")
         logger.info("="*70)
 
+async def async_main():
+    """비동기 엔진 실행 함수 (v9.2: crawling.async_engine.enabled)"""
+    logger.info("="*70)
+    logger.info(f"🚀 PM International 네이버 블로그 크롤러 v{VERSION} 시작 (비동기 엔진)")
+    logger.info(f"🔍 키워드: {len(ALL_KEYWORDS)}개 동시 처리")
+    logger.info(f"⚡ 최대 동시 요청: {ASYNC_MAX_CONCURRENCY}개")
+    if TEST_MODE:
+        logger.info(f"🧪 테스트 모드: {TEST_DURATION_MINUTES}분 제한")
+    logger.info("="*70)
+    
+    if aiohttp is None:
+        logger.error("❌ aiohttp가 설치되지 않았습니다: pip install aiohttp")
+        return
+    
+    stats = CrawlStats()
+    failed_url_manager = FailedURLManager()
+    checkpoint_manager = CheckpointManager()
+    duplicate_checker = DuplicateChecker()
+    duplicate_checker.load_previous_data()
+    
+    for kw_info in ALL_KEYWORDS:
+        stats.init_keyword(kw_info["keyword"], kw_info["target"])
+    
+    journal = CrawlJournal() if JOURNAL_ENABLED else None
+    writer = PostSegmentWriter(journal.run_id if journal else None)
+    collector = CrawlCollector(stats, duplicate_checker, checkpoint_manager, writer,
+                               failed_url_manager, journal)
+    collector.restore_from_journal()
+    engine = AsyncCrawlEngine(collector, failed_url_manager)
+    
+    try:
+        await engine.run()
+        
+        stats.print_keyword_stats()
+        duplicate_checker.print_partner_stats()
+        stats.print_stats()
+        
+        save_results(writer, failed_url_manager)
+        if journal:
+            journal.close(complete=True)
+    
+    except asyncio.CancelledError:
+        logger.info("\n⚠️  사용자 중단 (다음 실행 시 이어서 진행)")
+        stats.print_stats()
+    
+    finally:
+        writer.close()
+        if journal:
+            journal.close()
+        duplicate_checker.close()
+        logger.info("="*70)
+        logger.info("🏁 크롤링 완료")
+        logger.info("="*70)
+
 if __name__ == "__main__":
-    main()
+    if ASYNC_ENGINE_ENABLED:
+        asyncio.run(async_main())
+    else:
+        main()
@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+저장된 네이버 블로그 수집 결과의 추천인 정보 일괄 재추출 (v9.2)
+
+추천인 패턴(SPONSOR_PHONE_PATTERNS, SPONSOR_PARTNER_ID_PATTERNS)을 수정한 뒤
+재크롤링 없이 sponsor_phone, sponsor_partner_id를 다시 계산한다.
+
+사용법:
+    python reextract_sponsor_info.py <입력.csv|입력.parquet> [출력 경로]
+
+출력:
+- sponsor_phone, sponsor_partner_id (갱신)
+- sponsor_phone_rule, sponsor_partner_id_rule (적용된 패턴 이름)
+- sponsor_phone_match, sponsor_partner_id_match (매칭된 원문)
+"""
+
+import sys
+
+from pm_naver_blog_crawler_v9_1_final import reextract_sponsor_file
+
+def main():
+    if len(sys.argv) < 2:
+        print(__doc__)
+        sys.exit(1)
+    
+    input_path = sys.argv[1]
+    output_path = sys.argv[2] if len(sys.argv) > 2 else None
+    reextract_sponsor_file(input_path, output_path)
+
+if __name__ == "__main__":
+    main()
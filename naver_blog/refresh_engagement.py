@@ -0,0 +1,27 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+이전에 수집한 네이버 블로그 게시물의 좋아요/댓글 수 갱신 (v9.2)
+
+본문은 다시 받지 않고 참여 지표 API로 카운트만 조회하여
+engagement_snapshots.sqlite3에 시계열 스냅샷으로 추가한다.
+갱신 대상은 게시물 나이별 갱신 주기가 지난 것 중 성장 속도가 빠른 순
+(config.yaml engagement_api.refresh).
+
+사용법:
+    python refresh_engagement.py [최대 게시물 수]
+
+Cron 예시 (6시간마다):
+    0 */6 * * * cd ~/PMIK-sns-analysis/naver_blog && python refresh_engagement.py >> ~/logs/engagement.log 2>&1
+"""
+
+import sys
+
+from pm_naver_blog_crawler_v9_1_final import refresh_engagement, REFRESH_MAX_POSTS
+
+def main():
+    limit = int(sys.argv[1]) if len(sys.argv) > 1 else REFRESH_MAX_POSTS
+    refresh_engagement(limit)
+
+if __name__ == "__main__":
+    main()
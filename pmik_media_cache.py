@@ -0,0 +1,342 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+PMIK SNS 분석 미디어 캐시 (내용 주소 방식)
+
+이미지 OCR, 비디오 프레임 OCR, Whisper 단계가 같은 이미지/영상을 매번 다시
+내려받지 않도록 로컬에 보관한다. OCR 임계값이나 모델을 바꿔 재처리해도
+네트워크를 다시 타지 않는다.
+
+- 원본은 SHA-256 해시 경로에 한 번만 저장 (objects/ab/abcdef…)
+- 정규화한 URL → 해시 인덱스 (SQLite)
+- ETag / Last-Modified 재검증 (revalidate_after가 지난 항목만, 304면 재사용)
+- 전체 용량이 max_bytes를 넘으면 가장 오래 안 쓴 항목부터 삭제 (LRU)
+  - 최근 EVICT_GRACE_SECONDS 안에 조회/저장한 항목은 삭제하지 않음 (다른 스레드가 받은
+    경로를 아직 쓰고 있을 수 있음 - 예: OCRPipeline의 디코딩 대기열)
+- 네이버 이미지/영상은 Referer: https://blog.naver.com/ 로 요청
+
+사용 예:
+    from pmik_media_cache import MediaCache
+
+    cache = MediaCache()
+    image_bytes = cache.get_bytes(image_url)   # 이미지 OCR
+    video_path = cache.get_path(video_url)     # OpenCV / Whisper에 파일 경로로 전달
+    print(cache.get_stats())
+"""
+
+import hashlib
+import logging
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+CACHE_ROOT = Path(__file__).resolve().parent / 'data' / 'media_cache'
+MAX_CACHE_BYTES = 10 * 1024 ** 3  # 10GB
+EVICT_GRACE_SECONDS = 600  # 저장 중 LRU 삭제에서 제외하는 최근 사용 항목
+CHUNK_SIZE = 1024 * 1024
+
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+
+# 호스트 → Referer (네이버 CDN은 Referer 없으면 403)
+REFERERS = {
+    'pstatic.net': 'https://blog.naver.com/',
+    'naver.net': 'https://blog.naver.com/',
+    'naver.com': 'https://blog.naver.com/',
+}
+
+def normalize_url(url: str) -> str:
+    """캐시 키용 URL 정규화 (스킴/호스트 소문자, 프래그먼트 제거, 쿼리 정렬)
+
+    쿼리는 유지한다 - 네이버 이미지의 ?type=w966 등은 다른 크기의 파일이다.
+    """
+    parts = urlsplit(url.strip())
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path or '/', query, ''))
+
+def referer_for(url: str) -> Optional[str]:
+    host = urlsplit(url).netloc.lower()
+    for suffix, referer in REFERERS.items():
+        if host == suffix or host.endswith('.' + suffix):
+            return referer
+    return None
+
+class MediaCache:
+    """URL → SHA-256 내용 주소 캐시 (스레드 안전)"""
+
+    def __init__(self, root=CACHE_ROOT, max_bytes: int = MAX_CACHE_BYTES,
+                 revalidate_after: Optional[float] = None, timeout: float = 30):
+        """
+        Args:
+            max_bytes: 캐시 최대 용량 - 넘으면 LRU 삭제
+            revalidate_after: 이 시간(초)이 지난 항목은 ETag/Last-Modified로 재검증
+                              (None이면 재검증 없이 항상 캐시 사용)
+        """
+        self.root = Path(root)
+        self.objects_dir = self.root / 'objects'
+        self.objects_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.revalidate_after = revalidate_after
+        self.timeout = timeout
+
+        self.session = requests.Session()
+        self.session.headers['User-Agent'] = USER_AGENT
+
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(self.root / 'index.sqlite3', check_same_thread=False)
+        with self.conn:
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute('''
+                CREATE TABLE IF NOT EXISTS entries (
+                    url_key TEXT PRIMARY KEY,
+                    sha256 TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    etag TEXT,
+                    last_modified TEXT,
+                    content_type TEXT,
+                    fetched_at REAL,
+                    last_access REAL
+                )
+            ''')
+            self.conn.execute('CREATE INDEX IF NOT EXISTS idx_entries_sha256 ON entries (sha256)')
+            self.conn.execute('CREATE INDEX IF NOT EXISTS idx_entries_last_access ON entries (last_access)')
+
+        self.stats = {'hits': 0, 'misses': 0, 'revalidated': 0, 'downloaded_bytes': 0, 'evicted': 0, 'probed': 0}
+
+    # ---------------------------
+    # 조회
+    # ---------------------------
+
+    def object_path(self, sha256: str) -> Path:
+        return self.objects_dir / sha256[:2] / sha256
+
+    def _lookup(self, url_key: str) -> Optional[Dict]:
+        with self.lock:
+            row = self.conn.execute(
+                'SELECT sha256, size, etag, last_modified, fetched_at FROM entries WHERE url_key = ?', [url_key]
+            ).fetchone()
+        if not row or not self.object_path(row[0]).exists():
+            return None
+        return dict(zip(['sha256', 'size', 'etag', 'last_modified', 'fetched_at'], row))
+
+    def _touch(self, url_key: str, fetched: bool = False):
+        now = time.time()
+        with self.lock, self.conn:
+            if fetched:
+                self.conn.execute('UPDATE entries SET last_access = ?, fetched_at = ? WHERE url_key = ?',
+                                  [now, now, url_key])
+            else:
+                self.conn.execute('UPDATE entries SET last_access = ? WHERE url_key = ?', [now, url_key])
+
+    def get_path(self, url: str) -> Path:
+        """URL의 로컬 파일 경로 (없으면 다운로드)
+
+        Raises:
+            requests.RequestException: 다운로드 실패 (캐시에 없는 경우)
+        """
+        url_key = normalize_url(url)
+        entry = self._lookup(url_key)
+
+        if entry:
+            stale = (self.revalidate_after is not None
+                     and time.time() - (entry['fetched_at'] or 0) > self.revalidate_after)
+            if not stale:
+                self._count('hits')
+                self._touch(url_key)
+                return self.object_path(entry['sha256'])
+            try:
+                return self._download(url, url_key, entry)
+            except requests.RequestException as e:
+                # 재검증 실패 (오프라인 등) - 받아 둔 원본을 그대로 사용
+                logger.debug(f"재검증 실패, 캐시 사용: {url} - {e}")
+                self._count('hits')
+                self._touch(url_key)
+                return self.object_path(entry['sha256'])
+
+        self._count('misses')
+        return self._download(url, url_key, None)
+
+    def get_bytes(self, url: str) -> bytes:
+        return self.get_path(url).read_bytes()
+
+    def get_or_create(self, key: str, producer: Callable[[Path], None], suffix: str = '') -> Path:
+        """다운로드가 아닌 방법(yt-dlp 등)으로 만드는 파일 캐시
+
+        Args:
+            key: 캐시 키 (예: 'yt-audio:<video_id>')
+            producer: 주어진 경로에 파일을 만드는 함수
+        """
+        entry = self._lookup(key)
+        if entry:
+            self._count('hits')
+            self._touch(key)
+            return self.object_path(entry['sha256'])
+
+        self._count('misses')
+        with tempfile.TemporaryDirectory(dir=self.root) as tmp_dir:
+            tmp_path = Path(tmp_dir) / f'output{suffix}'
+            producer(tmp_path)
+            if not tmp_path.exists():
+                raise FileNotFoundError(f"{key}: 생성된 파일이 없습니다")
+            return self._store_file(key, tmp_path, {})
+
+    def _count(self, key: str, amount: int = 1):
+        with self.lock:
+            self.stats[key] += amount
+
+    def fetch_prefix(self, url: str, size: int = 4096) -> Tuple[Optional[int], bytes]:
+        """캐시에 저장하지 않고 앞부분만 받기 (Range 요청) - 이미지 헤더로 크기 판단용
+
+        Returns:
+            (전체 크기 - 모르면 None, 앞 size바이트)
+
+        Raises:
+            requests.RequestException: 요청 실패
+        """
+        headers = {'Range': f'bytes=0-{size - 1}'}
+        referer = referer_for(url)
+        if referer:
+            headers['Referer'] = referer
+        with self.session.get(url, headers=headers, timeout=self.timeout, stream=True) as response:
+            response.raise_for_status()
+            prefix = response.raw.read(size, decode_content=True)
+            if response.status_code == 206:  # Content-Range: bytes 0-4095/54321
+                total = response.headers.get('Content-Range', '').rpartition('/')[2]
+            else:  # Range 미지원 서버 - 앞부분만 읽고 연결 종료
+                total = response.headers.get('Content-Length', '')
+        self._count('probed')
+        return (int(total) if total.isdigit() else None), prefix
+
+    def contains(self, url: str) -> bool:
+        return self._lookup(normalize_url(url)) is not None
+
+    # ---------------------------
+    # 다운로드 / 저장
+    # ---------------------------
+
+    def _download(self, url: str, url_key: str, entry: Optional[Dict]) -> Path:
+        headers = {}
+        referer = referer_for(url)
+        if referer:
+            headers['Referer'] = referer
+        if entry:
+            if entry['etag']:
+                headers['If-None-Match'] = entry['etag']
+            if entry['last_modified']:
+                headers['If-Modified-Since'] = entry['last_modified']
+
+        with self.session.get(url, headers=headers, timeout=self.timeout, stream=True) as response:
+            if entry and response.status_code == 304:
+                self._count('revalidated')
+                self._touch(url_key, fetched=True)
+                return self.object_path(entry['sha256'])
+            response.raise_for_status()
+            if entry:
+                self._count('misses')  # 재검증했지만 바뀐 항목 - 다시 받음
+
+            # 받는 동안 해시 계산 → 임시 파일 → 해시 경로로 이동
+            fd, tmp_name = tempfile.mkstemp(dir=self.root, suffix='.part')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+                        f.write(chunk)
+                meta = {
+                    'etag': response.headers.get('ETag'),
+                    'last_modified': response.headers.get('Last-Modified'),
+                    'content_type': response.headers.get('Content-Type'),
+                }
+                path = self._store_file(url_key, Path(tmp_name), meta)
+            finally:
+                if os.path.exists(tmp_name):
+                    os.unlink(tmp_name)
+        return path
+
+    def _store_file(self, url_key: str, tmp_path: Path, meta: Dict) -> Path:
+        digest = hashlib.sha256()
+        with open(tmp_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(CHUNK_SIZE), b''):
+                digest.update(chunk)
+        sha256 = digest.hexdigest()
+        size = tmp_path.stat().st_size
+
+        path = self.object_path(sha256)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if not path.exists():  # 같은 내용은 한 번만 저장
+            os.replace(tmp_path, path)
+            self._count('downloaded_bytes', size)
+
+        now = time.time()
+        with self.lock, self.conn:
+            self.conn.execute('''
+                INSERT INTO entries (url_key, sha256, size, etag, last_modified, content_type, fetched_at, last_access)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (url_key) DO UPDATE SET
+                    sha256 = excluded.sha256, size = excluded.size, etag = excluded.etag,
+                    last_modified = excluded.last_modified, content_type = excluded.content_type,
+                    fetched_at = excluded.fetched_at, last_access = excluded.last_access
+            ''', [url_key, sha256, size, meta.get('etag'), meta.get('last_modified'),
+                  meta.get('content_type'), now, now])
+        self.evict()
+        return path
+
+    # ---------------------------
+    # LRU 삭제
+    # ---------------------------
+
+    def total_bytes(self) -> int:
+        with self.lock:
+            row = self.conn.execute(
+                'SELECT SUM(size) FROM (SELECT sha256, MAX(size) AS size FROM entries GROUP BY sha256)'
+            ).fetchone()
+        return row[0] or 0
+
+    def evict(self, grace_seconds: float = EVICT_GRACE_SECONDS):
+        """max_bytes 이하가 될 때까지 가장 오래 안 쓴 원본 삭제 (같은 원본을 가리키는 URL도 함께)
+
+        Args:
+            grace_seconds: 이 시간 안에 조회/저장한 원본은 남김 (0이면 제외 없음 - 캐시를 쓰는 곳이 없을 때)
+        """
+        excess = self.total_bytes() - self.max_bytes
+        if excess <= 0:
+            return
+
+        with self.lock:
+            candidates = self.conn.execute(
+                'SELECT sha256, MAX(size), MAX(last_access) AS recent FROM entries '
+                'GROUP BY sha256 HAVING recent < ? ORDER BY recent', [time.time() - grace_seconds]
+            ).fetchall()
+            for sha256, size, _ in candidates:
+                if excess <= 0:
+                    break
+                with self.conn:
+                    self.conn.execute('DELETE FROM entries WHERE sha256 = ?', [sha256])
+                try:
+                    self.object_path(sha256).unlink()
+                except FileNotFoundError:
+                    pass
+                excess -= size
+                self.stats['evicted'] += 1
+
+    def get_stats(self) -> Dict:
+        with self.lock:
+            stats = dict(self.stats)
+        requests_total = stats['hits'] + stats['misses'] + stats['revalidated']
+        return {
+            **stats,
+            'hit_rate': f"{(stats['hits'] + stats['revalidated']) / max(requests_total, 1) * 100:.1f}%",
+            'cache_size_mb': round(self.total_bytes() / 1024 ** 2, 1),
+        }
+
+    def close(self):
+        """저장 중 삭제를 미룬 최근 항목까지 포함해 max_bytes로 정리한 뒤 종료"""
+        self.evict(grace_seconds=0)
+        self.session.close()
+        self.conn.close()
@@ -0,0 +1,635 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+PMIK SNS 분석 로컬 CPU OCR 파이프라인 (EasyOCR)
+
+GPU 없는 VM에서 이미지 OCR을 돌리기 위한 단계별 병렬 처리.
+이미지 한 장씩 받아서 한 개의 Reader로 OCR하던 방식(OCRProcessor.extract_text_from_url)은
+다운로드 대기와 OCR이 번갈아 일어나 코어 하나만 사용했다.
+
+단계:
+1. 다운로드 - 스레드 (pmik_media_cache, 이미 받은 이미지는 네트워크 없이 읽음)
+2. 디코딩/리사이즈 - 스레드 (PIL은 디코딩 중 GIL 해제, JPEG은 draft 모드로 축소 디코딩)
+3. OCR - 프로세스 풀 (프로세스마다 easyocr.Reader 1개를 미리 로딩해 재사용,
+   이미지를 batch_size장씩 묶어 전달하고 인식기는 텍스트 영역을 묶어서 추론)
+
+각 단계 사이는 크기 제한 큐로 연결해 메모리 사용량이 일정하다.
+
+OCR 전 선별 (ImageTriage, 디코딩 단계에서 실행):
+- 크기: 헤더만 읽어 가로/세로·파일 크기가 작은 아이콘/이모티콘 제외
+  (캐시에 없는 URL은 다운로드 단계에서 Range 요청으로 앞 4KB만 받아 먼저 판단 → 전체 GET 생략)
+- 중복: 지각 해시(pHash)가 가까운 이미지는 한 번만 OCR하고 결과 공유
+  (판매자들이 같은 추천인 배너를 반복 게시). pHash는 전화번호/파트너 번호만 다른
+  배너도 같게 보므로, 후보는 축소 이미지의 블록별 밝기 차이로 한 번 더 확인
+- 텍스트 가능성: 축소 흑백 이미지의 강한 가로 경계 비율이 낮으면(사진, 단색) 제외
+
+OCR 결과 캐시 (OCRResultCache, data/ocr_cache.sqlite3):
+- (이미지 SHA-256 또는 pHash, 모델 버전·언어·입력 크기)별 전체 detections 저장
+- 다음 실행에서 같은/재인코딩된 이미지는 OCR 없이 재사용 (status: cached)
+- 신뢰도 임계값은 읽을 때 적용하므로 임계값을 바꿔도 캐시 그대로 사용
+
+사용 예:
+    from pmik_ocr import OCRPipeline
+
+    with OCRPipeline() as pipeline:
+        results = pipeline.run([{'post_id': 1, 'url': 'https://...jpg'}, ...])
+        print(pipeline.get_stats())   # 이미지/초, 코어당 이미지/초
+"""
+
+import hashlib
+import io
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from pathlib import Path
+from queue import Empty, Queue
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+from PIL import Image
+
+from pmik_media_cache import MediaCache
+
+logger = logging.getLogger(__name__)
+
+OCR_LANGUAGES = ['ko', 'en']
+DOWNLOAD_WORKERS = 16
+DECODE_WORKERS = 4
+OCR_BATCH_SIZE = 8          # 프로세스에 한 번에 넘기는 이미지 수
+RECOGNIZER_BATCH_SIZE = 16  # readtext 인식기 배치 (텍스트 영역 단위)
+MAX_IMAGE_WIDTH = 1280      # 이보다 넓은 이미지는 비율 유지 축소 (세로로 긴 이미지는 높이 유지)
+QUEUE_SIZE = 64
+
+# OCR 결과 캐시 (저장소 루트의 data/)
+OCR_CACHE_FILE = Path(__file__).resolve().parent / 'data' / 'ocr_cache.sqlite3'
+
+# OCR 전 선별 기준
+MIN_IMAGE_SIDE = 64          # 가로/세로 중 짧은 쪽 (px)
+MIN_IMAGE_BYTES = 2 * 1024
+PHASH_MAX_DISTANCE = 3       # 64비트 pHash 해밍 거리 이하면 중복 후보
+SIGNATURE_WIDTH = 160        # 중복 후보 확인용 축소 흑백 이미지 너비
+SIGNATURE_BLOCK = 4
+SIGNATURE_MAX_BLOCK_DIFF = 8   # 4x4 블록 평균 밝기 차이가 모두 이 값 미만이면 같은 이미지
+TEXT_SCORE_THRESHOLD = 0.02  # 가장 경계가 많은 띠의 강한 가로 경계 픽셀 비율
+TEXT_SCORE_WIDTH = 256
+TEXT_SCORE_BAND = 8
+
+Detections = List[Tuple[str, float]]
+
+# 정상 처리로 보는 상태 (OCR 성공, 결과 캐시 재사용, 중복 이미지의 결과 공유)
+OCR_OK_STATUSES = ('success', 'cached', 'duplicate')
+# OCR 전 선별로 생략한 상태 (실패가 아님 - 작은 아이콘/배너, 글자 없는 이미지)
+OCR_SKIPPED_STATUSES = ('skipped_small', 'skipped_no_text')
+
+# ===========================
+# OCR 프로세스 (프로세스마다 Reader 1개)
+# ===========================
+
+_reader = None
+
+def _init_worker(languages: List[str], torch_threads: int):
+    """프로세스 시작 시 1회 - 코어를 나눠 쓰도록 torch 스레드 수 제한 후 모델 로딩"""
+    global _reader
+    import torch
+    torch.set_num_threads(torch_threads)
+    import easyocr
+    _reader = easyocr.Reader(languages, gpu=False, verbose=False)
+
+def _ocr_batch(images: List[np.ndarray], recognizer_batch_size: int) -> List:
+    """이미지 묶음 OCR → 이미지별 [(텍스트, 신뢰도), ...] 또는 오류 문자열"""
+    results = []
+    for image in images:
+        try:
+            detections = _reader.readtext(image, batch_size=recognizer_batch_size)
+            results.append([(text, float(confidence)) for _, text, confidence in detections])
+        except Exception as e:
+            results.append(f'error: {str(e)[:50]}')
+    return results
+
+# ===========================
+# 디코딩 / 결과 정리
+# ===========================
+
+def load_image(path, max_width: int = MAX_IMAGE_WIDTH) -> np.ndarray:
+    """이미지 디코딩 + 너비 기준 축소 (RGB 배열)"""
+    with Image.open(path) as image:
+        width, height = image.size
+        scale = min(1.0, max_width / width) if width else 1.0
+        target = (max(1, int(width * scale)), max(1, int(height * scale)))
+        image.draft('RGB', target)  # JPEG: 축소된 크기로 바로 디코딩
+        image = image.convert('RGB')
+        if image.size[0] > target[0]:
+            image = image.resize(target, Image.LANCZOS)
+        return np.asarray(image)
+
+def summarize_detections(detections: Detections, confidence_threshold: float = 0.0,
+                         separator: str = ' ') -> Tuple[str, float]:
+    """임계값 이상인 텍스트 결합 + 평균 신뢰도"""
+    kept = [(text, confidence) for text, confidence in detections if confidence >= confidence_threshold]
+    if not kept:
+        return '', 0.0
+    return separator.join(text for text, _ in kept), sum(c for _, c in kept) / len(kept)
+
+# ===========================
+# OCR 전 선별
+# ===========================
+
+def _dct_matrix(size: int) -> np.ndarray:
+    n = np.arange(size)
+    matrix = np.cos(np.pi * (2 * n[None, :] + 1) * n[:, None] / (2 * size))
+    matrix[0] *= 1 / np.sqrt(2)
+    return matrix * np.sqrt(2 / size)
+
+_DCT_32 = _dct_matrix(32)
+
+def perceptual_hash(gray: Image.Image) -> int:
+    """DCT 기반 64비트 pHash (32x32 흑백 → 저주파 8x8 계수 > 중앙값)"""
+    pixels = np.asarray(gray.resize((32, 32), Image.LANCZOS), dtype=np.float64)
+    low = (_DCT_32 @ pixels @ _DCT_32.T)[:8, :8].flatten()
+    bits = low > np.median(low[1:])
+    return int(''.join('1' if bit else '0' for bit in bits), 2)
+
+def text_score(gray: Image.Image, width: int = TEXT_SCORE_WIDTH) -> float:
+    """텍스트 가능성 - 축소 흑백 이미지의 가로 띠(TEXT_SCORE_BAND행)별
+    강한 가로 방향 밝기 변화 픽셀 비율 중 최댓값
+
+    글자 줄은 획 경계가 촘촘해 값이 높고, 단색/그라데이션/흐린 이미지는 낮다.
+    띠 단위 최댓값이라 큰 여백 속 한 줄짜리 문구도 놓치지 않는다.
+    """
+    if gray.width > width:
+        gray = gray.resize((width, max(1, gray.height * width // gray.width)))
+    pixels = np.asarray(gray, dtype=np.int16)
+    if pixels.shape[1] < 2:
+        return 0.0
+    edges = np.abs(np.diff(pixels, axis=1)) > 60
+    rows = edges.mean(axis=1)
+    bands = len(rows) // TEXT_SCORE_BAND
+    if bands == 0:
+        return float(rows.mean())
+    return float(rows[:bands * TEXT_SCORE_BAND].reshape(bands, TEXT_SCORE_BAND).mean(axis=1).max())
+
+class PHashIndex:
+    """해밍 거리 max_distance 이하 pHash 검색
+
+    64비트를 (max_distance + 1)개 구간으로 나누면 거리가 max_distance 이하인 두 해시는
+    적어도 한 구간이 완전히 같다 (비둘기집 원리) → 구간별 사전으로 후보만 비교.
+    """
+
+    def __init__(self, max_distance: int = PHASH_MAX_DISTANCE):
+        self.max_distance = max_distance
+        self.bands = max_distance + 1
+        self.band_bits = -(-64 // self.bands)
+        self.tables = [dict() for _ in range(self.bands)]
+        self.lock = threading.Lock()
+
+    def _keys(self, phash: int):
+        mask = (1 << self.band_bits) - 1
+        return [(phash >> (band * self.band_bits)) & mask for band in range(self.bands)]
+
+    def find_or_add(self, phash: int, value, is_same: Optional[Callable] = None):
+        """가까운 해시가 있으면 그 값, 없으면 등록 후 None
+
+        Args:
+            is_same: 후보 값을 받아 정말 같은 이미지인지 확인하는 함수 (선택)
+        """
+        keys = self._keys(phash)
+        with self.lock:
+            for table, key in zip(self.tables, keys):
+                for other_hash, other_value in table.get(key, ()):
+                    if (bin(phash ^ other_hash).count('1') <= self.max_distance
+                            and (is_same is None or is_same(other_value))):
+                        return other_value
+            for table, key in zip(self.tables, keys):
+                table.setdefault(key, []).append((phash, value))
+        return None
+
+def image_signature(gray: Image.Image, width: int = SIGNATURE_WIDTH) -> np.ndarray:
+    """중복 확인용 축소 흑백 이미지 (너비 고정, 비율 유지)"""
+    height = max(1, round(gray.height * width / gray.width))
+    return np.asarray(gray.resize((width, height), Image.BILINEAR), dtype=np.uint8)
+
+def signatures_match(a: np.ndarray, b: np.ndarray) -> bool:
+    """같은 이미지(재압축/크기 변경 포함)인지 - 글자 몇 개만 달라도 해당 블록 차이로 구분"""
+    if abs(a.shape[0] - b.shape[0]) > max(2, 0.02 * a.shape[0]):
+        return False  # 비율이 다름
+    height = min(a.shape[0], b.shape[0]) // SIGNATURE_BLOCK * SIGNATURE_BLOCK
+    if height == 0:
+        return bool(np.abs(a.astype(np.int16).mean() - b.astype(np.int16).mean()) < SIGNATURE_MAX_BLOCK_DIFF)
+    diff = np.abs(a[:height].astype(np.int16) - b[:height].astype(np.int16))
+    blocks = diff.reshape(height // SIGNATURE_BLOCK, SIGNATURE_BLOCK, -1, SIGNATURE_BLOCK).mean(axis=(1, 3))
+    return bool(blocks.max() < SIGNATURE_MAX_BLOCK_DIFF)
+
+class ImageTriage:
+    """OCR 전 선별 - 작은 이미지, 중복 이미지, 글자가 없어 보이는 이미지 제외"""
+
+    def __init__(self, min_side: int = MIN_IMAGE_SIDE, min_bytes: int = MIN_IMAGE_BYTES,
+                 phash_distance: Optional[int] = PHASH_MAX_DISTANCE,
+                 text_threshold: float = TEXT_SCORE_THRESHOLD):
+        """
+        Args:
+            phash_distance: 중복 판정 해밍 거리 (None이면 중복 제거 안 함)
+            text_threshold: 텍스트 점수 하한 (0이면 텍스트 판정 안 함)
+        """
+        self.min_side = min_side
+        self.min_bytes = min_bytes
+        self.text_threshold = text_threshold
+        self.phash_distance = phash_distance
+        self.reset()
+
+    def reset(self):
+        """중복 색인 초기화 - 색인의 index는 실행별 입력 목록 기준이므로 실행마다 호출"""
+        self.index = PHashIndex(self.phash_distance) if self.phash_distance is not None else None
+
+    def check_prefix(self, total_bytes: Optional[int], prefix: bytes) -> Optional[str]:
+        """다운로드 전 - 전체 크기와 파일 앞부분(헤더)만으로 판단 (판단할 수 없으면 None)"""
+        if total_bytes is not None and total_bytes < self.min_bytes:
+            return 'skipped_small'
+        try:
+            with Image.open(io.BytesIO(prefix)) as image:
+                if min(image.size) < self.min_side:
+                    return 'skipped_small'
+        except Exception:  # 헤더가 앞부분보다 길거나(EXIF 등) 이미지가 아님 → 전체 다운로드 후 판단
+            pass
+        return None
+
+    def check_header(self, path) -> Optional[str]:
+        """파일 크기와 헤더의 가로/세로만으로 판단 (픽셀 디코딩 없음)"""
+        if os.path.getsize(path) < self.min_bytes:
+            return 'skipped_small'
+        with Image.open(path) as image:
+            if min(image.size) < self.min_side:
+                return 'skipped_small'
+        return None
+
+    def find_duplicate(self, fingerprint: Tuple[int, np.ndarray], index: int) -> Optional[int]:
+        """이번 실행에서 먼저 나온 같은 이미지의 index (없으면 등록 후 None)"""
+        if self.index is None:
+            return None
+        phash, signature = fingerprint
+        original = self.index.find_or_add(phash, (index, signature),
+                                          is_same=lambda other: signatures_match(signature, other[1]))
+        return original[0] if original is not None else None
+
+    def has_text(self, gray: Image.Image) -> bool:
+        return not self.text_threshold or text_score(gray) >= self.text_threshold
+
+def image_fingerprint(gray: Image.Image) -> Tuple[int, np.ndarray]:
+    """(pHash, 확인용 축소 이미지)"""
+    return perceptual_hash(gray), image_signature(gray)
+
+# ===========================
+# OCR 결과 캐시
+# ===========================
+
+def ocr_settings_key(languages: List[str], max_width: int, model_version: Optional[str] = None) -> str:
+    """OCR 결과에 영향을 주는 설정 (모델 버전, 언어, 입력 크기)
+
+    신뢰도 임계값은 포함하지 않는다 - 전체 detections를 저장하고 임계값은 읽을 때 적용.
+    """
+    if model_version is None:
+        try:
+            from importlib.metadata import version
+            model_version = version('easyocr')
+        except Exception:
+            model_version = 'unknown'
+    return f"easyocr={model_version}|lang={','.join(languages)}|max_width={max_width}"
+
+class OCRResultCache:
+    """OCR 결과 영구 저장소 (SQLite) - 다음 크롤링에서 같은 이미지를 다시 OCR하지 않음
+
+    - 원본 SHA-256이 같으면 바로 사용
+    - 재인코딩된 같은 배너는 pHash 후보 → 축소 이미지 블록 비교로 확인 후 사용
+      (pHash 64비트를 16비트 4구간으로 나눠 인덱스 조회)
+    - 키에 OCR 설정(ocr_settings_key)을 포함해 모델/언어를 바꾸면 새로 OCR
+    - 파일이 없는 영상 프레임은 'frame:URL@초'를 키로 저장하고 find_similar로만 조회
+    """
+
+    def __init__(self, path=OCR_CACHE_FILE, languages: List[str] = OCR_LANGUAGES,
+                 max_width: int = MAX_IMAGE_WIDTH, model_version: Optional[str] = None):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.settings = ocr_settings_key(languages, max_width, model_version)
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(self.path, check_same_thread=False)
+        with self.conn:
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute('''
+                CREATE TABLE IF NOT EXISTS ocr_cache (
+                    sha256 TEXT NOT NULL,
+                    settings TEXT NOT NULL,
+                    phash TEXT,
+                    band0 INTEGER, band1 INTEGER, band2 INTEGER, band3 INTEGER,
+                    signature BLOB,
+                    detections TEXT NOT NULL,
+                    created_at REAL,
+                    PRIMARY KEY (sha256, settings)
+                )
+            ''')
+            for band in range(4):
+                self.conn.execute(f'CREATE INDEX IF NOT EXISTS idx_ocr_cache_band{band} '
+                                  f'ON ocr_cache (settings, band{band})')
+        self.stats = {'exact_hits': 0, 'similar_hits': 0, 'stored': 0}
+
+    @staticmethod
+    def _bands(phash: int) -> List[int]:
+        return [(phash >> (16 * band)) & 0xFFFF for band in range(4)]
+
+    def get(self, sha256: str) -> Optional[Detections]:
+        with self.lock:
+            row = self.conn.execute('SELECT detections FROM ocr_cache WHERE sha256 = ? AND settings = ?',
+                                    [sha256, self.settings]).fetchone()
+        if row is None:
+            return None
+        self.stats['exact_hits'] += 1
+        return [tuple(detection) for detection in json.loads(row[0])]
+
+    def find_similar(self, fingerprint: Tuple[int, np.ndarray]) -> Optional[Detections]:
+        """pHash 해밍 거리 3 이하 + 축소 이미지 블록 비교가 같은 이미지의 결과"""
+        phash, signature = fingerprint
+        bands = self._bands(phash)
+        where = ' OR '.join(f'band{band} = ?' for band in range(4))
+        with self.lock:
+            rows = self.conn.execute(
+                f'SELECT phash, signature, detections FROM ocr_cache WHERE settings = ? AND ({where})',
+                [self.settings] + bands
+            ).fetchall()
+        for other_hash, blob, detections in rows:
+            if bin(phash ^ int(other_hash, 16)).count('1') > PHASH_MAX_DISTANCE:
+                continue
+            other = np.frombuffer(zlib.decompress(blob), dtype=np.uint8).reshape(-1, SIGNATURE_WIDTH)
+            if signatures_match(signature, other):
+                self.stats['similar_hits'] += 1
+                return [tuple(detection) for detection in json.loads(detections)]
+        return None
+
+    def put(self, sha256: str, detections: Detections,
+            fingerprint: Optional[Tuple[int, np.ndarray]] = None):
+        phash, bands, blob = None, [None] * 4, None
+        if fingerprint is not None:
+            phash = format(fingerprint[0], '016x')
+            bands = self._bands(fingerprint[0])
+            blob = zlib.compress(np.ascontiguousarray(fingerprint[1]).tobytes())
+        with self.lock, self.conn:
+            self.conn.execute(
+                'INSERT OR REPLACE INTO ocr_cache '
+                '(sha256, settings, phash, band0, band1, band2, band3, signature, detections, created_at) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                [sha256, self.settings, phash, *bands, blob,
+                 json.dumps(detections, ensure_ascii=False), time.time()]
+            )
+        self.stats['stored'] += 1
+
+    def close(self):
+        self.conn.close()
+
+def file_sha256(path) -> str:
+    """미디어 캐시 경로는 파일명이 SHA-256이므로 다시 읽지 않음"""
+    path = Path(path)
+    if len(path.name) == 64 and all(c in '0123456789abcdef' for c in path.name):
+        return path.name
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+# ===========================
+# 파이프라인
+# ===========================
+
+class OCRPipeline:
+    """다운로드(스레드) → 디코딩(스레드) → OCR(프로세스 풀) 파이프라인"""
+
+    def __init__(self, languages: List[str] = OCR_LANGUAGES, ocr_workers: Optional[int] = None,
+                 download_workers: int = DOWNLOAD_WORKERS, decode_workers: int = DECODE_WORKERS,
+                 batch_size: int = OCR_BATCH_SIZE, max_width: int = MAX_IMAGE_WIDTH,
+                 media_cache: Optional[MediaCache] = None, triage: Optional[ImageTriage] = None,
+                 result_cache: Optional[OCRResultCache] = None):
+        """
+        Args:
+            triage: OCR 전 선별 기준 (None이면 기본 ImageTriage, 끄려면 triage=False)
+            result_cache: OCR 결과 캐시 (None이면 기본 OCRResultCache, 끄려면 result_cache=False)
+        """
+        cores = os.cpu_count() or 1
+        self.cores = cores
+        self.ocr_workers = ocr_workers or cores
+        self.download_workers = download_workers
+        self.decode_workers = decode_workers
+        self.batch_size = batch_size
+        self.max_width = max_width
+        self.media_cache = media_cache or MediaCache()
+        self.triage = ImageTriage() if triage is None else triage
+        self._owns_result_cache = result_cache is None
+        self.result_cache = (OCRResultCache(languages=languages, max_width=max_width)
+                             if result_cache is None else result_cache)
+
+        # 프로세스 수 × torch 스레드 수 = 코어 수 (과다 구독 방지)
+        torch_threads = max(1, cores // self.ocr_workers)
+        self.pool = ProcessPoolExecutor(max_workers=self.ocr_workers, initializer=_init_worker,
+                                        initargs=(languages, torch_threads))
+        self.stats = {'images': 0, 'success': 0, 'download_failed': 0, 'decode_failed': 0,
+                      'skipped_small': 0, 'skipped_no_text': 0, 'duplicate': 0, 'cached': 0,
+                      'ocr_failed': 0, 'ocr_seconds': 0.0}
+
+    def run(self, items: List[Dict], progress: bool = True) -> List[Dict]:
+        """이미지 OCR
+
+        Args:
+            items: 'url' 키가 있는 dict 목록 (나머지 키는 결과에 그대로 복사)
+
+        Returns:
+            입력 순서대로 {**item, 'detections': [(텍스트, 신뢰도), ...], 'status': ...}
+            - status: success / cached (OCR 결과 캐시) / download_failed / decode_failed /
+                      skipped_small / skipped_no_text / duplicate (원본 이미지의 detections를 공유) / error: ...
+        """
+        if self.triage:
+            self.triage.reset()
+        results: List[Optional[Dict]] = [None] * len(items)
+        duplicate_of: Dict[int, int] = {}
+        fingerprints: Dict[int, Tuple] = {}  # index → (sha256, (pHash, 축소 이미지) 또는 None)
+        download_queue: Queue = Queue()
+        decode_queue: Queue = Queue(maxsize=QUEUE_SIZE)
+        ocr_queue: Queue = Queue(maxsize=QUEUE_SIZE)
+        for index, item in enumerate(items):
+            download_queue.put(index)
+
+        progress_bar = None
+        if progress:
+            from tqdm import tqdm
+            progress_bar = tqdm(total=len(items), desc="이미지 OCR")
+
+        def finish(index: int, detections: Detections, status: str):
+            results[index] = {**items[index], 'detections': detections, 'status': status}
+            self.stats[status if status in self.stats else 'ocr_failed'] += 1
+            if progress_bar:
+                progress_bar.update(1)
+
+        def download_stage():
+            while True:
+                try:
+                    index = download_queue.get_nowait()
+                except Empty:
+                    return
+                url = items[index]['url']
+                if self.triage and not self.media_cache.contains(url):
+                    # 아이콘/프로필 이미지는 앞부분(Range 요청)만 받아 판단하고 전체를 받지 않음
+                    try:
+                        status = self.triage.check_prefix(*self.media_cache.fetch_prefix(url))
+                    except Exception:
+                        status = None
+                    if status:
+                        ocr_queue.put(('done', index, [], status))
+                        continue
+                try:
+                    decode_queue.put((index, self.media_cache.get_path(url)))
+                except Exception:
+                    decode_queue.put((index, None))
+
+        def decode(index: int, path: str) -> Tuple[str, object, Optional[str]]:
+            """('done', detections, status) 또는 ('ocr', 이미지 배열, None)"""
+            try:
+                sha256 = file_sha256(path)
+                if self.result_cache:
+                    cached = self.result_cache.get(sha256)
+                    if cached is not None:
+                        return 'done', cached, 'cached'
+                if self.triage:
+                    status = self.triage.check_header(path)
+                    if status:
+                        return 'done', [], status
+                image = load_image(path, self.max_width)
+            except Exception:
+                return 'done', [], 'decode_failed'
+
+            gray = Image.fromarray(image).convert('L')
+            fingerprint = image_fingerprint(gray) if (self.triage or self.result_cache) else None
+            fingerprints[index] = (sha256, fingerprint)
+            if self.triage:
+                original = self.triage.find_duplicate(fingerprint, index)
+                if original is not None:
+                    duplicate_of[index] = original
+                    return 'done', [], 'duplicate'
+            if self.result_cache:
+                cached = self.result_cache.find_similar(fingerprint)
+                if cached is not None:
+                    return 'done', cached, 'cached'
+            if self.triage and not self.triage.has_text(gray):
+                return 'done', [], 'skipped_no_text'
+            return 'ocr', image, None
+
+        def decode_stage():
+            # 예외로 스레드가 죽으면 그 index는 끝나지 않고, 다운로드 스레드가 가득 찬
+            # decode_queue에서 멈춰 run()이 돌아오지 않는다 → 모든 index를 반드시 ocr_queue로
+            while True:
+                task = decode_queue.get()
+                if task is None:
+                    return
+                index, path = task
+                if path is None:
+                    ocr_queue.put(('done', index, [], 'download_failed'))
+                    continue
+                try:
+                    kind, payload, status = decode(index, path)
+                except Exception as e:
+                    kind, payload, status = 'done', [], f'error: {str(e)[:50]}'
+                ocr_queue.put((kind, index, payload, status))
+
+        def close_stages(downloaders, decoders):
+            for thread in downloaders:
+                thread.join()
+            for _ in decoders:
+                decode_queue.put(None)
+            for thread in decoders:
+                thread.join()
+            ocr_queue.put(None)
+
+        downloaders = [threading.Thread(target=download_stage, daemon=True) for _ in range(self.download_workers)]
+        decoders = [threading.Thread(target=decode_stage, daemon=True) for _ in range(self.decode_workers)]
+        for thread in downloaders + decoders:
+            thread.start()
+        threading.Thread(target=close_stages, args=(downloaders, decoders), daemon=True).start()
+
+        start = time.time()
+        pending = {}
+        max_pending = self.ocr_workers * 2
+
+        def collect(done):
+            for future in done:
+                indices = pending.pop(future)
+                try:
+                    batch_results = future.result()
+                except Exception as e:
+                    batch_results = [f'error: {str(e)[:50]}'] * len(indices)
+                for index, result in zip(indices, batch_results):
+                    if isinstance(result, str):
+                        finish(index, [], result)
+                    else:
+                        finish(index, result, 'success')
+                        if self.result_cache:
+                            sha256, fingerprint = fingerprints[index]
+                            self.result_cache.put(sha256, result, fingerprint)
+
+        def submit(batch):
+            while len(pending) >= max_pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                collect(done)
+            indices = [index for index, _ in batch]
+            future = self.pool.submit(_ocr_batch, [image for _, image in batch], RECOGNIZER_BATCH_SIZE)
+            pending[future] = indices
+
+        batch = []
+        while True:
+            task = ocr_queue.get()
+            if task is None:
+                break
+            kind, index, payload, status = task
+            if kind == 'done':
+                finish(index, payload, status)
+                continue
+            batch.append((index, payload))
+            if len(batch) >= self.batch_size:
+                submit(batch)
+                batch = []
+        if batch:
+            submit(batch)
+        collect(wait(pending).done)
+
+        # 중복 이미지는 원본의 OCR 결과 공유 (다음 실행을 위해 캐시에도 기록)
+        for index, original in duplicate_of.items():
+            results[index]['detections'] = results[original]['detections']
+            if self.result_cache and results[original]['status'] in OCR_OK_STATUSES:
+                self.result_cache.put(fingerprints[index][0], results[index]['detections'])
+
+        self.stats['images'] += len(items)
+        self.stats['ocr_seconds'] += time.time() - start
+        if progress_bar:
+            progress_bar.close()
+        return results
+
+    def get_stats(self) -> Dict:
+        seconds = max(self.stats['ocr_seconds'], 1e-9)
+        images_per_sec = self.stats['success'] / seconds
+        return {
+            **self.stats,
+            'ocr_seconds': round(self.stats['ocr_seconds'], 1),
+            'workers': self.ocr_workers,
+            'cores': self.cores,
+            'images_per_sec': round(images_per_sec, 2),
+            'images_per_sec_per_core': round(images_per_sec / self.cores, 3),
+        }
+
+    def close(self):
+        self.pool.shutdown()
+        if self._owns_result_cache:
+            self.result_cache.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
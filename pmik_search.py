@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+PMIK SNS 분석 전문 검색 (SQLite FTS5)
+
+엑셀 필터나 pandas .str.contains로 CSV를 훑던 검색을 웨어하우스 안의
+역색인으로 대체한다. 게시물 본문, YouTube 설명/자막, 이미지/영상 OCR 텍스트를
+플랫폼 구분 없이 한 번에 검색한다.
+
+한국어 토큰화:
+- 한글 연속 구간은 2글자 n-gram (예: "협찬광고" → 협찬 찬광 광고)
+- 영문/숫자는 단어 단위 (소문자)
+- 형태소 분석기 없이도 조사가 붙은 단어("협찬을", "협찬받아")에서 검색됨
+
+색인은 pmik_warehouse.Warehouse.upsert가 텍스트 컬럼을 쓸 때마다 함께 갱신된다.
+
+사용법:
+    python pmik_search.py 협찬 광고            # 두 단어 모두 포함
+    python pmik_search.py '"체험단 모집"'       # 구문 검색
+    python pmik_search.py --platform youtube 협찬
+    python pmik_search.py rebuild              # 웨어하우스 전체 재색인
+
+코드에서:
+    with Warehouse() as warehouse:
+        results = warehouse.search.search('협찬 광고', limit=20)
+"""
+
+import re
+import sqlite3
+import sys
+import time
+from typing import Dict, Iterable, List, Optional
+
+import pandas as pd
+
+# ===========================
+# 색인 대상
+# ===========================
+
+# 웨어하우스 테이블 → 검색할 텍스트 컬럼
+SEARCH_SOURCES: Dict[str, List[str]] = {
+    'naver_blog_posts': ['title', 'content'],
+    'youtube_videos': ['title', 'description', 'youtube_transcript'],
+    'ocr_results': ['text'],
+}
+
+SNIPPET_CHARS = 40
+DEFAULT_LIMIT = 20
+
+HANGUL_RUN = re.compile(r'[가-힣]+')
+TOKEN_RUN = re.compile(r'[가-힣]+|[0-9a-zA-Z]+')
+QUERY_TERM = re.compile(r'"([^"]+)"|(\S+)')
+
+# ===========================
+# 토큰화
+# ===========================
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """한글은 2글자 n-gram, 영문/숫자는 단어 (한 글자 한글 단어는 그대로)"""
+    tokens = []
+    for run in TOKEN_RUN.findall(text or ''):
+        if HANGUL_RUN.fullmatch(run):
+            if len(run) == 1:
+                tokens.append(run)
+            else:
+                tokens.extend(run[i:i + 2] for i in range(len(run) - 1))
+        else:
+            tokens.append(run.lower())
+    return tokens
+
+def build_match_query(query: str) -> Optional[str]:
+    """검색어 → FTS5 MATCH 식
+
+    - 공백으로 나뉜 단어는 AND
+    - 큰따옴표로 묶은 구절과 각 단어는 n-gram 토큰을 순서대로 붙인 구문 검색
+    """
+    phrases = []
+    for quoted, word in QUERY_TERM.findall(query):
+        tokens = tokenize(quoted or word)
+        if len(tokens) == 1 and HANGUL_RUN.fullmatch(tokens[0]) and len(tokens[0]) == 1:
+            phrases.append(f'"{tokens[0]}"*')  # 한 글자 검색어는 그 글자로 시작하는 n-gram
+        elif tokens:
+            phrases.append('"' + ' '.join(tokens) + '"')
+    return ' AND '.join(phrases) or None
+
+def make_snippet(text: str, query: str, width: int = SNIPPET_CHARS) -> str:
+    """첫 번째로 일치한 검색어 주변 텍스트 (앞뒤 width글자)"""
+    text = re.sub(r'\s+', ' ', text or '')
+    lowered = text.lower()
+    for quoted, word in QUERY_TERM.findall(query):
+        position = lowered.find((quoted or word).lower())
+        if position >= 0:
+            start = max(0, position - width)
+            end = min(len(text), position + len(quoted or word) + width)
+            return ('…' if start > 0 else '') + text[start:end] + ('…' if end < len(text) else '')
+    return text[:width * 2] + ('…' if len(text) > width * 2 else '')
+
+# ===========================
+# 색인
+# ===========================
+
+class SearchIndex:
+    """웨어하우스 DB 안의 FTS5 역색인
+
+    - search_docs: 문서 원문과 출처 (테이블, 컬럼, post_id/video_id/url)
+    - search_fts: 토큰화된 텍스트 (rowid = search_docs.rowid)
+    """
+
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+        with self.conn:
+            self.conn.execute('''
+                CREATE TABLE IF NOT EXISTS search_docs (
+                    doc_key TEXT UNIQUE,
+                    platform TEXT,
+                    source_table TEXT,
+                    field TEXT,
+                    post_id TEXT,
+                    video_id TEXT,
+                    url TEXT,
+                    text TEXT
+                )
+            ''')
+            self.conn.execute('CREATE VIRTUAL TABLE IF NOT EXISTS search_fts '
+                              'USING fts5(tokens, tokenize = "unicode61")')
+
+    @staticmethod
+    def _id(value) -> Optional[str]:
+        if value is None or pd.isna(value):
+            return None
+        if isinstance(value, float) and value.is_integer():
+            value = int(value)  # CSV에서 읽은 post_id (1.0 → '1')
+        return str(value)
+
+    @staticmethod
+    def _document(table: str, key: str, field: str, row: Dict) -> Dict:
+        post_id = row.get('post_id')
+        video_id = row.get('video_id')
+        if table == 'ocr_results':
+            field = f"ocr:{row.get('source')}"
+            platform = 'naver_blog' if SearchIndex._id(post_id) else 'youtube'
+        else:
+            platform = 'naver_blog' if table == 'naver_blog_posts' else 'youtube'
+        return {
+            'doc_key': f'{table}|{key}|{field}',
+            'platform': platform,
+            'source_table': table,
+            'field': field,
+            'post_id': SearchIndex._id(post_id),
+            'video_id': SearchIndex._id(video_id),
+            'url': row.get('url'),
+        }
+
+    def index_rows(self, table: str, key_columns: List[str], rows: Iterable[Dict]):
+        """upsert된 행의 텍스트 컬럼 색인 (빈 값이면 색인에서 제거)
+
+        호출하는 쪽의 트랜잭션 안에서 실행된다.
+        """
+        fields = SEARCH_SOURCES.get(table)
+        if not fields:
+            return
+        for row in rows:
+            key = '|'.join(str(row.get(column)) for column in key_columns)
+            for field in fields:
+                if field not in row:
+                    continue  # 이번 upsert에서 쓰지 않은 컬럼은 기존 색인 유지
+                doc = self._document(table, key, field, row)
+                text = row[field]
+                self._delete(doc['doc_key'])
+                if isinstance(text, str) and text.strip():
+                    cursor = self.conn.execute(
+                        'INSERT INTO search_docs (doc_key, platform, source_table, field, post_id, video_id, url, text) '
+                        'VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                        [doc['doc_key'], doc['platform'], doc['source_table'], doc['field'],
+                         doc['post_id'], doc['video_id'], doc['url'], text]
+                    )
+                    self.conn.execute('INSERT INTO search_fts (rowid, tokens) VALUES (?, ?)',
+                                      [cursor.lastrowid, ' '.join(tokenize(text))])
+
+    def _delete(self, doc_key: str):
+        existing = self.conn.execute('SELECT rowid FROM search_docs WHERE doc_key = ?', [doc_key]).fetchone()
+        if existing:
+            self.conn.execute('DELETE FROM search_fts WHERE rowid = ?', [existing[0]])
+            self.conn.execute('DELETE FROM search_docs WHERE rowid = ?', [existing[0]])
+
+    def search(self, query: str, limit: int = DEFAULT_LIMIT, platform: Optional[str] = None) -> pd.DataFrame:
+        """키워드/구문 검색 (BM25 순)
+
+        Returns:
+            platform, field, post_id, video_id, url, snippet 컬럼의 DataFrame
+        """
+        columns = ['platform', 'field', 'post_id', 'video_id', 'url', 'snippet']
+        match = build_match_query(query)
+        if not match:
+            return pd.DataFrame(columns=columns)
+
+        sql = ('SELECT d.platform, d.field, d.post_id, d.video_id, d.url, d.text '
+               'FROM search_fts JOIN search_docs d ON d.rowid = search_fts.rowid '
+               'WHERE search_fts MATCH ?')
+        params = [match]
+        if platform:
+            sql += ' AND d.platform = ?'
+            params.append(platform)
+        sql += ' ORDER BY search_fts.rank LIMIT ?'
+        params.append(limit)
+
+        rows = self.conn.execute(sql, params).fetchall()
+        return pd.DataFrame(
+            [list(row[:5]) + [make_snippet(row[5], query)] for row in rows], columns=columns
+        )
+
+    def rebuild(self, tables: Dict[str, Dict]) -> int:
+        """웨어하우스 테이블 전체 재색인 (기존 CSV를 import한 뒤 등)"""
+        with self.conn:
+            self.conn.execute('DELETE FROM search_fts')
+            self.conn.execute('DELETE FROM search_docs')
+        total = 0
+        for table, fields in SEARCH_SOURCES.items():
+            key_columns = tables[table]['key']
+            columns = list(dict.fromkeys(key_columns + fields +
+                                         [c for c in ('post_id', 'video_id', 'url', 'source')
+                                          if c in tables[table]['columns']]))
+            quoted = ', '.join(f'"{column}"' for column in columns)
+            cursor = self.conn.execute(f'SELECT {quoted} FROM {table}')
+            while True:
+                batch = cursor.fetchmany(1000)
+                if not batch:
+                    break
+                with self.conn:
+                    self.index_rows(table, key_columns, [dict(zip(columns, row)) for row in batch])
+                total += len(batch)
+        return total
+
+# ===========================
+# CLI
+# ===========================
+
+def main():
+    from pmik_warehouse import Warehouse
+
+    args = sys.argv[1:]
+    if not args:
+        print(__doc__)
+        sys.exit(1)
+
+    with Warehouse() as warehouse:
+        if args == ['rebuild']:
+            start = time.time()
+            rows = warehouse.search.rebuild(warehouse.tables)
+            print(f"🔎 재색인 완료: {rows:,}행 ({time.time() - start:.1f}초)")
+            return
+
+        platform = None
+        if args[0] == '--platform' and len(args) >= 3:
+            platform, args = args[1], args[2:]
+        query = ' '.join(args)
+
+        start = time.time()
+        results = warehouse.search.search(query, limit=DEFAULT_LIMIT, platform=platform)
+        elapsed_ms = (time.time() - start) * 1000
+
+        print(f"🔎 '{query}': {len(results)}건 ({elapsed_ms:.1f}ms)")
+        for row in results.itertuples():
+            item = row.post_id or row.video_id
+            print(f"\n[{row.platform}] {item} ({row.field})")
+            print(f"   {row.snippet}")
+            if row.url:
+                print(f"   {row.url}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+PMIK SNS 분석 공용 저장소 (Parquet)
+
+모든 수집/후처리 단계가 같은 방식으로 결과를 저장하고 읽기 위한 모듈.
+
+- 플랫폼별 스키마로 dtype 지정 (post_id → int64, blog_id → category, 날짜 → datetime)
+- 데이터셋은 data/<이름>/ 아래 Hive 방식 파티션 (platform=…/keyword=…/collected_on=…)
+- 읽을 때는 필요한 컬럼만 읽음 (Parquet 열 단위 저장)
+- Excel 사용자를 위한 CSV(utf-8-sig) 내보내기
+
+pyarrow가 없으면 Parquet 저장은 건너뛰고 CSV만 사용한다 (pip install pyarrow).
+
+사용 예:
+    from pmik_storage import write_dataset, read_dataset, export_csv
+
+    write_dataset(df, 'naver_blog_posts', 'naver_blog')
+    df = read_dataset('naver_blog_posts', columns=['post_id', 'image_urls'])
+    export_csv(df, 'naver_blog_posts.csv')
+"""
+
+import logging
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pq = None
+
+logger = logging.getLogger(__name__)
+
+# 저장소 위치 (실행 위치와 관계없이 저장소 루트의 data/)
+DATA_ROOT = Path(__file__).resolve().parent / 'data'
+
+# 기본 파티션 컬럼 (데이터에 없는 컬럼은 제외)
+PARTITION_COLUMNS = ['platform', 'keyword', 'collected_on']
+
+# ===========================
+# 플랫폼별 스키마
+# ===========================
+
+TEXT = 'string'
+DATETIME = 'datetime'
+
+SCHEMAS: Dict[str, Dict[str, str]] = {
+    'naver_blog': {
+        'platform': 'category',
+        'post_id': 'Int64',
+        'blog_id': 'category',
+        'url': TEXT,
+        'title': TEXT,
+        'content': TEXT,
+        'published_datetime': DATETIME,
+        'sponsor_phone': TEXT,
+        'sponsor_partner_id': TEXT,  # 앞자리 0 보존
+        'like_count': 'Int64',
+        'comment_count': 'Int64',
+        'hashtags': TEXT,
+        'image_urls': TEXT,
+        'video_urls': TEXT,
+        'collected_date': DATETIME,
+        'keyword': 'category',
+    },
+    'youtube': {
+        'platform': 'category',
+        'video_id': TEXT,
+        'url': TEXT,
+        'channel_id': 'category',
+        'channel_name': 'category',
+        'title': TEXT,
+        'description': TEXT,
+        'published_datetime': DATETIME,
+        'duration': TEXT,
+        'view_count': 'Int64',
+        'like_count': 'Int64',
+        'comment_count': 'Int64',
+        'category_id': 'category',
+        'tags': TEXT,
+        'hashtags': TEXT,
+        'sponsor_phone': TEXT,
+        'sponsor_partner_id': TEXT,
+        'thumbnail_url': TEXT,
+        'youtube_transcript': TEXT,
+        'transcript_language': 'category',
+        'transcript_status': 'category',
+        'has_transcript': 'boolean',
+        'collected_date': DATETIME,
+        'keyword': 'category',
+    },
+    'media_urls': {
+        'post_id': 'Int64',
+        'url': TEXT,
+        'type': 'category',
+        'youtube_video_id': TEXT,
+    },
+}
+
+def apply_schema(df: pd.DataFrame, schema: Dict[str, str]) -> pd.DataFrame:
+    """스키마에 있는 컬럼의 dtype 변환 (변환할 수 없는 값은 결측치)"""
+    df = df.copy()
+    for column, dtype in schema.items():
+        if column not in df:
+            continue
+        if dtype == DATETIME:
+            df[column] = pd.to_datetime(df[column], errors='coerce')
+        elif dtype == 'Int64':
+            df[column] = pd.to_numeric(df[column], errors='coerce').astype('Int64')
+        elif dtype == 'boolean':
+            df[column] = df[column].astype('boolean')
+        elif dtype == TEXT:
+            df[column] = df[column].astype('string')
+        else:
+            df[column] = df[column].astype(dtype)
+    return df
+
+# ===========================
+# 저장
+# ===========================
+
+def dataset_path(name: str) -> Path:
+    return DATA_ROOT / name
+
+def write_dataset(df: pd.DataFrame, name: str, schema: Optional[str] = None,
+                  partition_cols: Optional[List[str]] = None,
+                  basename: Optional[str] = None) -> Optional[Path]:
+    """DataFrame을 파티션된 Parquet 데이터셋에 추가
+
+    - collected_on(수집일)은 collected_date에서 생성
+    - 같은 파티션에 여러 번 써도 파일명이 겹치지 않음 (실행마다 새 파일 추가)
+    - basename을 주면 그 이름으로 쓴 기존 파일을 모든 파티션에서 지우고 다시 씀
+      (같은 데이터를 다시 내보내도 중복 행이 생기지 않음 - 예: 중단 후 재개한 실행)
+
+    Returns:
+        데이터셋 경로 (pyarrow가 없거나 데이터가 없으면 None)
+    """
+    if pq is None:
+        logger.warning("pyarrow가 설치되지 않아 Parquet 저장을 건너뜁니다: pip install pyarrow")
+        return None
+    if df.empty:
+        return None
+
+    if schema:
+        df = apply_schema(df, SCHEMAS[schema])
+    if 'collected_date' in df:
+        df = df.assign(collected_on=pd.to_datetime(df['collected_date'], errors='coerce').dt.strftime('%Y-%m-%d'))
+
+    partition_cols = [column for column in (partition_cols or PARTITION_COLUMNS) if column in df]
+    for column in partition_cols:
+        # 파티션 값은 디렉토리 이름이 되므로 문자열로 (결측치는 '__unknown__')
+        df[column] = df[column].astype(str).where(df[column].notna(), '__unknown__')
+
+    path = dataset_path(name)
+    if basename:
+        for old_file in path.rglob(f'{basename}-*.parquet'):
+            old_file.unlink()
+    else:
+        basename = f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:8]}"
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    pq.write_to_dataset(
+        table, root_path=str(path), partition_cols=partition_cols or None,
+        basename_template=f"{basename}-{{i}}.parquet",
+        existing_data_behavior='overwrite_or_ignore'
+    )
+    return path
+
+def write_table(df: pd.DataFrame, path, schema: Optional[str] = None) -> Optional[Path]:
+    """파티션 없는 단일 Parquet 파일 저장 (중간 산출물용)"""
+    if pq is None:
+        logger.warning("pyarrow가 설치되지 않아 Parquet 저장을 건너뜁니다: pip install pyarrow")
+        return None
+
+    if schema:
+        df = apply_schema(df, SCHEMAS[schema])
+    path = Path(path)
+    df.to_parquet(path, index=False)
+    return path
+
+# ===========================
+# 읽기
+# ===========================
+
+def read_dataset(name: str, columns: Optional[List[str]] = None,
+                 filters: Optional[List] = None) -> pd.DataFrame:
+    """Parquet 데이터셋 읽기
+
+    Args:
+        columns: 읽을 컬럼 (None이면 전체) - 나머지 컬럼은 디스크에서 읽지 않음
+        filters: pyarrow 필터, 예) [('platform', '=', 'naver_blog'), ('collected_on', '>=', '2025-01-01')]
+    """
+    return pd.read_parquet(dataset_path(name), columns=columns, filters=filters)
+
+def read_table(path, columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """Parquet 또는 CSV 파일에서 필요한 컬럼만 읽기 (확장자로 형식 판단)"""
+    path = Path(path)
+    if path.suffix == '.parquet' or path.is_dir():
+        return pd.read_parquet(path, columns=columns)
+    return pd.read_csv(path, encoding='utf-8-sig', usecols=columns)
+
+def iter_table_chunks(path, columns: Optional[List[str]] = None,
+                      chunksize: int = 100_000) -> Iterator[pd.DataFrame]:
+    """대용량 Parquet/CSV를 chunksize행씩 나눠 읽기 (메모리 일정)"""
+    path = Path(path)
+    if path.suffix == '.parquet':
+        if pq is None:
+            raise ImportError("Parquet 파일을 읽으려면 pyarrow가 필요합니다: pip install pyarrow")
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunksize, columns=columns):
+            yield batch.to_pandas()
+    elif path.is_dir():
+        yield read_table(path, columns)
+    else:
+        yield from pd.read_csv(path, encoding='utf-8-sig', usecols=columns, chunksize=chunksize)
+
+def export_csv(df: pd.DataFrame, path, columns: Optional[List[str]] = None) -> Path:
+    """Excel에서 열 수 있는 CSV(utf-8-sig)로 내보내기"""
+    path = Path(path)
+    if columns:
+        df = df.reindex(columns=columns)
+    df.to_csv(path, index=False, encoding='utf-8-sig')
+    return path
@@ -0,0 +1,568 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+PMIK SNS 분석 로컬 Whisper 음성인식 서비스 (CPU)
+
+기존 방식(VideoTranscriptExtractor._extract_with_whisper)은 영상마다 yt-dlp로 MP3 전체를
+받아 저장한 뒤 whisper transcribe를 파일 전체에 한 번 호출했다. 무음 구간도 그대로
+디코딩하고, 30초 창을 하나씩 순서대로 처리해 CPU에서는 자막 없는 영상 280개를
+처리할 수 없었다.
+
+구조:
+1. 오디오 - 스레드 audio_workers개 (작업마다 ffmpeg 1개, pmik_video.stream_audio)
+   - YouTube는 yt-dlp로 오디오 스트림 주소만 얻고 ffmpeg가 바로 읽음 (파일 저장 없음)
+   - 16kHz 모노 PCM을 받는 동안 음성 구간 검출(VAD) → 음성만 이어 붙여 30초 이하 청크로
+2. 모델 - 스레드 1개 (Whisper 모델 1개를 서비스 수명 동안 유지)
+   - 여러 작업의 청크를 batch_size개씩 모아 한 번에 디코딩 (torch가 모든 코어 사용)
+   - openai-whisper는 디코딩 중 kv-cache 훅을 모델에 직접 달기 때문에 한 모델을 여러
+     스레드가 동시에 쓰면 결과가 섞인다 → 병렬화는 스레드가 아니라 배치로
+   - 반복/저신뢰 결과만 whisper transcribe(온도 재시도 포함)로 다시 처리
+
+VAD (에너지 기반, 추가 패키지 없음):
+- 30ms 프레임 RMS가 블록의 잡음 하한(10퍼센타일) + 여유보다 크면 음성
+- 짧은 무음은 메우고, 앞뒤로 여유를 두고, 아주 짧은 음성(클릭, 잡음)은 버림
+
+작업마다 진행 상황(스트리밍한 오디오 길이, 음성 길이, 처리한 청크 수, 실시간 배속) 제공.
+
+사용법:
+    python pmik_transcribe.py youtube/youtube_no_transcript_*.csv
+    python pmik_transcribe.py youtube/youtube_no_transcript_*.csv --model small --output whisper_transcript_results.csv
+
+코드에서:
+    with TranscriptionService() as service:
+        job = service.submit('https://www.youtube.com/watch?v=...')
+        print(job.progress())
+        text = job.wait()
+"""
+
+import argparse
+import glob
+import itertools
+import json
+import logging
+import os
+import re
+import subprocess
+import threading
+import time
+from pathlib import Path
+from queue import Empty, Queue
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+
+from pmik_media_cache import MediaCache
+from pmik_video import AUDIO_SAMPLE_RATE, stream_audio
+
+logger = logging.getLogger(__name__)
+
+WHISPER_MODEL = 'base'       # tiny, base, small, medium, large
+WHISPER_LANGUAGE = 'ko'
+AUDIO_WORKERS = 4            # 동시에 스트리밍하는 작업 수 (ffmpeg 프로세스 수)
+BATCH_SIZE = 8               # 한 번에 디코딩하는 30초 청크 수
+CHUNK_SECONDS = 30           # Whisper 입력 창
+CHUNK_GAP_SECONDS = 0.2      # 청크 안에서 이어 붙인 음성 구간 사이 무음
+
+# VAD
+VAD_FRAME_MS = 30
+VAD_MIN_DBFS = -45           # 이보다 조용한 프레임은 항상 무음
+VAD_MAX_THRESHOLD_DBFS = -30  # 배경음악이 깔려도 이 이상 크면 음성 후보
+VAD_NOISE_MARGIN_DB = 8      # 잡음 하한보다 이만큼 커야 음성
+VAD_PAD_SECONDS = 0.3        # 음성 구간 앞뒤 여유
+VAD_MIN_SILENCE_SECONDS = 0.6  # 이보다 짧은 무음은 음성 구간으로 이어 붙임
+VAD_MIN_SPEECH_SECONDS = 0.25  # 이보다 짧은 음성 구간은 버림
+
+# 결과 품질 (whisper transcribe 기본값과 같음)
+NO_SPEECH_THRESHOLD = 0.6
+LOGPROB_THRESHOLD = -1.0
+COMPRESSION_RATIO_THRESHOLD = 2.4
+
+YOUTUBE_PATTERN = re.compile(r'youtube\.com|youtu\.be')
+
+# ===========================
+# VAD / 청크
+# ===========================
+
+def speech_segments(audio: np.ndarray, sample_rate: int = AUDIO_SAMPLE_RATE) -> List[Tuple[int, int]]:
+    """음성 구간 [(시작 샘플, 끝 샘플), ...]"""
+    frame = sample_rate * VAD_FRAME_MS // 1000
+    count = len(audio) // frame
+    if count == 0:
+        return []
+    frames = audio[:count * frame].reshape(count, frame)
+    dbfs = 20 * np.log10(np.sqrt(np.mean(frames ** 2, axis=1)) + 1e-10)
+    threshold = max(VAD_MIN_DBFS, min(np.percentile(dbfs, 10) + VAD_NOISE_MARGIN_DB, VAD_MAX_THRESHOLD_DBFS))
+    speech = np.concatenate([[0], (dbfs > threshold).astype(np.int8), [0]])
+    starts = np.flatnonzero(np.diff(speech) == 1)
+    ends = np.flatnonzero(np.diff(speech) == -1)
+
+    min_silence = VAD_MIN_SILENCE_SECONDS * 1000 / VAD_FRAME_MS
+    min_speech = VAD_MIN_SPEECH_SECONDS * 1000 / VAD_FRAME_MS
+    pad = int(VAD_PAD_SECONDS * sample_rate)
+    runs: List[List[int]] = []
+    for start, end in zip(starts, ends):
+        if runs and start - runs[-1][1] < min_silence:
+            runs[-1][1] = end
+        else:
+            runs.append([start, end])
+    return [(max(0, start * frame - pad), min(len(audio), end * frame + pad))
+            for start, end in runs if end - start >= min_speech]
+
+class SpeechChunker:
+    """스트리밍 오디오 블록 → 음성만 이어 붙인 CHUNK_SECONDS 이하 청크
+
+    블록 끝에 걸친 음성 구간은 다음 블록과 이어서 판단한다.
+    """
+
+    def __init__(self, sample_rate: int = AUDIO_SAMPLE_RATE):
+        self.sample_rate = sample_rate
+        self.chunk_samples = CHUNK_SECONDS * sample_rate
+        self.gap = np.zeros(int(CHUNK_GAP_SECONDS * sample_rate), dtype=np.float32)
+        self.buffer = np.zeros(0, dtype=np.float32)
+        self.current: List[np.ndarray] = []
+        self.current_samples = 0
+        self.audio_samples = 0
+        self.speech_samples = 0
+
+    def feed(self, block: np.ndarray) -> List[np.ndarray]:
+        self.audio_samples += len(block)
+        self.buffer = np.concatenate([self.buffer, block])
+        segments = speech_segments(self.buffer, self.sample_rate)
+        hold_samples = int(VAD_MIN_SILENCE_SECONDS * self.sample_rate)
+
+        if segments and len(self.buffer) - segments[-1][1] < hold_samples:
+            start = segments[-1][0]
+            if len(self.buffer) - start > self.chunk_samples:
+                keep_from = len(self.buffer)  # 30초 넘게 쉬지 않는 음성은 여기서 자름
+            else:
+                keep_from = start
+                segments = segments[:-1]
+        else:
+            keep_from = max(len(self.buffer) - hold_samples, segments[-1][1] if segments else 0)
+
+        chunks = []
+        for start, end in segments:
+            chunks.extend(self._add(self.buffer[start:end]))
+        self.buffer = self.buffer[keep_from:]
+        return chunks
+
+    def flush(self) -> List[np.ndarray]:
+        chunks = []
+        for start, end in speech_segments(self.buffer, self.sample_rate):
+            chunks.extend(self._add(self.buffer[start:end]))
+        self.buffer = np.zeros(0, dtype=np.float32)
+        if self.current:
+            chunks.append(np.concatenate(self.current))
+            self.current, self.current_samples = [], 0
+        return chunks
+
+    def _add(self, speech: np.ndarray) -> List[np.ndarray]:
+        self.speech_samples += len(speech)
+        chunks = []
+        for offset in range(0, len(speech), self.chunk_samples):
+            piece = speech[offset:offset + self.chunk_samples]
+            if self.current and self.current_samples + len(self.gap) + len(piece) > self.chunk_samples:
+                chunks.append(np.concatenate(self.current))
+                self.current, self.current_samples = [], 0
+            if self.current:
+                self.current.append(self.gap)
+                self.current_samples += len(self.gap)
+            self.current.append(piece)
+            self.current_samples += len(piece)
+        return chunks
+
+# ===========================
+# 작업
+# ===========================
+
+def resolve_audio_source(url: str, media_cache: Optional[MediaCache] = None) -> Tuple[str, Dict[str, str]]:
+    """ffmpeg 입력 (경로 또는 스트림 URL, HTTP 헤더)
+
+    - 미디어 캐시에 이미 받은 파일이 있으면 로컬 경로
+    - YouTube는 yt-dlp로 오디오 스트림 주소만 조회 (다운로드 없음)
+    - 그 외(네이버 mblogvideo 등)는 URL 그대로 (Referer는 ffmpeg_input_args가 추가)
+    """
+    if media_cache is not None and media_cache.contains(url):
+        return str(media_cache.get_path(url)), {}
+    if YOUTUBE_PATTERN.search(url):
+        import yt_dlp
+
+        with yt_dlp.YoutubeDL({'format': 'bestaudio/best', 'quiet': True, 'no_warnings': True}) as ydl:
+            info = ydl.extract_info(url, download=False)
+        return info['url'], info.get('http_headers', {})
+    return url, {}
+
+class TranscriptionJob:
+    """영상 1개 음성인식 작업 (상태: queued → streaming → transcribing → done / no_speech / failed / cancelled)"""
+
+    def __init__(self, job_id: int, url: str, meta: Dict):
+        self.id = job_id
+        self.url = url
+        self.meta = meta
+        self.status = 'queued'
+        self.error: Optional[str] = None
+        self.audio_seconds = 0.0
+        self.speech_seconds = 0.0
+        self.chunks_total = 0
+        self.chunks_done = 0
+        self.texts: Dict[int, str] = {}
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.streaming_done = False
+        self._event = threading.Event()
+
+    @property
+    def text(self) -> str:
+        return ' '.join(self.texts[index] for index in sorted(self.texts) if self.texts[index])
+
+    @property
+    def finished(self) -> bool:
+        return self._event.is_set()
+
+    def wait(self, timeout: Optional[float] = None) -> str:
+        """끝날 때까지 대기 후 텍스트 (실패하면 빈 문자열, status/error 확인)"""
+        self._event.wait(timeout)
+        return self.text
+
+    def progress(self) -> Dict:
+        elapsed = ((self.finished_at or time.time()) - self.started_at) if self.started_at else 0.0
+        return {
+            'id': self.id,
+            'url': self.url,
+            'status': self.status,
+            'audio_seconds': round(self.audio_seconds, 1),
+            'speech_seconds': round(self.speech_seconds, 1),
+            'chunks': f'{self.chunks_done}/{self.chunks_total}' + ('' if self.streaming_done else '+'),
+            'elapsed': round(elapsed, 1),
+            'realtime_factor': round(self.audio_seconds / elapsed, 1) if elapsed else 0.0,
+        }
+
+# ===========================
+# 서비스
+# ===========================
+
+class TranscriptionService:
+    """Whisper 모델 1개를 유지하며 작업을 받아 처리하는 음성인식 서비스"""
+
+    def __init__(self, model_name: str = WHISPER_MODEL, language: str = WHISPER_LANGUAGE,
+                 audio_workers: int = AUDIO_WORKERS, batch_size: int = BATCH_SIZE,
+                 device: Optional[str] = None, media_cache: Optional[MediaCache] = None,
+                 max_audio_seconds: Optional[float] = None,
+                 on_finish: Optional[Callable[[TranscriptionJob], None]] = None):
+        """
+        Args:
+            device: 'cpu' / 'cuda' (None이면 whisper가 자동 선택)
+            media_cache: 이미 받은 영상은 로컬 파일에서 읽음 (새로 받지는 않음)
+            max_audio_seconds: 영상 앞부분 이 길이까지만 인식 (None이면 전체)
+            on_finish: 작업이 끝날 때마다 호출 (모델 스레드에서 실행)
+        """
+        import torch
+        import whisper
+
+        torch.set_num_threads(os.cpu_count() or 1)  # 배치 디코딩이 모든 코어 사용
+        self.whisper = whisper
+        self.model = whisper.load_model(model_name, device=device)
+        self.language = language
+        self.batch_size = batch_size
+        self.media_cache = media_cache
+        self.max_audio_seconds = max_audio_seconds
+        self.on_finish = on_finish
+        fp16 = self.model.device.type == 'cuda'
+        self.options = whisper.DecodingOptions(language=language, without_timestamps=True, fp16=fp16)
+
+        self.lock = threading.Lock()
+        self.job_ids = itertools.count(1)
+        self.job_queue: Queue = Queue()
+        self.chunk_queue: Queue = Queue(maxsize=batch_size * 4)
+        self.cancel_event = threading.Event()
+        self.processes: Set[subprocess.Popen] = set()  # 실행 중인 ffmpeg (취소 시 중지)
+        self.stats = {'jobs': 0, 'done': 0, 'no_speech': 0, 'failed': 0, 'cancelled': 0, 'audio_seconds': 0.0,
+                      'speech_seconds': 0.0, 'chunks': 0, 'retried_chunks': 0, 'model_seconds': 0.0}
+
+        self.audio_threads = [threading.Thread(target=self._audio_loop, daemon=True) for _ in range(audio_workers)]
+        self.model_thread = threading.Thread(target=self._model_loop, daemon=True)
+        for thread in self.audio_threads + [self.model_thread]:
+            thread.start()
+
+    def submit(self, url: str, **meta) -> TranscriptionJob:
+        """작업 등록 (바로 반환, job.progress()/job.wait()로 확인)"""
+        job = TranscriptionJob(next(self.job_ids), url, meta)
+        self.stats['jobs'] += 1
+        self.job_queue.put(job)
+        return job
+
+    def map(self, urls: Iterable[str]) -> List[TranscriptionJob]:
+        return [self.submit(url) for url in urls]
+
+    # ---------------------------
+    # 오디오 스레드
+    # ---------------------------
+
+    def _audio_loop(self):
+        while True:
+            job = self.job_queue.get()
+            if job is None:
+                return
+            job.status = 'streaming'
+            job.started_at = time.time()
+            chunker = SpeechChunker()
+            try:
+                if self.cancel_event.is_set():
+                    raise RuntimeError('취소됨')
+                source, headers = resolve_audio_source(job.url, self.media_cache)
+                blocks = stream_audio(source, headers, max_seconds=self.max_audio_seconds,
+                                      processes=self.processes)
+                try:
+                    for block in blocks:
+                        if self.cancel_event.is_set():
+                            break
+                        for chunk in chunker.feed(block):
+                            self._queue_chunk(job, chunk)
+                        job.audio_seconds = chunker.audio_samples / AUDIO_SAMPLE_RATE
+                        job.speech_seconds = chunker.speech_samples / AUDIO_SAMPLE_RATE
+                finally:
+                    blocks.close()  # ffmpeg 종료
+                if not self.cancel_event.is_set():
+                    for chunk in chunker.flush():
+                        self._queue_chunk(job, chunk)
+                    job.speech_seconds = chunker.speech_samples / AUDIO_SAMPLE_RATE
+            except Exception as e:
+                job.error = f'{type(e).__name__}: {str(e)[:200]}'
+            with self.lock:
+                job.streaming_done = True
+                if not job.finished:
+                    job.status = 'transcribing'  # 남은 청크 인식 대기
+            self._maybe_finish(job)
+
+    def _queue_chunk(self, job: TranscriptionJob, chunk: np.ndarray):
+        if self.cancel_event.is_set():
+            return
+        with self.lock:
+            index = job.chunks_total
+            job.chunks_total += 1
+        self.chunk_queue.put((job, index, chunk))
+
+    # ---------------------------
+    # 모델 스레드
+    # ---------------------------
+
+    def _model_loop(self):
+        while True:
+            item = self.chunk_queue.get()
+            if item is None:
+                return
+            batch = [item]
+            while len(batch) < self.batch_size:
+                try:
+                    item = self.chunk_queue.get(timeout=0.05)
+                except Empty:
+                    break
+                if item is None:
+                    self.chunk_queue.put(None)  # 남은 배치 처리 후 종료
+                    break
+                batch.append(item)
+
+            start = time.time()
+            try:
+                if self.cancel_event.is_set():
+                    texts = [''] * len(batch)  # 취소 후 남은 청크는 버림
+                else:
+                    texts = self._transcribe_batch([chunk for _, _, chunk in batch])
+            except Exception as e:
+                texts = [''] * len(batch)
+                for job, _, _ in batch:
+                    job.error = f'{type(e).__name__}: {str(e)[:200]}'
+            self.stats['model_seconds'] += time.time() - start
+            self.stats['chunks'] += len(batch)
+
+            for (job, index, _), text in zip(batch, texts):
+                with self.lock:
+                    job.texts[index] = text
+                    job.chunks_done += 1
+                self._maybe_finish(job)
+
+    def _transcribe_batch(self, chunks: List[np.ndarray]) -> List[str]:
+        whisper = self.whisper
+        mels = [whisper.log_mel_spectrogram(whisper.pad_or_trim(chunk), n_mels=self.model.dims.n_mels)
+                for chunk in chunks]
+        import torch
+        results = whisper.decode(self.model, torch.stack(mels).to(self.model.device), self.options)
+
+        texts = []
+        for chunk, result in zip(chunks, results):
+            if result.no_speech_prob > NO_SPEECH_THRESHOLD and result.avg_logprob < LOGPROB_THRESHOLD:
+                texts.append('')
+            elif (result.compression_ratio > COMPRESSION_RATIO_THRESHOLD
+                  or result.avg_logprob < LOGPROB_THRESHOLD):
+                # 같은 말 반복 / 저신뢰 → 온도를 올려가며 다시 (whisper transcribe의 재시도 로직)
+                self.stats['retried_chunks'] += 1
+                retry = self.model.transcribe(chunk, language=self.language, fp16=self.options.fp16,
+                                              condition_on_previous_text=False, verbose=None)
+                texts.append(retry['text'].strip())
+            else:
+                texts.append(result.text.strip())
+        return texts
+
+    # ---------------------------
+    # 완료 처리
+    # ---------------------------
+
+    def _maybe_finish(self, job: TranscriptionJob):
+        with self.lock:
+            if job.finished or not job.streaming_done or job.chunks_done < job.chunks_total:
+                return
+            if self.cancel_event.is_set():
+                job.status = 'cancelled'
+            elif job.error and not job.text:
+                job.status = 'failed'
+            elif not job.text:
+                job.status = 'no_speech'
+            else:
+                job.status = 'done'
+            job.finished_at = time.time()
+            self.stats[job.status] += 1
+            self.stats['audio_seconds'] += job.audio_seconds
+            self.stats['speech_seconds'] += job.speech_seconds
+            job._event.set()
+        if self.on_finish:
+            self.on_finish(job)
+
+    def get_stats(self) -> Dict:
+        audio = self.stats['audio_seconds']
+        return {
+            **self.stats,
+            'audio_seconds': round(audio, 1),
+            'speech_seconds': round(self.stats['speech_seconds'], 1),
+            'speech_ratio': f"{self.stats['speech_seconds'] / max(audio, 1e-9) * 100:.1f}%",
+            'model_seconds': round(self.stats['model_seconds'], 1),
+            'audio_seconds_per_model_second': round(audio / max(self.stats['model_seconds'], 1e-9), 1),
+        }
+
+    def close(self, cancel: bool = False):
+        """종료
+
+        Args:
+            cancel: False면 대기 중인 작업을 모두 처리한 뒤 종료.
+                    True면 대기 중인 작업은 cancelled로 끝내고, 실행 중인 ffmpeg를 중지하고,
+                    남은 청크는 인식하지 않음 (처리 중인 배치 1개만 마저 끝남)
+        """
+        if cancel:
+            self.cancel_event.set()
+            while True:
+                try:
+                    job = self.job_queue.get_nowait()
+                except Empty:
+                    break
+                if job is not None:
+                    job.streaming_done = True
+                    self._maybe_finish(job)
+            for process in self.processes.copy():
+                process.kill()
+        for _ in self.audio_threads:
+            self.job_queue.put(None)
+        for thread in self.audio_threads:
+            thread.join()
+        self.chunk_queue.put(None)
+        self.model_thread.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        # 예외(Ctrl+C 포함)로 빠져나오면 남은 작업을 처리하지 않고 바로 종료
+        self.close(cancel=exc_type is not None)
+
+# ===========================
+# CLI
+# ===========================
+
+def load_video_list(patterns: List[str]):
+    """자막 없는 영상 목록 CSV (youtube_no_transcript_*.csv, extracted_video_urls.csv 등)"""
+    import pandas as pd
+
+    files = list(dict.fromkeys(path for pattern in patterns for path in (sorted(glob.glob(pattern)) or [pattern])))
+    frames = [pd.read_csv(path, encoding='utf-8-sig') for path in files]
+    videos = pd.concat(frames, ignore_index=True)
+    if 'url' not in videos and 'video_id' in videos:
+        videos['url'] = 'https://www.youtube.com/watch?v=' + videos['video_id'].astype(str)
+    if 'type' in videos:  # extracted_video_urls.csv는 유튜브/네이버 영상만
+        videos = videos[videos['type'].isin(['youtube', 'naver_blog'])]
+    return files, videos.drop_duplicates('url')
+
+def main():
+    import pandas as pd
+    from tqdm import tqdm
+
+    from pmik_warehouse import Warehouse
+
+    parser = argparse.ArgumentParser(description='Whisper 음성인식 (로컬 CPU, 스트리밍 + VAD + 배치)')
+    parser.add_argument('inputs', nargs='+', help='영상 목록 CSV 또는 glob (url 또는 video_id 컬럼)')
+    parser.add_argument('--output', default='whisper_transcript_results.csv', help='결과 CSV')
+    parser.add_argument('--model', default=WHISPER_MODEL, help='Whisper 모델 (tiny/base/small/medium/large)')
+    parser.add_argument('--audio-workers', type=int, default=AUDIO_WORKERS, help='동시에 스트리밍하는 영상 수')
+    parser.add_argument('--batch-size', type=int, default=BATCH_SIZE, help='한 번에 디코딩하는 30초 청크 수')
+    parser.add_argument('--max-seconds', type=float, default=None, help='영상 앞부분 이 길이(초)까지만 인식')
+    args = parser.parse_args()
+
+    print("="*70)
+    print("🎙️ Whisper 음성인식 (로컬 CPU)")
+    print("="*70)
+
+    files, videos = load_video_list(args.inputs)
+    print(f"\n📂 입력 파일: {', '.join(files)} ({len(videos)}개 영상)")
+    print(f"🔧 Whisper {args.model} 모델 로딩 중...")
+
+    start = time.time()
+    with TranscriptionService(args.model, audio_workers=args.audio_workers, batch_size=args.batch_size,
+                              media_cache=MediaCache(), max_audio_seconds=args.max_seconds) as service:
+        jobs = [service.submit(row.pop('url'), **row) for row in videos.to_dict('records')]
+
+        progress_bar = tqdm(total=len(jobs), desc="Whisper")
+        while not all(job.finished for job in jobs):
+            time.sleep(2)
+            progress_bar.n = sum(job.finished for job in jobs)
+            active = [job.progress() for job in jobs if job.status in ('streaming', 'transcribing')]
+            progress_bar.set_postfix_str(' | '.join(
+                f"#{p['id']} {p['audio_seconds']:.0f}초 청크 {p['chunks']}" for p in active[:args.audio_workers]))
+            progress_bar.refresh()
+        progress_bar.n = len(jobs)
+        progress_bar.close()
+        stats = service.get_stats()
+
+    rows = []
+    for job in jobs:
+        progress = job.progress()
+        rows.append({
+            'video_id': job.meta.get('video_id'),
+            'post_id': job.meta.get('post_id'),
+            'url': job.url,
+            'type': job.meta.get('type') or ('youtube' if YOUTUBE_PATTERN.search(job.url) else 'naver_blog'),
+            'transcript': job.text,
+            'language': WHISPER_LANGUAGE,
+            'status': 'success' if job.status == 'done' else job.status,
+            'error': job.error,
+            'audio_seconds': progress['audio_seconds'],
+            'speech_seconds': progress['speech_seconds'],
+            'seconds': progress['elapsed'],
+        })
+    result_df = pd.DataFrame(rows)
+    result_df.to_csv(args.output, index=False, encoding='utf-8-sig')
+
+    # 웨어하우스 ocr_results (source: whisper)
+    with Warehouse() as warehouse:
+        warehouse.upsert('ocr_results', result_df.assign(source='whisper', text=result_df['transcript'])[
+            ['source', 'post_id', 'url', 'video_id', 'text', 'language', 'status']])
+
+    stats['wall_seconds'] = round(time.time() - start, 1)
+    print(f"\n✅ Whisper 완료!")
+    print(f"   - 성공: {stats['done']}/{len(jobs)} (음성 없음 {stats['no_speech']}개, 실패 {stats['failed']}개)")
+    print(f"   - 오디오: {stats['audio_seconds'] / 60:.1f}분 중 음성 {stats['speech_seconds'] / 60:.1f}분 인식 "
+          f"({stats['speech_ratio']})")
+    print(f"   - 처리 시간: {stats['wall_seconds']}초 (오디오 {stats['audio_seconds_per_model_second']}배속)")
+    print(f"💾 저장: {args.output}")
+
+    with open(Path(args.output).with_suffix('.stats.json'), 'w', encoding='utf-8') as f:
+        json.dump(stats, f, indent=2, ensure_ascii=False)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+PMIK SNS 분석 동영상 프레임 샘플링 / 오디오 스트리밍 (ffmpeg)
+
+비디오 프레임 OCR은 네이버 MP4 전체를 내려받아 처음 5프레임만 읽고 지웠다.
+영상 중간/끝에 나오는 연락처·추천인 번호는 놓치고, 대역폭은 영상 전체만큼 썼다.
+
+- ffprobe로 길이만 확인 (MP4 헤더/moov만 읽음)
+- ffmpeg 입력 탐색(-ss를 -i 앞에)으로 처음/중간/끝 시점의 키프레임 1장씩만 디코딩
+  → HTTP Range 요청으로 moov와 탐색 지점 주변만 받음 (영상 전체 다운로드 없음)
+- 시점별 ffmpeg는 스레드로 동시에 실행
+- 거의 같은 프레임(정지 화면, 같은 자막 카드)은 pHash + 축소 이미지 블록 비교로 1장만 남김
+- 미디어 캐시에 이미 받은 영상이 있으면 네트워크 없이 로컬 파일에서 읽음
+- ffmpeg가 없으면 영상을 미디어 캐시로 받아 OpenCV로 같은 시점을 읽음
+
+오디오 (stream_audio): ffmpeg가 16kHz 모노 PCM을 파이프로 바로 내보냄
+→ 임시 MP3/영상 파일 없이 Whisper 입력으로 사용 (pmik_transcribe.py)
+
+사용 예:
+    from pmik_video import VideoFrameSampler
+
+    sampler = VideoFrameSampler(media_cache=media_cache)
+    for seconds, frame in sampler.sample(video_url):   # 중복 제거된 (시점, RGB 배열)
+        ...
+    print(sampler.get_stats())
+
+    for block in stream_audio(video_url):              # float32 블록 (10초씩)
+        ...
+"""
+
+import io
+import logging
+import shutil
+import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+import numpy as np
+from PIL import Image
+
+from pmik_media_cache import USER_AGENT, MediaCache, referer_for
+from pmik_ocr import MAX_IMAGE_WIDTH, PHashIndex, image_fingerprint, signatures_match
+
+logger = logging.getLogger(__name__)
+
+FFMPEG = 'ffmpeg'
+FFPROBE = 'ffprobe'
+FFMPEG_TIMEOUT = 60          # 프레임 1장 / 길이 확인 제한 시간 (초)
+
+FRAMES_PER_VIDEO = 5         # 처음 + 중간 + 끝 (균등 간격)
+EDGE_OFFSET = 1.0            # 처음/끝 프레임은 안쪽으로 (검은 화면, 페이드 회피)
+
+AUDIO_SAMPLE_RATE = 16000    # Whisper 입력 (16kHz 모노)
+AUDIO_BLOCK_SECONDS = 10
+
+# ===========================
+# ffmpeg
+# ===========================
+
+def ffmpeg_input_args(source: str, headers: Optional[Dict[str, str]] = None) -> List[str]:
+    """ffmpeg/ffprobe 입력 인자 (URL이면 User-Agent/Referer 헤더 포함)
+
+    Args:
+        headers: 추가 HTTP 헤더 (yt-dlp가 알려준 스트림 헤더 등, 기본값을 덮어씀)
+    """
+    if not source.startswith(('http://', 'https://')):
+        return ['-i', source]
+    merged = {'User-Agent': USER_AGENT}
+    referer = referer_for(source)
+    if referer:
+        merged['Referer'] = referer
+    merged.update(headers or {})
+    return ['-headers', ''.join(f'{key}: {value}\r\n' for key, value in merged.items()), '-i', source]
+
+def probe_duration(source: str) -> Optional[float]:
+    """영상 길이(초) - 알 수 없으면 None"""
+    command = [FFPROBE, '-v', 'error', '-show_entries', 'format=duration', '-of', 'csv=p=0',
+               *ffmpeg_input_args(source)]
+    try:
+        output = subprocess.run(command, capture_output=True, timeout=FFMPEG_TIMEOUT, check=True).stdout
+        return float(output.decode().strip())
+    except (subprocess.SubprocessError, ValueError):
+        return None
+
+def sample_times(duration: Optional[float], count: int = FRAMES_PER_VIDEO) -> List[float]:
+    """처음/끝(EDGE_OFFSET 안쪽)과 그 사이 균등 간격 시점"""
+    if not duration or duration <= 2 * EDGE_OFFSET or count <= 1:
+        return [0.0]
+    return [round(float(t), 2) for t in np.linspace(EDGE_OFFSET, duration - EDGE_OFFSET, count)]
+
+def read_frame(source: str, seconds: float, max_width: int = MAX_IMAGE_WIDTH) -> Optional[np.ndarray]:
+    """seconds 시점 직전 키프레임 1장 (RGB 배열, 너비 max_width 이하)
+
+    -ss를 입력 앞에 두면 ffmpeg가 컨테이너 색인으로 바로 탐색하고(HTTP는 Range 요청),
+    -noaccurate_seek로 탐색한 키프레임을 그대로 출력한다 (다음 프레임까지 디코딩하지 않음).
+    """
+    command = [FFMPEG, '-v', 'error', '-noaccurate_seek', '-ss', f'{seconds:.2f}',
+               *ffmpeg_input_args(source),
+               '-frames:v', '1', '-vf', f"scale='min({max_width},iw)':-2",
+               '-f', 'image2pipe', '-vcodec', 'png', '-']
+    try:
+        output = subprocess.run(command, capture_output=True, timeout=FFMPEG_TIMEOUT, check=True).stdout
+        if not output:
+            return None
+        with Image.open(io.BytesIO(output)) as image:
+            return np.asarray(image.convert('RGB'))
+    except (subprocess.SubprocessError, OSError):
+        return None
+
+def stream_audio(source: str, headers: Optional[Dict[str, str]] = None,
+                 block_seconds: float = AUDIO_BLOCK_SECONDS,
+                 max_seconds: Optional[float] = None,
+                 processes: Optional[Set[subprocess.Popen]] = None) -> Iterator[np.ndarray]:
+    """ffmpeg로 디코딩한 16kHz 모노 오디오를 block_seconds씩 (float32, -1~1)
+
+    파일로 저장하지 않고 stdout 파이프에서 바로 읽는다.
+
+    Args:
+        max_seconds: 앞에서부터 이 길이까지만 (None이면 끝까지)
+        processes: 실행 중인 ffmpeg를 여기에 등록 (다른 스레드에서 kill()로 중지할 수 있게)
+
+    Raises:
+        RuntimeError: ffmpeg가 오디오를 하나도 내보내지 못한 경우 (오디오 없음, 접근 실패)
+    """
+    command = [FFMPEG, '-v', 'error', '-nostdin', *ffmpeg_input_args(source, headers)]
+    if max_seconds:
+        command += ['-t', f'{max_seconds:.2f}']
+    command += ['-vn', '-ac', '1', '-ar', str(AUDIO_SAMPLE_RATE), '-f', 's16le', '-']
+
+    block_bytes = int(block_seconds * AUDIO_SAMPLE_RATE) * 2
+    process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    if processes is not None:
+        processes.add(process)
+    received = 0
+    try:
+        while True:
+            data = process.stdout.read(block_bytes)
+            if not data:
+                break
+            received += len(data)
+            yield np.frombuffer(data[:len(data) // 2 * 2], dtype=np.int16).astype(np.float32) / 32768
+        process.wait()
+        if received == 0:
+            error = ' / '.join(process.stderr.read().decode(errors='replace').split('\n')).strip(' /')
+            raise RuntimeError(f"오디오 스트림 없음: {error[:200] or process.returncode}")
+    finally:
+        if processes is not None:
+            processes.discard(process)
+        if process.poll() is None:
+            process.kill()
+            process.wait()
+        process.stdout.close()
+        process.stderr.close()
+
+def _read_frames_cv2(path: str, times: List[float], max_width: int) -> List[Optional[np.ndarray]]:
+    """ffmpeg가 없을 때 - 로컬 파일에서 OpenCV로 같은 시점 읽기"""
+    import cv2
+
+    frames = []
+    cap = cv2.VideoCapture(path)
+    try:
+        for seconds in times:
+            cap.set(cv2.CAP_PROP_POS_MSEC, seconds * 1000)
+            ret, frame = cap.read()
+            if not ret:
+                frames.append(None)
+                continue
+            frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+            if frame.shape[1] > max_width:
+                height = max(1, frame.shape[0] * max_width // frame.shape[1])
+                frame = cv2.resize(frame, (max_width, height), interpolation=cv2.INTER_AREA)
+            frames.append(frame)
+    finally:
+        cap.release()
+    return frames
+
+# ===========================
+# 샘플러
+# ===========================
+
+class VideoFrameSampler:
+    """영상 URL → 중복 제거된 키프레임 목록"""
+
+    def __init__(self, media_cache: Optional[MediaCache] = None, frames: int = FRAMES_PER_VIDEO,
+                 max_width: int = MAX_IMAGE_WIDTH):
+        """
+        Args:
+            media_cache: 이미 받은 영상은 로컬 파일에서 읽음 (ffmpeg가 없을 때는 여기로 다운로드)
+            frames: 영상당 샘플링 시점 수
+        """
+        self.media_cache = media_cache
+        self.frames = frames
+        self.max_width = max_width
+        self.use_ffmpeg = shutil.which(FFMPEG) is not None and shutil.which(FFPROBE) is not None
+        if not self.use_ffmpeg:
+            logger.warning("ffmpeg/ffprobe가 없어 영상을 전체 다운로드해 OpenCV로 프레임을 읽습니다")
+        self.stats = {'videos': 0, 'failed': 0, 'frames_read': 0, 'frames_unique': 0,
+                      'local_files': 0, 'seconds': 0.0}
+
+    def _source(self, url: str) -> str:
+        if self.media_cache is not None and self.media_cache.contains(url):
+            self.stats['local_files'] += 1
+            return str(self.media_cache.get_path(url))
+        return url
+
+    def _read_frames(self, url: str) -> Tuple[List[float], List[Optional[np.ndarray]]]:
+        if not self.use_ffmpeg:
+            path = str((self.media_cache or MediaCache()).get_path(url))
+            times = sample_times(self._cv2_duration(path), self.frames)
+            return times, _read_frames_cv2(path, times, self.max_width)
+
+        source = self._source(url)
+        times = sample_times(probe_duration(source), self.frames)
+        with ThreadPoolExecutor(max_workers=len(times)) as executor:
+            frames = list(executor.map(lambda t: read_frame(source, t, self.max_width), times))
+        return times, frames
+
+    @staticmethod
+    def _cv2_duration(path: str) -> Optional[float]:
+        import cv2
+
+        cap = cv2.VideoCapture(path)
+        try:
+            fps = cap.get(cv2.CAP_PROP_FPS)
+            count = cap.get(cv2.CAP_PROP_FRAME_COUNT)
+            return count / fps if fps and count else None
+        finally:
+            cap.release()
+
+    def sample(self, url: str) -> List[Tuple[float, np.ndarray]]:
+        """시점 순서대로 (초, RGB 배열) - 거의 같은 프레임은 처음 것만
+
+        Raises:
+            requests.RequestException: ffmpeg가 없고 영상 다운로드도 실패한 경우
+        """
+        start = time.time()
+        self.stats['videos'] += 1
+        try:
+            times, frames = self._read_frames(url)
+        finally:
+            self.stats['seconds'] += time.time() - start
+
+        index = PHashIndex()
+        unique = []
+        for seconds, frame in zip(times, frames):
+            if frame is None:
+                continue
+            self.stats['frames_read'] += 1
+            phash, signature = image_fingerprint(Image.fromarray(frame).convert('L'))
+            if index.find_or_add(phash, signature, is_same=lambda other: signatures_match(signature, other)) is None:
+                unique.append((seconds, frame))
+        if not unique:
+            self.stats['failed'] += 1
+        self.stats['frames_unique'] += len(unique)
+        return unique
+
+    def get_stats(self) -> Dict:
+        return {
+            **self.stats,
+            'seconds': round(self.stats['seconds'], 1),
+            'seconds_per_video': round(self.stats['seconds'] / max(self.stats['videos'], 1), 2),
+            'method': 'ffmpeg (입력 탐색)' if self.use_ffmpeg else 'OpenCV (전체 다운로드)',
+        }
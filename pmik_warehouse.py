@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+PMIK SNS 분석 로컬 웨어하우스 (SQLite)
+
+타임스탬프별 CSV를 파일 단위로 모아 중복 제거하던 방식 대신,
+모든 플랫폼의 수집 결과를 하나의 내장 DB에 upsert한다.
+PostgreSQL 도입 전까지 같은 스키마로 사용 (DATABASE_SELECTION_GUIDE.md 참고).
+
+테이블:
+- naver_blog_posts: naver_blog/config.yaml output.columns (+ keyword)
+- youtube_videos: youtube/youtube_columns_schema.csv (+ 크롤러 추가 컬럼)
+- media_assets: 게시물별 이미지/비디오 URL (step1_extract_urls.py)
+- ocr_results: 이미지/비디오 프레임 OCR, YouTube 자막, Whisper 결과
+- engagement_snapshots: 좋아요/댓글(/조회) 수 시계열
+- search_docs / search_fts: 본문, 자막, OCR 텍스트 전문 검색 색인 (pmik_search.py)
+
+사용법:
+    python pmik_warehouse.py import <테이블> <CSV 또는 Parquet 파일...>
+    python pmik_warehouse.py query "SELECT blog_id, COUNT(*) FROM naver_blog_posts GROUP BY 1"
+
+코드에서:
+    with Warehouse() as warehouse:
+        warehouse.upsert('naver_blog_posts', df)
+        top = warehouse.query("SELECT * FROM naver_blog_posts WHERE sponsor_partner_id = ?", ['12345678'])
+"""
+
+import csv
+import logging
+import math
+import sqlite3
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+import pandas as pd
+import yaml
+
+import pmik_storage
+from pmik_search import SearchIndex
+
+logger = logging.getLogger(__name__)
+
+REPO_ROOT = Path(__file__).resolve().parent
+WAREHOUSE_FILE = REPO_ROOT / 'data' / 'pmik_warehouse.sqlite3'
+NAVER_CONFIG_FILE = REPO_ROOT / 'naver_blog' / 'config.yaml'
+YOUTUBE_SCHEMA_FILE = REPO_ROOT / 'youtube' / 'youtube_columns_schema.csv'
+
+UPSERT_BATCH_SIZE = 1000
+
+# youtube_columns_schema.csv 데이터타입 → SQLite 타입
+CSV_TYPE_MAP = {'str': 'TEXT', 'int': 'INTEGER', 'float': 'REAL', 'bool': 'INTEGER'}
+
+# pmik_storage 스키마 dtype → SQLite 타입
+STORAGE_TYPE_MAP = {'Int64': 'INTEGER', 'boolean': 'INTEGER'}
+
+# ===========================
+# 스키마
+# ===========================
+
+def _naver_blog_columns() -> Dict[str, str]:
+    """config.yaml output.columns 순서, 타입은 pmik_storage 스키마 기준"""
+    with open(NAVER_CONFIG_FILE, 'r', encoding='utf-8') as f:
+        columns = yaml.safe_load(f)['output']['columns']
+    dtypes = pmik_storage.SCHEMAS['naver_blog']
+    return {column: STORAGE_TYPE_MAP.get(dtypes.get(column), 'TEXT') for column in columns + ['keyword']}
+
+def _youtube_columns() -> Dict[str, str]:
+    """youtube_columns_schema.csv + 크롤러가 추가로 기록하는 컬럼"""
+    columns = {}
+    with open(YOUTUBE_SCHEMA_FILE, 'r', encoding='utf-8-sig') as f:
+        for row in csv.DictReader(f):
+            columns[row['컬럼명']] = CSV_TYPE_MAP.get(row['데이터타입'], 'TEXT')
+    for column, dtype in pmik_storage.SCHEMAS['youtube'].items():
+        columns.setdefault(column, STORAGE_TYPE_MAP.get(dtype, 'TEXT'))
+    return columns
+
+def build_tables() -> Dict[str, Dict]:
+    """테이블 정의: 컬럼(이름 → 타입), 기본 키, 보조 인덱스"""
+    return {
+        'naver_blog_posts': {
+            'columns': _naver_blog_columns(),
+            'key': ['post_id'],
+            'indexes': [['blog_id'], ['sponsor_partner_id'], ['published_datetime']],
+        },
+        'youtube_videos': {
+            'columns': _youtube_columns(),
+            'key': ['video_id'],
+            'indexes': [['channel_id'], ['sponsor_partner_id'], ['published_datetime']],
+        },
+        'media_assets': {
+            'columns': {'post_id': 'INTEGER', 'url': 'TEXT', 'type': 'TEXT', 'youtube_video_id': 'TEXT'},
+            'key': ['post_id', 'url'],
+            'indexes': [['youtube_video_id']],
+        },
+        'ocr_results': {
+            'columns': {'source': 'TEXT', 'post_id': 'INTEGER', 'url': 'TEXT', 'video_id': 'TEXT',
+                        'text': 'TEXT', 'confidence': 'REAL', 'language': 'TEXT', 'status': 'TEXT'},
+            'key': ['source', 'url'],  # source: image / video_frame / youtube_transcript / whisper
+            'indexes': [['post_id'], ['video_id']],
+        },
+        'engagement_snapshots': {
+            'columns': {'platform': 'TEXT', 'post_id': 'TEXT', 'fetched_at': 'TEXT',
+                        'like_count': 'INTEGER', 'comment_count': 'INTEGER', 'view_count': 'INTEGER',
+                        'source': 'TEXT'},
+            'key': ['platform', 'post_id', 'fetched_at'],
+            'indexes': [['fetched_at']],
+        },
+    }
+
+# ===========================
+# 웨어하우스
+# ===========================
+
+def _to_sql_value(value):
+    """pandas/numpy 값을 SQLite 값으로 (결측치 → NULL, 날짜 → 'YYYY-MM-DD HH:MM:SS')"""
+    if value is None or value is pd.NA or value is pd.NaT:
+        return None
+    if isinstance(value, float) and math.isnan(value):
+        return None
+    if isinstance(value, (pd.Timestamp, datetime)):
+        return value.strftime('%Y-%m-%d %H:%M:%S')
+    if hasattr(value, 'item'):  # numpy 스칼라
+        return value.item()
+    return value
+
+class Warehouse:
+    """SQLite 웨어하우스 (upsert는 batch_size건씩 한 트랜잭션)"""
+
+    def __init__(self, path=WAREHOUSE_FILE):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(self.path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.tables = build_tables()
+        self._create_tables()
+        self.search = SearchIndex(self.conn)
+
+    def _create_tables(self):
+        with self.conn:
+            for table, spec in self.tables.items():
+                columns = ', '.join(f'"{name}" {dtype}' for name, dtype in spec['columns'].items())
+                key = ', '.join(spec['key'])
+                self.conn.execute(f'CREATE TABLE IF NOT EXISTS {table} ({columns}, PRIMARY KEY ({key}))')
+
+                # 스키마 파일에 새로 생긴 컬럼은 기존 테이블에 추가
+                existing = {row[1] for row in self.conn.execute(f'PRAGMA table_info({table})')}
+                for name, dtype in spec['columns'].items():
+                    if name not in existing:
+                        self.conn.execute(f'ALTER TABLE {table} ADD COLUMN "{name}" {dtype}')
+
+                for index_columns in spec['indexes']:
+                    index_name = f"idx_{table}_{'_'.join(index_columns)}"
+                    self.conn.execute(f'CREATE INDEX IF NOT EXISTS {index_name} '
+                                      f'ON {table} ({", ".join(index_columns)})')
+
+    def upsert(self, table: str, rows, batch_size: int = UPSERT_BATCH_SIZE) -> int:
+        """행 추가 또는 갱신 (기본 키가 같으면 전달된 컬럼만 덮어씀)
+
+        Args:
+            rows: DataFrame 또는 dict 목록 - 테이블에 없는 컬럼은 무시
+
+        Returns:
+            처리한 행 수
+        """
+        spec = self.tables[table]
+        if isinstance(rows, pd.DataFrame):
+            frame_columns = list(rows.columns)
+            rows = rows.to_dict('records')
+        else:
+            rows = list(rows)
+            frame_columns = list(dict.fromkeys(column for row in rows for column in row))
+        if not rows:
+            return 0
+
+        columns = [column for column in spec['columns'] if column in frame_columns]
+        missing_keys = [column for column in spec['key'] if column not in columns]
+        if missing_keys:
+            raise ValueError(f"{table}: 기본 키 컬럼 없음 {missing_keys}")
+
+        updates = [column for column in columns if column not in spec['key']]
+        quoted = ', '.join(f'"{column}"' for column in columns)
+        sql = (f'INSERT INTO {table} ({quoted}) VALUES ({", ".join("?" * len(columns))}) '
+               f'ON CONFLICT ({", ".join(spec["key"])}) ')
+        sql += ('DO UPDATE SET ' + ', '.join(f'"{column}" = excluded."{column}"' for column in updates)
+                if updates else 'DO NOTHING')
+
+        for start in range(0, len(rows), batch_size):
+            batch = [{column: _to_sql_value(row.get(column)) for column in columns}
+                     for row in rows[start:start + batch_size]]
+            with self.conn:
+                self.conn.executemany(sql, [list(row.values()) for row in batch])
+                # 텍스트 컬럼은 같은 트랜잭션에서 검색 색인도 갱신
+                self.search.index_rows(table, spec['key'], batch)
+        return len(rows)
+
+    def upsert_iter(self, table: str, rows: Iterable[Dict], batch_size: int = UPSERT_BATCH_SIZE) -> int:
+        """제너레이터 등 긴 입력을 batch_size건씩 나눠 upsert (메모리 일정)"""
+        total = 0
+        batch = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= batch_size:
+                total += self.upsert(table, batch, batch_size)
+                batch = []
+        if batch:
+            total += self.upsert(table, batch, batch_size)
+        return total
+
+    def query(self, sql: str, params: Optional[List] = None) -> pd.DataFrame:
+        return pd.read_sql_query(sql, self.conn, params=params)
+
+    def count(self, table: str) -> int:
+        return self.conn.execute(f'SELECT COUNT(*) FROM {table}').fetchone()[0]
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+# ===========================
+# CLI
+# ===========================
+
+def main():
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s [%(levelname)s] %(message)s')
+
+    if len(sys.argv) >= 4 and sys.argv[1] == 'import':
+        table = sys.argv[2]
+        with Warehouse() as warehouse:
+            for path in sys.argv[3:]:
+                df = pmik_storage.read_table(path)
+                rows = warehouse.upsert(table, df)
+                logger.info(f"📥 {path} → {table}: {rows:,}행 (전체 {warehouse.count(table):,}행)")
+    elif len(sys.argv) == 3 and sys.argv[1] == 'query':
+        with Warehouse() as warehouse:
+            print(warehouse.query(sys.argv[2]).to_string())
+    else:
+        print(__doc__)
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
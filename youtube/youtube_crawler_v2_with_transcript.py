@@ -21,6 +21,7 @@ import logging
 from datetime import datetime
 from typing import List, Dict, Optional
 import re
+import sys
 from pathlib import Path
 
 import pandas as pd
@@ -30,6 +31,11 @@ from dotenv import load_dotenv
 from youtube_transcript_api import YouTubeTranscriptApi
 from youtube_transcript_api._errors import TranscriptsDisabled, NoTranscriptFound
 
+# 공용 Parquet 저장소 (저장소 루트의 pmik_storage.py)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+import pmik_storage
+from pmik_warehouse import Warehouse
+
 # .env 파일 로드
 env_path = Path(__file__).parent / '.env'
 load_dotenv(dotenv_path=env_path)
@@ -370,6 +376,7 @@ def main():
             video['transcript_language'] = transcript_result['language']
             video['transcript_status'] = transcript_result['status']
             video['has_transcript'] = transcript_result['status'] == 'success'
+            video['keyword'] = keyword  # Parquet 파티션용
             
             if transcript_result['status'] == 'success':
                 transcript_success += 1
@@ -421,12 +428,20 @@ def main():
         'collected_date'
     ]
     
+    # Parquet 저장 (platform/keyword/수집일 파티션, 다음 단계는 필요한 컬럼만 읽음)
+    parquet_path = pmik_storage.write_dataset(df[column_order + ['keyword']], 'youtube_videos', 'youtube')
+    
+    # 웨어하우스 upsert (video_id 기준, 재수집 시 최신 값으로 갱신)
+    with Warehouse() as warehouse:
+        warehouse.upsert('youtube_videos', df[column_order + ['keyword']])
+    
     df = df[column_order]
     
     # 파일명 생성
     timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
     output_file = f'youtube/youtube_pm_v2_{timestamp}.csv'
     
+    # Excel용 CSV
     df.to_csv(output_file, index=False, encoding='utf-8-sig')
     
     elapsed_time = time.time() - start_time
@@ -455,6 +470,8 @@ def main():
     logger.info(f"  - 평균 속도: {elapsed_time/len(df):.2f}초/영상")
     
     logger.info(f"\n📁 저장 위치: {output_file}")
+    if parquet_path:
+        logger.info(f"📁 Parquet: {parquet_path}")
     
     # 자막 없는 영상 목록 저장
     no_transcript_df = df[~df['has_transcript']][['video_id', 'url', 'title', 'transcript_status']]
@@ -462,7 +479,7 @@ def main():
         no_transcript_file = f'youtube/youtube_no_transcript_{timestamp}.csv'
         no_transcript_df.to_csv(no_transcript_file, index=False, encoding='utf-8-sig')
         logger.info(f"\n📋 자막 없는 영상 목록: {no_transcript_file}")
-        logger.info(f"   → Google Colab Whisper로 처리 필요")
+        logger.info(f"   → Whisper로 처리 필요 (로컬 CPU: python pmik_transcribe.py {no_transcript_file})")
     
     # 상위 5개 영상 미리보기
     logger.info(f"\n{'='*70}")